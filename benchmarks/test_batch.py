@@ -0,0 +1,25 @@
+"""
+Benchmarks for solving a stack of games
+"""
+
+import numpy as np
+
+from nashpy.algorithms.batch import solve_batch
+from nashpy.algorithms.support_enumeration import support_enumeration
+
+
+def test_support_enumeration_on_a_thousand_three_by_three_games(benchmark):
+    A_stack = np.random.default_rng(0).random((1000, 3, 3))
+    B_stack = np.random.default_rng(1).random((1000, 3, 3))
+    benchmark(
+        lambda: [
+            tuple(support_enumeration(A, B, batched=True))
+            for A, B in zip(A_stack, B_stack)
+        ]
+    )
+
+
+def test_solve_batch_on_a_thousand_three_by_three_games(benchmark):
+    A_stack = np.random.default_rng(0).random((1000, 3, 3))
+    B_stack = np.random.default_rng(1).random((1000, 3, 3))
+    benchmark(solve_batch, A_stack, B_stack)
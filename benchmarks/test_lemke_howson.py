@@ -0,0 +1,123 @@
+"""
+Benchmarks for the Lemke Howson algorithm
+"""
+
+import numpy as np
+import scipy.sparse
+
+from nashpy.algorithms.lemke_howson import lemke_howson, warm_started_lemke_howson
+
+
+def test_lemke_howson_on_three_by_two_game(benchmark):
+    A = np.array(((3, 3), (2, 5), (0, 6)))
+    B = np.array(((3, 2), (2, 6), (3, 1)))
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_exact_lemke_howson_on_three_by_two_game(benchmark):
+    A = np.array(((3, 3), (2, 5), (0, 6)))
+    B = np.array(((3, 2), (2, 6), (3, 1)))
+    benchmark(lemke_howson, A, B, 0, exact=True)
+
+
+def test_lemke_howson_on_ten_by_ten_integer_game(benchmark):
+    A = np.random.default_rng(0).integers(-10, 10, (10, 10))
+    B = np.random.default_rng(1).integers(-10, 10, (10, 10))
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_exact_lemke_howson_on_ten_by_ten_integer_game(benchmark):
+    A = np.random.default_rng(0).integers(-10, 10, (10, 10))
+    B = np.random.default_rng(1).integers(-10, 10, (10, 10))
+    benchmark(lemke_howson, A, B, 0, exact=True)
+
+
+def test_lemke_howson_on_ten_by_ten_game(benchmark):
+    A = np.random.default_rng(0).random((10, 10))
+    B = np.random.default_rng(1).random((10, 10))
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_fraction_free_lemke_howson_on_ten_by_ten_integer_game(benchmark):
+    A = np.random.default_rng(0).integers(-10, 10, (10, 10))
+    B = np.random.default_rng(1).integers(-10, 10, (10, 10))
+    benchmark(lemke_howson, A, B, 0, fraction_free=True)
+
+
+def test_fraction_free_lemke_howson_on_thirty_by_thirty_integer_game(benchmark):
+    A = np.random.default_rng(0).integers(-100, 100, (30, 30))
+    B = np.random.default_rng(1).integers(-100, 100, (30, 30))
+    benchmark(lemke_howson, A, B, 0, fraction_free=True)
+
+
+def test_lemke_howson_on_perturbed_sixty_by_sixty_game(benchmark):
+    rng = np.random.default_rng(0)
+    A = rng.random((60, 60))
+    B = rng.random((60, 60))
+    A = A + rng.normal(0, 10**-4, A.shape)
+    B = B + rng.normal(0, 10**-4, B.shape)
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_warm_started_lemke_howson_on_perturbed_sixty_by_sixty_game(benchmark):
+    rng = np.random.default_rng(0)
+    A = rng.random((60, 60))
+    B = rng.random((60, 60))
+    basis = warm_started_lemke_howson(A, B).basis
+    A = A + rng.normal(0, 10**-4, A.shape)
+    B = B + rng.normal(0, 10**-4, B.shape)
+    benchmark(warm_started_lemke_howson, A, B, basis=basis)
+
+
+def sparse_game(size, density, seed):
+    """Return a game whose payoffs are mostly zeros"""
+    rng = np.random.default_rng(seed)
+    A = scipy.sparse.random(size, size, density=density, random_state=rng)
+    B = scipy.sparse.random(size, size, density=density, random_state=rng)
+    return A.toarray() + np.eye(size), B.toarray() + np.eye(size)[::-1]
+
+
+def test_lemke_howson_on_sparse_four_hundred_by_four_hundred_game(benchmark):
+    A, B = sparse_game(400, 0.02, 0)
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_sparse_lemke_howson_on_sparse_four_hundred_by_four_hundred_game(benchmark):
+    A, B = sparse_game(400, 0.02, 0)
+    benchmark(lemke_howson, A, B, 0, backend="sparse")
+
+
+def permuted_sparse_game(size, density, seed):
+    """Return a sparse game whose best responses to the pure strategies are
+    scattered rather than on the diagonal so that the path takes more pivots"""
+    rng = np.random.default_rng(seed)
+    A = scipy.sparse.random(size, size, density=density, random_state=rng)
+    B = scipy.sparse.random(size, size, density=density, random_state=rng)
+    A, B = A.toarray(), B.toarray()
+    A[rng.permutation(size), np.arange(size)] += 10**-3
+    B[np.arange(size), rng.permutation(size)] += 10**-3
+    return A, B
+
+
+def test_lemke_howson_on_sparse_thousand_by_thousand_game(benchmark):
+    A, B = permuted_sparse_game(1000, 0.004, 0)
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_sparse_lemke_howson_on_sparse_thousand_by_thousand_game(benchmark):
+    A, B = permuted_sparse_game(1000, 0.004, 0)
+    benchmark(lemke_howson, A, B, 0, backend="sparse")
+
+
+def test_lemke_howson_on_degenerate_forty_by_forty_game(benchmark):
+    A = np.random.default_rng(0).integers(0, 3, (40, 40))
+    B = np.random.default_rng(1).integers(0, 3, (40, 40))
+    benchmark(lemke_howson, A, B, 0)
+
+
+def test_non_lexicographic_lemke_howson_on_degenerate_forty_by_forty_game(
+    benchmark,
+):
+    A = np.random.default_rng(0).integers(0, 3, (40, 40))
+    B = np.random.default_rng(1).integers(0, 3, (40, 40))
+    benchmark(lemke_howson, A, B, 0, lexicographic=False)
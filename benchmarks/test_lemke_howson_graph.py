@@ -0,0 +1,27 @@
+"""
+Benchmarks for the traversal of the graph of equilibria of the Lemke Howson
+algorithm
+"""
+
+import numpy as np
+
+from nashpy.algorithms.batch import stacked_support_enumeration
+from nashpy.algorithms.lemke_howson_graph import lemke_howson_graph_enumeration
+
+
+def test_lemke_howson_graph_enumeration_on_ten_by_ten_game(benchmark):
+    A = np.random.default_rng(0).random((10, 10))
+    B = np.random.default_rng(1).random((10, 10))
+    benchmark(lambda: list(lemke_howson_graph_enumeration(A, B)))
+
+
+def test_support_enumeration_on_ten_by_ten_game(benchmark):
+    A = np.random.default_rng(0).random((10, 10))
+    B = np.random.default_rng(1).random((10, 10))
+    benchmark(stacked_support_enumeration, A[np.newaxis], B[np.newaxis])
+
+
+def test_lemke_howson_graph_enumeration_on_fifteen_by_fifteen_game(benchmark):
+    A = np.random.default_rng(0).random((15, 15))
+    B = np.random.default_rng(1).random((15, 15))
+    benchmark(lambda: list(lemke_howson_graph_enumeration(A, B)))
@@ -0,0 +1,27 @@
+"""
+Benchmarks for solving zero sum games with linear programming
+"""
+
+import numpy as np
+
+from nashpy.linalg.minimax import ZeroSumSolver, linear_program
+
+
+def drifting_games(number_of_games=100, size=20):
+    """Return a sequence of games whose payoffs change slowly"""
+    rng = np.random.default_rng(0)
+    A = rng.random((size, size))
+    return [
+        A + step * 10**-3 * rng.random((size, size)) for step in range(number_of_games)
+    ]
+
+
+def test_linear_program_on_a_hundred_drifting_games(benchmark):
+    games = drifting_games()
+    benchmark(lambda: [linear_program(row_player_payoff_matrix=A) for A in games])
+
+
+def test_zero_sum_solver_on_a_hundred_drifting_games(benchmark):
+    games = drifting_games()
+    solver = ZeroSumSolver()
+    benchmark(lambda: [solver.solve(A) for A in games])
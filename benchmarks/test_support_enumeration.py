@@ -32,3 +32,69 @@ def test_support_enumeration_on_four_by_four_game(benchmark):
     )
     eqs = support_enumeration(A, -A)
     benchmark(tuple, eqs)
+
+
+def test_batched_support_enumeration_on_four_by_four_game(benchmark):
+    A = np.array(
+        (
+            (0, 1, -1, 1 / 4),
+            (-1, 0, 1, 1 / 4),
+            (1, -1, 0, 1 / 4),
+            (1 / 4, 1 / 4, 1 / 4, 1 / 4),
+        )
+    )
+    eqs = support_enumeration(A, -A, batched=True)
+    benchmark(tuple, eqs)
+
+
+def test_support_enumeration_on_eight_by_eight_game(benchmark):
+    A = np.random.default_rng(0).random((8, 8))
+    B = np.random.default_rng(1).random((8, 8))
+    eqs = support_enumeration(A, B)
+    benchmark(tuple, eqs)
+
+
+def test_non_degenerate_support_enumeration_on_eight_by_eight_game(benchmark):
+    A = np.random.default_rng(0).random((8, 8))
+    B = np.random.default_rng(1).random((8, 8))
+    benchmark(lambda: tuple(support_enumeration(A, B, non_degenerate=True)))
+
+
+def test_batched_support_enumeration_on_eight_by_eight_game(benchmark):
+    A = np.random.default_rng(0).random((8, 8))
+    B = np.random.default_rng(1).random((8, 8))
+    eqs = support_enumeration(A, B, batched=True)
+    benchmark(tuple, eqs)
+
+
+def test_incremental_support_enumeration_on_eight_by_eight_game(benchmark):
+    A = np.random.default_rng(0).random((8, 8))
+    B = np.random.default_rng(1).random((8, 8))
+    benchmark(lambda: tuple(support_enumeration(A, B, incremental=True)))
+
+
+def test_exact_support_enumeration_on_four_by_four_game(benchmark):
+    A = np.array(
+        (
+            (0, 1, -1, 1 / 4),
+            (-1, 0, 1, 1 / 4),
+            (1, -1, 0, 1 / 4),
+            (1 / 4, 1 / 4, 1 / 4, 1 / 4),
+        )
+    )
+    eqs = support_enumeration(A, -A, exact=True)
+    benchmark(tuple, eqs)
+
+
+def test_support_enumeration_on_eight_by_eight_integer_game(benchmark):
+    A = np.random.default_rng(0).integers(-10, 10, (8, 8))
+    B = np.random.default_rng(1).integers(-10, 10, (8, 8))
+    eqs = support_enumeration(A, B)
+    benchmark(tuple, eqs)
+
+
+def test_exact_support_enumeration_on_eight_by_eight_integer_game(benchmark):
+    A = np.random.default_rng(0).integers(-10, 10, (8, 8))
+    B = np.random.default_rng(1).integers(-10, 10, (8, 8))
+    eqs = support_enumeration(A, B, exact=True)
+    benchmark(tuple, eqs)
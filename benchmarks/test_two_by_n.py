@@ -0,0 +1,29 @@
+"""
+Benchmarks for the closed form equilibria of games in which a player has two
+strategies
+"""
+
+import numpy as np
+
+import nashpy as nash
+from nashpy.algorithms.support_enumeration import support_enumeration
+
+
+def test_support_enumeration_on_two_by_ten_game(benchmark):
+    A = np.random.default_rng(0).random((2, 10))
+    B = np.random.default_rng(1).random((2, 10))
+    benchmark(lambda: tuple(support_enumeration(A, B)))
+
+
+def test_closed_form_support_enumeration_on_two_by_ten_game(benchmark):
+    A = np.random.default_rng(0).random((2, 10))
+    B = np.random.default_rng(1).random((2, 10))
+    game = nash.Game(A, B)
+    benchmark(lambda: tuple(game.support_enumeration()))
+
+
+def test_closed_form_support_enumeration_on_thousand_by_two_game(benchmark):
+    A = np.random.default_rng(0).random((1000, 2))
+    B = np.random.default_rng(1).random((1000, 2))
+    game = nash.Game(A, B)
+    benchmark(lambda: tuple(game.support_enumeration()))
@@ -0,0 +1,73 @@
+"""
+Benchmarks for the enumeration of the vertices of best response polytopes
+"""
+
+import numpy as np
+
+from nashpy.algorithms.vertex_enumeration import vertex_enumeration
+from nashpy.polytope import (
+    analytic_feasible_point,
+    build_halfspaces,
+    find_feasible_point,
+    label_matrix,
+    labels,
+    non_trivial_vertex_array,
+    non_trivial_vertices,
+    reverse_search_vertices,
+)
+
+
+def test_qhull_vertices_of_eight_by_eight_integer_polytope(benchmark):
+    halfspaces = build_halfspaces(np.random.default_rng(0).integers(0, 10, (8, 8)))
+    benchmark(lambda: list(non_trivial_vertices(halfspaces)))
+
+
+def test_reverse_search_vertices_of_eight_by_eight_integer_polytope(benchmark):
+    halfspaces = build_halfspaces(np.random.default_rng(0).integers(0, 10, (8, 8)))
+    benchmark(lambda: list(reverse_search_vertices(halfspaces)))
+
+
+def test_vertex_enumeration_on_ten_by_ten_game(benchmark):
+    A = np.random.default_rng(0).random((10, 10))
+    B = np.random.default_rng(1).random((10, 10))
+    benchmark(lambda: list(vertex_enumeration(A, B)))
+
+
+def test_repeated_vertex_enumeration_on_eight_by_eight_game(benchmark):
+    A = np.random.default_rng(0).random((8, 8))
+    B = np.random.default_rng(1).random((8, 8))
+    benchmark(lambda: list(vertex_enumeration(A, B)))
+
+
+def test_repeated_vertex_enumeration_on_eight_by_eight_game_with_cache(benchmark):
+    A = np.random.default_rng(0).random((8, 8))
+    B = np.random.default_rng(1).random((8, 8))
+    benchmark(lambda: list(vertex_enumeration(A, B, use_cache=True)))
+
+
+def test_labels_of_vertices_of_ten_by_ten_polytope(benchmark):
+    halfspaces = build_halfspaces(np.random.default_rng(0).random((10, 10)))
+    vertices, _ = non_trivial_vertex_array(halfspaces)
+    benchmark(lambda: [labels(vertex, halfspaces) for vertex in vertices])
+
+
+def test_label_matrix_of_vertices_of_ten_by_ten_polytope(benchmark):
+    halfspaces = build_halfspaces(np.random.default_rng(0).random((10, 10)))
+    vertices, _ = non_trivial_vertex_array(halfspaces)
+    benchmark(lambda: label_matrix(vertices, halfspaces))
+
+
+def test_linear_program_feasible_point_of_four_by_four_polytope(benchmark):
+    halfspaces = build_halfspaces(np.random.default_rng(0).random((4, 4)))
+    benchmark(lambda: find_feasible_point(halfspaces))
+
+
+def test_analytic_feasible_point_of_four_by_four_polytope(benchmark):
+    halfspaces = build_halfspaces(np.random.default_rng(0).random((4, 4)))
+    benchmark(lambda: analytic_feasible_point(halfspaces))
+
+
+def test_vertex_enumeration_on_four_by_four_game(benchmark):
+    A = np.random.default_rng(0).random((4, 4))
+    B = np.random.default_rng(1).random((4, 4))
+    benchmark(lambda: list(vertex_enumeration(A, B)))
@@ -1,5 +1,6 @@
 """A library with algorithms on 2 player games."""
 
 from .game import Game
+from .algorithms.batch import solve_batch
 
 __version__ = "0.0.43"
@@ -0,0 +1,187 @@
+"""Functions to obtain the equilibria of a stack of games at once"""
+
+from itertools import combinations
+
+import numpy as np
+import numpy.typing as npt
+
+from .lemke_howson import lemke_howson
+from .support_enumeration import (
+    is_ne_batch,
+    obey_support_batch,
+    solve_indifference_batch,
+)
+from .vertex_enumeration import vertex_enumeration
+
+
+def equilibria_dtype(number_of_rows: int, number_of_columns: int) -> np.dtype:
+    """
+    Return the structured dtype of the equilibria of a stack of games.
+
+    Parameters
+    ----------
+    number_of_rows : int
+        The number of strategies of the row player.
+    number_of_columns : int
+        The number of strategies of the column player.
+
+    Returns
+    -------
+    dtype
+        A dtype with fields "game" (the index of the game in the stack),
+        "row_strategy" and "column_strategy".
+    """
+    return np.dtype(
+        [
+            ("game", np.int64),
+            ("row_strategy", np.float64, (number_of_rows,)),
+            ("column_strategy", np.float64, (number_of_columns,)),
+        ]
+    )
+
+
+def stacked_support_enumeration(
+    A_stack: npt.NDArray,
+    B_stack: npt.NDArray,
+    tol: float = 10**-16,
+    batch_size: int = 2**14,
+) -> npt.NDArray:
+    """
+    Obtain the equilibria of a stack of games by solving the indifference
+    equations of all support pairs of a given size of all games at once.
+
+    Parameters
+    ----------
+    A_stack : array
+        A (g, m, n) array of row player utility matrices.
+    B_stack : array
+        A (g, m, n) array of column player utility matrices.
+    tol : float
+        A tolerance parameter for equality.
+    batch_size : int
+        The maximum number of systems of indifference equations solved in a
+        single call.
+
+    Returns
+    -------
+    array
+        A structured array (see `equilibria_dtype`) ordered by game and, for
+        each game, in the order of `batched_equilibria`.
+    """
+    number_of_games, number_of_rows, number_of_columns = A_stack.shape
+    BT_stack = B_stack.transpose(0, 2, 1)
+    blocks = []
+    for size in range(1, min(number_of_rows, number_of_columns) + 1):
+        row_supports = np.array(list(combinations(range(number_of_rows), size)))
+        column_supports = np.array(list(combinations(range(number_of_columns), size)))
+        pairs_per_game = len(row_supports) * len(column_supports)
+        number_of_systems = number_of_games * pairs_per_game
+        for start in range(0, number_of_systems, batch_size):
+            indices = np.arange(start, min(start + batch_size, number_of_systems))
+            games, pairs = np.divmod(indices, pairs_per_game)
+            rows = row_supports[pairs // len(column_supports)]
+            columns = column_supports[pairs % len(column_supports)]
+
+            s1, valid_s1 = solve_indifference_batch(BT_stack, columns, rows, games)
+            s2, valid_s2 = solve_indifference_batch(A_stack, rows, columns, games)
+
+            row_masks = np.zeros(s1.shape, dtype=bool)
+            np.put_along_axis(row_masks, rows, True, axis=1)
+            column_masks = np.zeros(s2.shape, dtype=bool)
+            np.put_along_axis(column_masks, columns, True, axis=1)
+
+            valid = valid_s1 & valid_s2
+            valid &= obey_support_batch(s1, row_masks, tol=tol)
+            valid &= obey_support_batch(s2, column_masks, tol=tol)
+            valid[valid] = is_ne_batch(
+                (s1[valid], s2[valid]),
+                (row_masks[valid], column_masks[valid]),
+                (A_stack, B_stack),
+                games=games[valid],
+            )
+
+            block = np.empty(
+                np.count_nonzero(valid),
+                dtype=equilibria_dtype(number_of_rows, number_of_columns),
+            )
+            block["game"] = games[valid]
+            block["row_strategy"] = s1[valid]
+            block["column_strategy"] = s2[valid]
+            blocks.append(block)
+
+    equilibria = np.concatenate(
+        blocks
+        or [np.empty(0, dtype=equilibria_dtype(number_of_rows, number_of_columns))]
+    )
+    return equilibria[np.argsort(equilibria["game"], kind="stable")]
+
+
+def solve_batch(
+    A_stack: npt.NDArray,
+    B_stack: npt.NDArray,
+    method: str = "support_enumeration",
+    tol: float = 10**-16,
+    batch_size: int = 2**14,
+) -> npt.NDArray:
+    """
+    Obtain the Nash equilibria of a stack of games of the same size.
+
+    With support enumeration the indifference equations of all games are
+    solved with stacked linear algebra which removes the overhead of solving
+    each game in turn. This is well suited to many small games.
+
+    Parameters
+    ----------
+    A_stack : array
+        A (g, m, n) array of row player utility matrices.
+    B_stack : array
+        A (g, m, n) array of column player utility matrices.
+    method : str
+        The algorithm to use: one of "support_enumeration" (all equilibria,
+        see `batched_equilibria`), "vertex_enumeration" (all equilibria) or
+        "lemke_howson" (one equilibrium per game, with initial dropped label
+        0). Only support enumeration is vectorised across games.
+    tol : float
+        A tolerance parameter for equality with support enumeration.
+    batch_size : int
+        The maximum number of systems of indifference equations solved in a
+        single call with support enumeration.
+
+    Returns
+    -------
+    array
+        A structured array with fields "game" (the index of the game in the
+        stack), "row_strategy" and "column_strategy" with one entry per
+        equilibrium, ordered by game.
+
+    Raises
+    ------
+    ValueError
+        If the stacks do not have the same shape (g, m, n) or if the method
+        is not known.
+    """
+    A_stack, B_stack = np.asarray(A_stack), np.asarray(B_stack)
+    if A_stack.ndim != 3 or A_stack.shape != B_stack.shape:
+        raise ValueError("A_stack and B_stack must be of the same shape (g, m, n).")
+    if method == "support_enumeration":
+        return stacked_support_enumeration(
+            A_stack, B_stack, tol=tol, batch_size=batch_size
+        )
+
+    if method == "vertex_enumeration":
+        equilibria = [
+            (game, s1, s2)
+            for game, (A, B) in enumerate(zip(A_stack, B_stack))
+            for s1, s2 in vertex_enumeration(A, B)
+        ]
+    elif method == "lemke_howson":
+        equilibria = [
+            (game, *lemke_howson(A, B))
+            for game, (A, B) in enumerate(zip(A_stack, B_stack))
+        ]
+    else:
+        raise ValueError(
+            "method must be one of lemke_howson, support_enumeration or "
+            "vertex_enumeration."
+        )
+    return np.array(equilibria, dtype=equilibria_dtype(*A_stack.shape[1:]))
@@ -0,0 +1,152 @@
+"""Functions to obtain some of the equilibria within a count or time budget"""
+
+import time
+
+import numpy.typing as npt
+from typing import Any, Generator, List, NamedTuple, Optional, Tuple
+
+from .support_enumeration import (
+    is_ne,
+    obey_support,
+    potential_support_pairs,
+    solve_indifference,
+    warn_if_even,
+)
+
+
+class EquilibriaResult(NamedTuple):
+    """
+    The equilibria obtained by a bounded enumeration.
+
+    Attributes
+    ----------
+    equilibria : list
+        The equilibria in the order in which they were obtained.
+    complete : bool
+        Whether or not the enumeration ran to the end. If False, the count or
+        the time budget was reached and there may be further equilibria.
+    """
+
+    equilibria: List[Tuple[npt.NDArray, npt.NDArray]]
+    complete: bool
+
+
+def has_expired(deadline: Optional[float]) -> bool:
+    """
+    Check if a deadline has passed.
+
+    Parameters
+    ----------
+    deadline : Optional[float]
+        The deadline as a value of `time.perf_counter`. If None there is no
+        deadline.
+
+    Returns
+    -------
+    bool
+        If True it indicates that the deadline has passed.
+    """
+    return deadline is not None and time.perf_counter() >= deadline
+
+
+def timed_support_enumeration(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    deadline: Optional[float] = None,
+    non_degenerate: bool = False,
+    tol: float = 10**-16,
+) -> Generator[Tuple[Any, Any], Any, bool]:
+    """
+    Obtain the Nash equilibria using support enumeration, stopping once a
+    deadline has passed.
+
+    The support pairs are considered in the same order as
+    `support_enumeration` and the deadline is checked before the indifference
+    equations of each pair are solved.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    deadline : Optional[float]
+        The deadline as a value of `time.perf_counter`. If None there is no
+        deadline.
+    non_degenerate : bool
+        Whether or not to consider supports of equal size. By default
+        (False) only considers supports of equal size.
+    tol : float
+        A tolerance parameter for equality.
+
+    Yields
+    -------
+    Generator
+        The equilibria. The return value of the generator is whether or not
+        all the support pairs were considered.
+    """
+    if non_degenerate:
+        tol = min(tol, 0)
+
+    count = 0
+    for pair in potential_support_pairs(A, B, non_degenerate=non_degenerate):
+        if has_expired(deadline):
+            return False
+        s1 = solve_indifference(B.T, *(pair[::-1]))
+        s2 = solve_indifference(A, *pair)
+        if (
+            obey_support(s1, pair[0], tol=tol)
+            and obey_support(s2, pair[1], tol=tol)
+            and is_ne((s1, s2), pair, (A, B))
+        ):
+            count += 1
+            yield s1, s2
+    warn_if_even(count)
+    return True
+
+
+def bounded_enumeration(
+    equilibria: Generator[Tuple[npt.NDArray, npt.NDArray], Any, Any],
+    max_equilibria: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> EquilibriaResult:
+    """
+    Collect the equilibria of a generator until it is exhausted, a number of
+    equilibria is reached or a deadline has passed.
+
+    The deadline is checked each time the generator yields. The generator is
+    closed before returning so that any pool it holds is released and no
+    warning about the final count of equilibria is issued for a partial
+    enumeration.
+
+    Parameters
+    ----------
+    equilibria : Generator
+        The equilibria. If the generator returns False it indicates that it
+        stopped before the end of the enumeration.
+    max_equilibria : Optional[int]
+        The maximum number of equilibria to obtain. If None there is no
+        maximum.
+    deadline : Optional[float]
+        The deadline as a value of `time.perf_counter`. If None there is no
+        deadline.
+
+    Returns
+    -------
+    EquilibriaResult
+        The equilibria and whether or not the enumeration was complete.
+    """
+    found: List[Tuple[npt.NDArray, npt.NDArray]] = []
+    complete = False
+    try:
+        while max_equilibria is None or len(found) < max_equilibria:
+            if has_expired(deadline):
+                break
+            try:
+                found.append(next(equilibria))
+            except StopIteration as stop:
+                complete = stop.value is not False
+                break
+    finally:
+        equilibria.close()
+    return EquilibriaResult(equilibria=found, complete=complete)
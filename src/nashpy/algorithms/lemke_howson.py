@@ -1,11 +1,22 @@
 """A class for the Lemke Howson algorithm"""
 
+import time
 import warnings
 from itertools import cycle
 
+import numpy as np
 import numpy.typing as npt
-from typing import Tuple
-from nashpy.linalg import create_col_tableau, create_row_tableau
+from typing import FrozenSet, List, NamedTuple, Optional, Set, Tuple
+from nashpy.linalg import (
+    Tableau,
+    create_col_tableau,
+    create_covering_tableau,
+    create_row_tableau,
+)
+from nashpy.utils.dominance import (
+    expand_strategy,
+    iterated_elimination_of_dominated_strategies,
+)
 
 
 def lemke_howson(
@@ -13,6 +24,11 @@ def lemke_howson(
     B: npt.NDArray,
     initial_dropped_label: int = 0,
     lexicographic: bool = True,
+    eliminate_dominated: bool = False,
+    exact: bool = False,
+    fraction_free: bool = False,
+    max_pivots: Optional[int] = None,
+    backend: str = "dense",
 ) -> Tuple[npt.NDArray, npt.NDArray]:
     """
     Obtain the Nash equilibria using the Lemke Howson algorithm implemented
@@ -40,36 +56,738 @@ def lemke_howson(
     lexicographic: bool
         Whether to apply lexicographic sorting during pivoting, default True.
         Lexiographic sorting ensures solutions on degenerate games
+    eliminate_dominated: bool
+        Whether or not to iteratively remove strictly dominated strategies
+        (by pure or mixed strategies) before pivoting. The equilibria is
+        returned in terms of the original strategies and the initial
+        dropped label must correspond to a strategy that is not dominated.
+    exact: bool
+        Whether or not to pivot exactly on integer tableaux using fraction
+        free pivoting. The payoffs can be integers, fractions or floats
+        (which are converted exactly) and the equilibria are arrays of
+        fractions.
+    fraction_free: bool
+        Whether or not to pivot on integer tableaux using fraction free
+        pivoting: each pivot divides by the previous pivot element so that
+        the entries remain bounded. The entries are int64 and Python
+        integers are only used once they could overflow. The ratio tests
+        are exact and the equilibria are arrays of floats. This is suited
+        to large integer games for which the entries of the default floating
+        point tableaux grow without bound and overflow.
+    max_pivots: Optional[int]
+        The maximum number of pivots. If None (default) there is no maximum.
+        If the maximum is reached or if the path cycles (see
+        `follow_lemke_howson_path`), a warning is issued and the strategies
+        are arrays of nan. See `lemke_howson_with_diagnostics` for the
+        number of pivots, the dropped labels and the elapsed time.
+    backend: str
+        The storage of the tableaux: "dense" (default) arrays or "sparse"
+        scipy matrices (see `SparseTableau`). The sparse backend only
+        supports floating point pivoting and is suited to large games with
+        mostly zero payoffs, which can then also be given as scipy sparse
+        matrices.
 
     Returns
     -------
     Tuple
         An equilibria
+
+    Raises
+    ------
+    ValueError
+        If the initial dropped label corresponds to a dominated strategy or
+        if the backend is not known or is sparse with exact or fraction free
+        pivoting.
+    """
+    result = lemke_howson_with_diagnostics(
+        A,
+        B,
+        initial_dropped_label=initial_dropped_label,
+        lexicographic=lexicographic,
+        eliminate_dominated=eliminate_dominated,
+        exact=exact,
+        fraction_free=fraction_free,
+        max_pivots=max_pivots,
+        backend=backend,
+    )
+    warn_if_stopped(result.status, result.pivots)
+    return result.row_strategy, result.column_strategy
+
+
+def warn_if_stopped(status: str, pivots: int) -> None:
+    """
+    Issue a warning if a Lemke Howson path stopped before reaching an
+    equilibrium.
+
+    Parameters
+    ----------
+    status : str
+        The status of the path (see `follow_lemke_howson_path`).
+    pivots : int
+        The number of pivots carried out.
+    """
+    if status == "max_pivots":
+        warnings.warn(
+            f"The Lemke Howson algorithm reached the maximum of {pivots} "
+            "pivots without finding an equilibrium.",
+            RuntimeWarning,
+        )
+    elif status == "cycle":
+        warnings.warn(
+            f"The Lemke Howson algorithm cycled after {pivots} pivots. Your "
+            "game could be degenerate: use lexicographic pivoting.",
+            RuntimeWarning,
+        )
+
+
+def tableaux_to_strategies(
+    row_tableau: Tableau, col_tableau: Tableau, shape: Tuple[int, ...]
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    """
+    Obtain the strategies corresponding to a pair of fully labeled
+    tableaux.
+
+    Parameters
+    ----------
+    row_tableau : Tableau
+        The row player tableau.
+    col_tableau : Tableau
+        The column player tableau.
+    shape : Tuple
+        The shape of the payoff matrices.
+
+    Returns
+    -------
+    Tuple
+        An equilibria
+    """
+    row_strat = row_tableau.to_strategy(col_tableau.non_basic_variables)
+    col_strat = col_tableau.to_strategy(row_tableau.non_basic_variables)
+    if row_strat.shape != (shape[0],) or col_strat.shape != (shape[1],):
+        msg = """The Lemke Howson algorithm has returned probability vectors of·
+incorrect shapes. This indicates an error. Your game could be degenerate."""
+
+        warnings.warn(msg, RuntimeWarning)
+    return row_strat, col_strat
+
+
+def follow_lemke_howson_path(
+    row_tableau: Tableau,
+    col_tableau: Tableau,
+    initial_dropped_label: int,
+    max_pivots: Optional[int] = None,
+) -> Tuple[List[int], str]:
     """
-    col_tableau = create_col_tableau(A, lexicographic)
-    row_tableau = create_row_tableau(B, lexicographic)
+    Pivot a pair of fully labeled tableaux along the path obtained by
+    dropping a label until they are fully labeled again.
+
+    The tableaux can correspond to the artificial equilibrium or to any
+    equilibrium reached by a previous path.
+
+    The pivots stop early if the number of pivots reaches a budget or if
+    the path cycles: the bases of both tableaux and the entering label
+    determine the rest of the path so their keys (see `Tableau.basis_key`)
+    are kept in a set and the path cycles as soon as one is repeated. This
+    can happen on degenerate games without lexicographic pivoting.
 
-    if initial_dropped_label in row_tableau.non_basic_variables:
+    Parameters
+    ----------
+    row_tableau : Tableau
+        The row player tableau.
+    col_tableau : Tableau
+        The column player tableau.
+    initial_dropped_label : int
+        The initial dropped label.
+    max_pivots : Optional[int]
+        The maximum number of pivots. If None there is no maximum.
+
+    Returns
+    -------
+    Tuple
+        The dropped labels in the order in which they were dropped and the
+        status of the path: "equilibrium" if the tableaux are fully
+        labeled, "max_pivots" if the budget was reached or "cycle" if the
+        path cycles.
+    """
+    if row_tableau.is_non_basic(initial_dropped_label):
         tableux = cycle((row_tableau, col_tableau))
     else:
         tableux = cycle((col_tableau, row_tableau))
 
-    full_labels = col_tableau.labels
+    # The number of tableaux in which each label is a basic label (a non
+    # basic variable) and the number of labels that are in neither.
+    times_labeled = [
+        int(row_tableau.is_non_basic(label)) + int(col_tableau.is_non_basic(label))
+        for label in range(len(col_tableau.labels))
+    ]
+    missing_labels = times_labeled.count(0)
     fully_labeled = False
     entering_label = initial_dropped_label
+    dropped_labels: List[int] = []
+    states: Set[Tuple[bytes, bytes, int]] = set()
     while not fully_labeled:
+        if max_pivots is not None and len(dropped_labels) >= max_pivots:
+            return dropped_labels, "max_pivots"
+        state = (row_tableau.basis_key, col_tableau.basis_key, entering_label)
+        if state in states:
+            return dropped_labels, "cycle"
+        states.add(state)
         tableau = next(tableux)
-        entering_label = tableau.pivot_and_drop_label(entering_label)
-        current_labels = col_tableau.non_basic_variables.union(
-            row_tableau.non_basic_variables
+        was_non_basic = tableau.is_non_basic(entering_label)
+        dropped_label = tableau.pivot_and_drop_label(entering_label)
+        if was_non_basic:
+            times_labeled[entering_label] -= 1
+            missing_labels += times_labeled[entering_label] == 0
+        times_labeled[dropped_label] += 1
+        missing_labels -= times_labeled[dropped_label] == 1
+        entering_label = dropped_label
+        dropped_labels.append(dropped_label)
+        fully_labeled = missing_labels == 0
+    return dropped_labels, "equilibrium"
+
+
+def follow_lemke_path(
+    tableau: Tableau, number_of_labels: int, max_pivots: Optional[int] = None
+) -> Tuple[List[int], str]:
+    """
+    Pivot a tableau of both polytopes (see `create_covering_tableau`) from
+    a complementary basis, in which each label is basic in exactly one
+    polytope, to a feasible complementary basis using Lemke's algorithm.
+
+    If the value of a basic variable is negative, the covering variable
+    enters the basis (see `Tableau.pivot_covering_variable`) and a label is
+    then basic in neither polytope. The variable of that label in the other
+    polytope than the one it was dropped from enters the basis in turn
+    until the covering variable is dropped.
+
+    As for `follow_lemke_howson_path`, the pivots stop early if the number
+    of pivots reaches a budget or if the path cycles. They also stop if the
+    entering variable can increase without bound (see `Tableau.can_enter`).
+
+    Parameters
+    ----------
+    tableau : Tableau
+        The tableau of both polytopes.
+    number_of_labels : int
+        The number of labels: the number of strategies of both players.
+    max_pivots : Optional[int]
+        The maximum number of pivots. If None there is no maximum.
+
+    Returns
+    -------
+    Tuple
+        The dropped labels in the order in which they were dropped and the
+        status of the path: "equilibrium" if a feasible complementary basis
+        is reached, "max_pivots" if the budget was reached, "cycle" if the
+        path cycles or "ray" if the entering variable is unbounded.
+    """
+    if tableau.is_feasible():
+        return [], "equilibrium"
+    covering_variable = 2 * number_of_labels
+    dropped = tableau.pivot_covering_variable(covering_variable)
+    dropped_labels = [dropped % number_of_labels]
+    states: Set[Tuple[bytes, int]] = set()
+    while True:
+        entering = (dropped + number_of_labels) % covering_variable
+        if max_pivots is not None and len(dropped_labels) >= max_pivots:
+            return dropped_labels, "max_pivots"
+        state = (tableau.basis_key, entering)
+        if state in states:
+            return dropped_labels, "cycle"
+        states.add(state)
+        if not tableau.can_enter(entering):
+            return dropped_labels, "ray"
+        dropped = tableau.pivot_and_drop_label(entering)
+        if dropped == covering_variable:
+            return dropped_labels, "equilibrium"
+        dropped_labels.append(dropped % number_of_labels)
+
+
+Basis = Tuple[FrozenSet[int], FrozenSet[int]]
+
+
+class LemkeHowsonResult(NamedTuple):
+    """
+    The result of a run of the Lemke Howson algorithm with its diagnostics.
+
+    Attributes
+    ----------
+    row_strategy : array
+        The strategy of the row player (nan if no equilibrium was reached).
+    column_strategy : array
+        The strategy of the column player (nan if no equilibrium was
+        reached).
+    basis : Basis
+        The basic variables of the row and of the column tableau at the
+        equilibrium, which can be used to warm start another run.
+    warm_started : bool
+        Whether or not the equilibrium was obtained from the given basis or
+        strategies. If False, the path from the artificial equilibrium was
+        followed.
+    pivots : int
+        The number of pivots carried out, including those to the given
+        basis.
+    dropped_labels : list
+        The labels dropped along the path that was followed.
+    elapsed_time : float
+        The time taken in seconds.
+    status : str
+        "equilibrium" if an equilibrium was reached, "max_pivots" if the
+        maximum number of pivots was reached or "cycle" if the path cycles.
+    """
+
+    row_strategy: npt.NDArray
+    column_strategy: npt.NDArray
+    basis: Basis
+    warm_started: bool
+    pivots: int
+    dropped_labels: List[int]
+    elapsed_time: float
+    status: str
+
+
+def strategies_basis(
+    row_strategy: npt.NDArray, column_strategy: npt.NDArray, tol: float = 10**-16
+) -> Basis:
+    """
+    Obtain the basis of the tableaux corresponding to a pair of strategies.
+
+    The basic variables of the row tableau are the strategies in the support
+    of the row player and the slack variables of the strategies of the
+    column player that are not in their support (with labels shifted by the
+    number of rows). The basic variables of the column tableau are defined
+    similarly.
+
+    Parameters
+    ----------
+    row_strategy : array
+        The strategy of the row player.
+    column_strategy : array
+        The strategy of the column player.
+    tol : float
+        A tolerance parameter: the probabilities larger than this are in the
+        support.
+
+    Returns
+    -------
+    Basis
+        The basic variables of the row and of the column tableau.
+
+    Raises
+    ------
+    ValueError
+        If the support of a strategy is empty.
+    """
+    number_of_rows = len(row_strategy)
+    in_row_support = np.asarray(row_strategy, dtype=float) > tol
+    in_column_support = np.asarray(column_strategy, dtype=float) > tol
+    if not np.any(in_row_support) or not np.any(in_column_support):
+        raise ValueError("The support of a strategy is empty.")
+    row_labels = np.arange(number_of_rows)
+    column_labels = np.arange(len(column_strategy)) + number_of_rows
+    return (
+        frozenset(
+            np.concatenate(
+                (row_labels[in_row_support], column_labels[~in_column_support])
+            ).tolist()
+        ),
+        frozenset(
+            np.concatenate(
+                (column_labels[in_column_support], row_labels[~in_row_support])
+            ).tolist()
+        ),
+    )
+
+
+def tableaux_to_result(
+    row_tableau: Tableau,
+    col_tableau: Tableau,
+    shape: Tuple[int, ...],
+    status: str,
+    warm_started: bool,
+    pivots: int,
+    dropped_labels: List[int],
+    start: float,
+) -> LemkeHowsonResult:
+    """
+    Obtain the result of a run of the Lemke Howson algorithm from the
+    tableaux it reached.
+
+    Parameters
+    ----------
+    row_tableau : Tableau
+        The row player tableau.
+    col_tableau : Tableau
+        The column player tableau.
+    shape : Tuple
+        The shape of the payoff matrices.
+    status : str
+        The status of the run (see `follow_lemke_howson_path`).
+    warm_started : bool
+        Whether or not the equilibrium was obtained from a given basis.
+    pivots : int
+        The number of pivots carried out.
+    dropped_labels : list
+        The labels dropped along the path that was followed.
+    start : float
+        The value of `time.perf_counter` at the start of the run.
+
+    Returns
+    -------
+    LemkeHowsonResult
+        The result of the run.
+    """
+    if status == "equilibrium":
+        row_strategy, column_strategy = tableaux_to_strategies(
+            row_tableau, col_tableau, shape
         )
-        fully_labeled = current_labels == full_labels
+    else:
+        row_strategy = np.full(shape[0], np.nan)
+        column_strategy = np.full(shape[1], np.nan)
+    return LemkeHowsonResult(
+        row_strategy=row_strategy,
+        column_strategy=column_strategy,
+        basis=(
+            frozenset(row_tableau.basic_variables),
+            frozenset(col_tableau.basic_variables),
+        ),
+        warm_started=warm_started,
+        pivots=pivots,
+        dropped_labels=dropped_labels,
+        elapsed_time=time.perf_counter() - start,
+        status=status,
+    )
 
-    row_strat = row_tableau.to_strategy(col_tableau.non_basic_variables)
-    col_strat = col_tableau.to_strategy(row_tableau.non_basic_variables)
-    if row_strat.shape != (A.shape[0],) and col_strat.shape != (A.shape[0],):
-        msg = """The Lemke Howson algorithm has returned probability vectors of·
-incorrect shapes. This indicates an error. Your game could be degenerate."""
 
-        warnings.warn(msg, RuntimeWarning)
-    return row_strat, col_strat
+def lemke_howson_with_diagnostics(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    initial_dropped_label: int = 0,
+    lexicographic: bool = True,
+    eliminate_dominated: bool = False,
+    exact: bool = False,
+    fraction_free: bool = False,
+    max_pivots: Optional[int] = None,
+    backend: str = "dense",
+) -> LemkeHowsonResult:
+    """
+    Obtain a Nash equilibrium using the Lemke Howson algorithm (see
+    `lemke_howson`) together with the diagnostics of the run.
+
+    No warning is issued if the path stops before reaching an equilibrium:
+    the status of the result is then "max_pivots" or "cycle" and the
+    strategies are arrays of nan.
+
+    Parameters
+    ----------
+    A : array
+        The row player payoff matrix
+    B : array
+        The column player payoff matrix
+    initial_dropped_label: int
+        The initial dropped label.
+    lexicographic: bool
+        Whether to apply lexicographic sorting during pivoting, default True.
+    eliminate_dominated: bool
+        Whether or not to iteratively remove strictly dominated strategies
+        before pivoting. The strategies, the basis and the dropped labels
+        are returned in terms of the original strategies.
+    exact: bool
+        Whether or not to pivot exactly on integer tableaux (see
+        `lemke_howson`).
+    fraction_free: bool
+        Whether or not to pivot on integer tableaux with floating point
+        strategies (see `lemke_howson`).
+    max_pivots: Optional[int]
+        The maximum number of pivots. If None (default) there is no maximum.
+    backend: str
+        The storage of the tableaux: "dense" (default) or "sparse" (see
+        `lemke_howson`).
+
+    Returns
+    -------
+    LemkeHowsonResult
+        The equilibrium, its basis and the diagnostics of the run.
+
+    Raises
+    ------
+    ValueError
+        If the initial dropped label corresponds to a dominated strategy or
+        if the backend is not known or is sparse with exact or fraction free
+        pivoting.
+    """
+    start = time.perf_counter()
+    if eliminate_dominated:
+        rows, columns = iterated_elimination_of_dominated_strategies(A, B)
+        labels = np.concatenate((rows, columns + A.shape[0]))
+        if initial_dropped_label not in labels:
+            raise ValueError(
+                "The initial dropped label corresponds to a dominated strategy."
+            )
+        result = lemke_howson_with_diagnostics(
+            A[np.ix_(rows, columns)],
+            B[np.ix_(rows, columns)],
+            initial_dropped_label=int(
+                np.flatnonzero(labels == initial_dropped_label)[0]
+            ),
+            lexicographic=lexicographic,
+            exact=exact,
+            fraction_free=fraction_free,
+            max_pivots=max_pivots,
+            backend=backend,
+        )
+        # The removed strategies are not played: the slack variables of the
+        # removed column strategies are basic in the row tableau and those
+        # of the removed row strategies in the column tableau.
+        removed_rows = np.setdiff1d(np.arange(A.shape[0]), rows)
+        removed_columns = np.setdiff1d(np.arange(A.shape[1]), columns) + A.shape[0]
+        row_basis, col_basis = result.basis
+        row_strategy = np.full(A.shape[0], np.nan)
+        column_strategy = np.full(A.shape[1], np.nan)
+        if result.status == "equilibrium":
+            row_strategy = expand_strategy(result.row_strategy, rows, A.shape[0])
+            column_strategy = expand_strategy(
+                result.column_strategy, columns, A.shape[1]
+            )
+        return result._replace(
+            row_strategy=row_strategy,
+            column_strategy=column_strategy,
+            basis=(
+                frozenset(labels[sorted(row_basis)].tolist())
+                | frozenset(removed_columns.tolist()),
+                frozenset(labels[sorted(col_basis)].tolist())
+                | frozenset(removed_rows.tolist()),
+            ),
+            dropped_labels=labels[result.dropped_labels].tolist(),
+            elapsed_time=time.perf_counter() - start,
+        )
+
+    col_tableau = create_col_tableau(A, lexicographic, exact, fraction_free, backend)
+    row_tableau = create_row_tableau(B, lexicographic, exact, fraction_free, backend)
+    dropped_labels, status = follow_lemke_howson_path(
+        row_tableau, col_tableau, initial_dropped_label, max_pivots=max_pivots
+    )
+    return tableaux_to_result(
+        row_tableau,
+        col_tableau,
+        A.shape,
+        status,
+        warm_started=False,
+        pivots=len(dropped_labels),
+        dropped_labels=dropped_labels,
+        start=start,
+    )
+
+
+def resume_lemke_howson(
+    row_tableau: Tableau,
+    col_tableau: Tableau,
+    shape: Tuple[int, ...],
+    max_pivots: Optional[int] = None,
+) -> LemkeHowsonResult:
+    """
+    Obtain a Nash equilibrium with Lemke's algorithm from a pair of dense
+    floating point tableaux pivoted to a basis in which each label is basic
+    in exactly one tableau, for example the basis of the equilibrium of a
+    nearby game.
+
+    A tableau of both polytopes (see `create_covering_tableau`) is pivoted
+    to a feasible complementary basis (see `follow_lemke_path`). If the
+    values of the basic variables are non negative, no path is followed.
+    Otherwise the path typically ends near the basis, at an equilibrium
+    close to that of the game the basis was obtained for.
+
+    Parameters
+    ----------
+    row_tableau : Tableau
+        The row player tableau.
+    col_tableau : Tableau
+        The column player tableau.
+    shape : Tuple
+        The shape of the payoff matrices.
+    max_pivots: Optional[int]
+        The maximum number of pivots along the path. If None (default) there
+        is no maximum.
+
+    Returns
+    -------
+    LemkeHowsonResult
+        The equilibrium and the diagnostics of the run. The number of pivots
+        includes those carried out on the given tableaux. If the path stops
+        early (see `follow_lemke_path`) or if it reaches the artificial
+        equilibrium, `warm_started` is False and the strategies are arrays
+        of nan.
+    """
+    start = time.perf_counter()
+    number_of_rows, number_of_labels = shape[0], sum(shape)
+    tableau = create_covering_tableau(row_tableau, col_tableau)
+    dropped_labels, status = follow_lemke_path(
+        tableau, number_of_labels, max_pivots=max_pivots
+    )
+    values = tableau.variable_values()
+    row_strategy = values[:number_of_rows]
+    column_strategy = values[number_of_labels + number_of_rows : -1]
+    warm_started = bool(status == "equilibrium" and row_strategy.sum() > 0)
+    if warm_started:
+        row_strategy = row_strategy / row_strategy.sum()
+        column_strategy = column_strategy / column_strategy.sum()
+    else:
+        row_strategy = np.full(number_of_rows, np.nan)
+        column_strategy = np.full(shape[1], np.nan)
+    basic_variables = np.array(sorted(tableau.basic_variables))
+    return LemkeHowsonResult(
+        row_strategy=row_strategy,
+        column_strategy=column_strategy,
+        basis=(
+            frozenset(basic_variables[basic_variables < number_of_labels].tolist()),
+            frozenset(
+                (
+                    basic_variables[
+                        (basic_variables >= number_of_labels)
+                        & (basic_variables < 2 * number_of_labels)
+                    ]
+                    - number_of_labels
+                ).tolist()
+            ),
+        ),
+        warm_started=warm_started,
+        pivots=tableau.pivots,
+        dropped_labels=dropped_labels,
+        elapsed_time=time.perf_counter() - start,
+        status=status,
+    )
+
+
+def warm_started_lemke_howson(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    basis: Optional[Basis] = None,
+    strategies: Optional[Tuple[npt.NDArray, npt.NDArray]] = None,
+    initial_dropped_label: int = 0,
+    lexicographic: bool = True,
+    exact: bool = False,
+    fraction_free: bool = False,
+    max_pivots: Optional[int] = None,
+    backend: str = "dense",
+) -> LemkeHowsonResult:
+    """
+    Obtain a Nash equilibrium using the Lemke Howson algorithm, starting
+    from a given basis or pair of strategies if possible.
+
+    The tableaux are pivoted to the basis (see `Tableau.pivot_to_basis`).
+    A basis in which a label is basic in both tableaux, without a strategy
+    of the row player in the row tableau or of the column player in the
+    column tableau (such as the basis of the artificial equilibrium) or
+    strategies with an empty support are not used. If the values of the
+    basic variables are non negative, the tableaux are fully labeled and
+    correspond to an equilibrium which is obtained without following a
+    path. This is typically the case when the game is a small perturbation
+    of the game that the basis was obtained for. Otherwise the pivoting
+    resumes from the basis with Lemke's algorithm (see
+    `resume_lemke_howson`), which follows a path to a nearby equilibrium.
+    This is only done for floating point pivoting on dense tableaux.
+
+    If the basis is not used, the path from the artificial equilibrium
+    obtained by dropping the initial dropped label is followed as in
+    `lemke_howson`.
+
+    Parameters
+    ----------
+    A : array
+        The row player payoff matrix
+    B : array
+        The column player payoff matrix
+    basis : Optional[Basis]
+        The basis to start from, for example the basis of a previous result.
+    strategies : Optional[Tuple]
+        A pair of strategies to start from if no basis is given (see
+        `strategies_basis`).
+    initial_dropped_label: int
+        The initial dropped label if the path from the artificial
+        equilibrium is followed.
+    lexicographic: bool
+        Whether to apply lexicographic sorting during pivoting, default True.
+    exact: bool
+        Whether or not to pivot exactly on integer tableaux (see
+        `lemke_howson`).
+    fraction_free: bool
+        Whether or not to pivot on integer tableaux with floating point
+        strategies (see `lemke_howson`).
+    max_pivots: Optional[int]
+        The maximum number of pivots along the path. If None (default) there
+        is no maximum.
+    backend: str
+        The storage of the tableaux: "dense" (default) or "sparse" (see
+        `lemke_howson`).
+
+    Returns
+    -------
+    LemkeHowsonResult
+        The equilibrium, its basis, whether or not it was obtained from the
+        given basis or strategies and the diagnostics of the run.
+    """
+    start = time.perf_counter()
+    if basis is None and strategies is not None:
+        try:
+            basis = strategies_basis(*strategies)
+        except ValueError:
+            pass
+
+    pivots = 0
+    if basis is not None:
+        row_basis, col_basis = basis
+        col_tableau = create_col_tableau(
+            A, lexicographic, exact, fraction_free, backend
+        )
+        row_tableau = create_row_tableau(
+            B, lexicographic, exact, fraction_free, backend
+        )
+        number_of_rows = A.shape[0]
+        if (
+            row_basis.isdisjoint(col_basis)
+            and min(row_basis, default=number_of_rows) < number_of_rows
+            and max(col_basis, default=-1) >= number_of_rows
+        ):
+            row_feasible = row_tableau.pivot_to_basis(row_basis)
+            col_feasible = col_tableau.pivot_to_basis(col_basis)
+            if row_feasible and col_feasible:
+                return tableaux_to_result(
+                    row_tableau,
+                    col_tableau,
+                    A.shape,
+                    "equilibrium",
+                    warm_started=True,
+                    pivots=row_tableau.pivots + col_tableau.pivots,
+                    dropped_labels=[],
+                    start=start,
+                )
+            if (
+                backend == "dense"
+                and not (exact or fraction_free)
+                and row_tableau.basic_variables == row_basis
+                and col_tableau.basic_variables == col_basis
+            ):
+                result = resume_lemke_howson(
+                    row_tableau, col_tableau, A.shape, max_pivots=max_pivots
+                )
+                if result.warm_started:
+                    return result
+                pivots = result.pivots
+            else:
+                pivots = row_tableau.pivots + col_tableau.pivots
+
+    col_tableau = create_col_tableau(A, lexicographic, exact, fraction_free, backend)
+    row_tableau = create_row_tableau(B, lexicographic, exact, fraction_free, backend)
+    dropped_labels, status = follow_lemke_howson_path(
+        row_tableau, col_tableau, initial_dropped_label, max_pivots=max_pivots
+    )
+    return tableaux_to_result(
+        row_tableau,
+        col_tableau,
+        A.shape,
+        status,
+        warm_started=False,
+        pivots=pivots + len(dropped_labels),
+        dropped_labels=dropped_labels,
+        start=start,
+    )
@@ -0,0 +1,152 @@
+"""Functions to traverse the graph of equilibria of the Lemke Howson algorithm"""
+
+import copy
+from collections import deque
+
+import numpy as np
+import numpy.typing as npt
+from typing import Any, Deque, FrozenSet, Generator, List, Set, Tuple
+
+from nashpy.linalg import Tableau, create_col_tableau, create_row_tableau
+
+from .lemke_howson import follow_lemke_howson_path, tableaux_to_strategies
+
+BasisPair = Tuple[FrozenSet[int], FrozenSet[int]]
+
+
+def basis_pair(row_tableau: Tableau, col_tableau: Tableau) -> BasisPair:
+    """
+    Return a hashable key of the bases of a pair of tableaux.
+
+    Parameters
+    ----------
+    row_tableau : Tableau
+        The row player tableau.
+    col_tableau : Tableau
+        The column player tableau.
+
+    Returns
+    -------
+    Tuple
+        The non basic variables of the row and of the column tableau.
+    """
+    return (
+        frozenset(row_tableau.non_basic_variables),
+        frozenset(col_tableau.non_basic_variables),
+    )
+
+
+def lemke_howson_graph_enumeration(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    lexicographic: bool = True,
+    exact: bool = False,
+    fraction_free: bool = False,
+) -> Generator[Tuple[Any, Any], Any, None]:
+    """
+    Obtain Nash equilibria by traversing the graph whose vertices are the
+    equilibria (and the artificial equilibrium) and whose edges are the
+    Lemke Howson paths obtained by dropping a label [Shapley1974]_.
+
+    Starting from the artificial equilibrium, the path obtained by dropping
+    each label is followed from each equilibrium that is reached. The bases
+    of the equilibria that are reached are kept in a set so that each is
+    only explored once and, as a path followed backwards with the same
+    label leads back to where it started, the paths that lead to an
+    equilibrium are not followed back. Each equilibrium is yielded once,
+    in the order in which it is reached.
+
+    All the equilibria that are connected to the artificial equilibrium are
+    obtained. For some games this is not all equilibria. The paths that
+    cycle, which can happen on degenerate games without lexicographic
+    pivoting, are ignored.
+
+    As paths followed from equilibria make long sequences of pivots, the
+    rows of floating point tableaux are cleaned and rescaled after each
+    pivot (see `Tableau._normalise_rows`).
+
+    Parameters
+    ----------
+    A : array
+        The row player payoff matrix
+    B : array
+        The column player payoff matrix
+    lexicographic : bool
+        Whether to apply lexicographic sorting during pivoting, default True.
+    exact : bool
+        Whether or not to pivot exactly on integer tableaux (see
+        `lemke_howson`). The equilibria are then arrays of fractions.
+    fraction_free : bool
+        Whether or not to pivot on integer tableaux using fraction free
+        pivoting (see `lemke_howson`).
+
+    Yields
+    ------
+    Generator
+        The equilibria.
+    """
+    row_tableau = create_row_tableau(
+        B, lexicographic, exact, fraction_free, normalise=True
+    )
+    col_tableau = create_col_tableau(
+        A, lexicographic, exact, fraction_free, normalise=True
+    )
+    number_of_labels = sum(A.shape)
+
+    visited = {basis_pair(row_tableau, col_tableau)}
+    followed: Set[Tuple[BasisPair, int]] = set()
+    to_explore: Deque[Tuple[Tableau, Tableau, BasisPair]] = deque(
+        [(row_tableau, col_tableau, basis_pair(row_tableau, col_tableau))]
+    )
+    equilibria: List[Tuple[Any, Any]] = []
+    while to_explore:
+        row_tableau, col_tableau, key = to_explore.popleft()
+        for label in range(number_of_labels):
+            if (key, label) in followed:
+                continue
+            next_row_tableau = copy.deepcopy(row_tableau)
+            next_col_tableau = copy.deepcopy(col_tableau)
+            _, status = follow_lemke_howson_path(
+                next_row_tableau, next_col_tableau, label
+            )
+            if status != "equilibrium":
+                continue
+            next_key = basis_pair(next_row_tableau, next_col_tableau)
+            followed.add((next_key, label))
+            if next_key in visited:
+                continue
+            visited.add(next_key)
+            to_explore.append((next_row_tableau, next_col_tableau, next_key))
+
+            equilibrium = tableaux_to_strategies(
+                next_row_tableau, next_col_tableau, A.shape
+            )
+            if not any(is_same_equilibrium(equilibrium, other) for other in equilibria):
+                equilibria.append(equilibrium)
+                yield equilibrium
+
+
+def is_same_equilibrium(equilibrium: Tuple[Any, Any], other: Tuple[Any, Any]) -> bool:
+    """
+    Check if two equilibria are the same. In a degenerate game an
+    equilibrium can be reached with different bases.
+
+    Parameters
+    ----------
+    equilibrium : Tuple
+        A pair of strategies.
+    other : Tuple
+        A pair of strategies.
+
+    Returns
+    -------
+    bool
+        Whether or not the strategies are the same.
+    """
+    return all(
+        strategy.shape == other_strategy.shape
+        and np.allclose(
+            strategy.astype(float), other_strategy.astype(float), equal_nan=True
+        )
+        for strategy, other_strategy in zip(equilibrium, other)
+    )
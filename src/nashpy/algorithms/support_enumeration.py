@@ -1,11 +1,24 @@
 """A class for a normal form game"""
 
+import os
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from fractions import Fraction
+from functools import partial
 from itertools import chain, combinations
+from math import comb
 
 import numpy as np
 import numpy.typing as npt
-from typing import Generator, Any, Iterator, Tuple, Union
+import scipy.linalg
+from typing import Generator, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from nashpy.linalg.bareiss import bareiss_solve, to_integer_matrix
+from nashpy.utils.dominance import (
+    expand_strategy,
+    iterated_elimination_of_dominated_strategies,
+)
+
+DRIFT_TOLERANCE = 10**-8
 
 
 def powerset(n: int) -> Iterator[Tuple[Any, ...]]:
@@ -76,12 +89,434 @@ def solve_indifference(A, rows=None, columns=None) -> Union[bool, Any]:
         return False
 
 
+def revolving_door(n: int, k: int) -> Generator[Tuple[int, ...], Any, None]:
+    """
+    A generator for the subsets of range(n) of size k in revolving door order:
+    consecutive subsets differ by exchanging a single element.
+
+    This is the order described in Section 7.2.1.3 of [Knuth2005]_: the
+    subsets of size k of range(n - 1) followed by the subsets of size k - 1
+    of range(n - 1) in reverse order, each with n - 1 added.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+    k : int
+        The size of the subsets.
+
+    Yields
+    ------
+    Generator
+        The subsets as sorted tuples.
+    """
+    yield from _revolving_door(n, k, reverse=False)
+
+
+def _revolving_door(
+    n: int, k: int, reverse: bool
+) -> Generator[Tuple[int, ...], Any, None]:
+    """
+    A generator for the subsets of range(n) of size k in revolving door order
+    or in the reverse of that order.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+    k : int
+        The size of the subsets.
+    reverse : bool
+        Whether or not to reverse the order.
+
+    Yields
+    ------
+    Generator
+        The subsets as sorted tuples.
+    """
+    if k == 0 or k == n:
+        yield tuple(range(k))
+        return
+    if not reverse:
+        yield from _revolving_door(n - 1, k, reverse=False)
+    for subset in _revolving_door(n - 1, k - 1, reverse=not reverse):
+        yield subset + (n - 1,)
+    if reverse:
+        yield from _revolving_door(n - 1, k, reverse=True)
+
+
+def solve_indifference_batch(
+    A: npt.NDArray,
+    rows: npt.NDArray,
+    columns: npt.NDArray,
+    games: Optional[npt.NDArray] = None,
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    """
+    Solve the indifference equations for a stack of support pairs of equal
+    size with a single broadcasted call to `np.linalg.solve`.
+
+    This is the batched counterpart of `solve_indifference`: the indifference
+    system for each pair is restricted to the columns in the support (the
+    other columns are played with probability 0) which gives a stack of
+    square matrices of shape (k, s, s).
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    rows : array
+        A (k, s) array of integers: each row is a set of rows to consider.
+    columns : array
+        A (k, s) array of integers: each row is a set of columns to consider.
+    games : Optional[array]
+        If given, A is a (g, m, n) stack of utility matrices and this is an
+        array of length k of the index of the matrix of each system.
+
+    Returns
+    -------
+    Tuple
+        A (k, n) array of solutions (where n is the number of columns of A)
+        and a boolean array of length k indicating which of the systems were
+        not singular.
+    """
+    number_of_systems, size = columns.shape
+    if games is None:
+        sub_matrices = A[rows[:, :, np.newaxis], columns[:, np.newaxis, :]]
+    else:
+        sub_matrices = A[
+            games[:, np.newaxis, np.newaxis],
+            rows[:, :, np.newaxis],
+            columns[:, np.newaxis, :],
+        ]
+    # Ensure differences between pairs of pure strategies are the same
+    M = (sub_matrices - np.roll(sub_matrices, 1, axis=1))[:, :-1, :]
+    # Ensure have probability vector
+    M = np.concatenate((M, np.ones((number_of_systems, 1, size))), axis=1)
+    b = np.zeros((number_of_systems, size, 1))
+    b[:, -1] = 1
+
+    try:
+        solutions = np.linalg.solve(M, b)
+        non_singular = np.ones(number_of_systems, dtype=bool)
+    except np.linalg.LinAlgError:
+        non_singular = np.linalg.det(M) != 0
+        M[~non_singular] = np.eye(size)
+        solutions = np.linalg.solve(M, b)
+
+    probabilities = np.zeros((number_of_systems, A.shape[-1]))
+    np.put_along_axis(probabilities, columns, solutions[:, :, 0], axis=1)
+    return probabilities, non_singular
+
+
+def unrank_combination(n: int, k: int, rank: int) -> List[int]:
+    """
+    Return the combination of size k of range(n) with a given rank in the
+    lexicographic order used by `itertools.combinations`.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+    k : int
+        The size of the combination.
+    rank : int
+        The rank of the combination: an integer between 0 and comb(n, k) - 1.
+
+    Returns
+    -------
+    list
+        The combination.
+    """
+    combination = []
+    element = 0
+    for i in range(k):
+        while comb(n - element - 1, k - i - 1) <= rank:
+            rank -= comb(n - element - 1, k - i - 1)
+            element += 1
+        combination.append(element)
+        element += 1
+    return combination
+
+
+def combinations_from(
+    n: int, k: int, rank: int = 0
+) -> Generator[Tuple[int, ...], Any, None]:
+    """
+    A generator for the combinations of size k of range(n) in lexicographic
+    order, starting from the combination with a given rank.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+    k : int
+        The size of the combinations.
+    rank : int
+        The rank of the first combination.
+
+    Yields
+    ------
+    Generator
+        The combinations.
+    """
+    if rank == 0:
+        yield from combinations(range(n), k)
+        return
+    combination = unrank_combination(n, k, rank)
+    while True:
+        yield tuple(combination)
+        i = k - 1
+        while i >= 0 and combination[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            return
+        combination[i] += 1
+        for j in range(i + 1, k):
+            combination[j] = combination[j - 1] + 1
+
+
+class SupportPairs(object):
+    """
+    An iterator over the pairs of non empty supports in the order of
+    `potential_support_pairs` that records its position.
+
+    The position is a resumable cursor: an iterator created with a given
+    position yields the same pairs as an iterator that has already yielded
+    that many pairs. The supports are generated one size at a time with
+    `itertools.combinations` so the memory used does not depend on the
+    number of pairs.
+    """
+
+    def __init__(
+        self,
+        number_of_rows: int,
+        number_of_columns: int,
+        non_degenerate: bool = False,
+        position: int = 0,
+    ):
+        """
+        Constructs the iterator.
+
+        Parameters
+        ----------
+        number_of_rows : int
+            The number of strategies of the row player.
+        number_of_columns : int
+            The number of strategies of the column player.
+        non_degenerate : bool
+            Whether or not to only consider supports of equal size.
+        position : int
+            The number of pairs to skip.
+        """
+        self.number_of_rows = number_of_rows
+        self.number_of_columns = number_of_columns
+        self.non_degenerate = non_degenerate
+        self.position = position
+        self._pairs = self._pairs_from(position)
+
+    def _number_of_column_supports(self, size: int) -> int:
+        """
+        Return the number of column supports paired with each row support of
+        a given size.
+
+        Parameters
+        ----------
+        size : int
+            The size of the row support.
+
+        Returns
+        -------
+        int
+            The number of column supports.
+        """
+        if self.non_degenerate:
+            return comb(self.number_of_columns, size)
+        return 2**self.number_of_columns - 1
+
+    def _pairs_from(self, position: int) -> Generator[tuple, Any, None]:
+        """
+        A generator for the support pairs starting at a given position.
+
+        Parameters
+        ----------
+        position : int
+            The number of pairs to skip.
+
+        Yields
+        ------
+        Generator
+            The pairs of supports.
+        """
+        for row_size in range(1, self.number_of_rows + 1):
+            block = comb(self.number_of_rows, row_size)
+            block *= self._number_of_column_supports(row_size)
+            if position < block:
+                break
+            position -= block
+        else:
+            return
+
+        row_rank, column_rank = divmod(
+            position, self._number_of_column_supports(row_size)
+        )
+        column_size = row_size
+        if not self.non_degenerate:
+            column_size = 1
+            while column_rank >= comb(self.number_of_columns, column_size):
+                column_rank -= comb(self.number_of_columns, column_size)
+                column_size += 1
+
+        for size1 in range(row_size, self.number_of_rows + 1):
+            if self.non_degenerate:
+                column_sizes = range(size1, size1 + 1)
+            else:
+                column_sizes = range(1, self.number_of_columns + 1)
+            for support1 in combinations_from(self.number_of_rows, size1, row_rank):
+                for size2 in column_sizes:
+                    if size2 < column_size:
+                        continue
+                    for support2 in combinations_from(
+                        self.number_of_columns, size2, column_rank
+                    ):
+                        yield support1, support2
+                    column_size, column_rank = 0, 0
+            row_rank = 0
+
+    def __iter__(self):
+        """Return the iterator itself."""
+        return self
+
+    def __next__(self) -> tuple:
+        """
+        Return the next pair of supports.
+
+        Returns
+        -------
+        tuple
+            The pair of supports.
+        """
+        pair = next(self._pairs)
+        self.position += 1
+        return pair
+
+    def __len__(self) -> int:
+        """
+        Return the total number of pairs, including those already yielded.
+
+        Returns
+        -------
+        int
+            The number of pairs.
+        """
+        return sum(
+            comb(self.number_of_rows, size) * self._number_of_column_supports(size)
+            for size in range(1, self.number_of_rows + 1)
+        )
+
+
 def potential_support_pairs(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    non_degenerate: bool = False,
+    row_supports: Optional[Iterable[tuple]] = None,
+    start: int = 0,
+) -> Iterator[tuple]:
+    """
+    A generator for the potential support pairs
+
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    non_degenerate : bool
+        Whether or not to consider supports of equal size. By default
+        (False) only considers supports of equal size.
+    row_supports : Optional[Iterable]
+        The supports of the row player to consider. By default (None) all
+        non empty supports are considered.
+    start : int
+        The number of pairs to skip, for example the `position` of a
+        `SupportPairs` iterator saved as a checkpoint. This cannot be used
+        with row_supports.
+
+    Yields
+    -------
+    Generator
+        A pair of possible supports. If row_supports is None this is a
+        `SupportPairs` iterator.
+
+    Raises
+    ------
+    ValueError
+        If both row_supports and a non zero start are given.
+    """
+    p1_num_strategies, p2_num_strategies = A.shape
+    if row_supports is None:
+        return SupportPairs(
+            p1_num_strategies,
+            p2_num_strategies,
+            non_degenerate=non_degenerate,
+            position=start,
+        )
+    if start != 0:
+        raise ValueError("start cannot be used with row_supports.")
+    return (
+        (support1, support2)
+        for support1 in row_supports
+        for size in (
+            (len(support1),) if non_degenerate else range(1, p2_num_strategies + 1)
+        )
+        for support2 in combinations(range(p2_num_strategies), size)
+    )
+
+
+def is_conditionally_dominated(
+    A: npt.NDArray, strategies: Iterable[int], columns: Iterable[int]
+) -> npt.NDArray:
+    """
+    Test if pure strategies of the row player are conditionally dominated:
+    some other pure strategy does strictly better against every one of the
+    given columns.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    strategies : Iterable
+        The rows to test.
+    columns : Iterable
+        The columns that the column player is restricted to.
+
+    Returns
+    -------
+    array
+        A boolean array: True for the strategies that are conditionally
+        dominated.
+    """
+    restricted = A[:, list(columns)]
+    candidates = restricted[list(strategies)]
+    return np.any(
+        np.all(restricted[np.newaxis, :, :] > candidates[:, np.newaxis, :], axis=2),
+        axis=1,
+    )
+
+
+def pruned_support_pairs(
     A: npt.NDArray, B: npt.NDArray, non_degenerate: bool = False
 ) -> Generator[tuple, Any, None]:
     """
-    A generator for the potential support pairs
+    A generator for the potential support pairs that discards supports using
+    conditional dominance, following [Porter2008]_.
 
+    Support sizes are considered from small and balanced to large and
+    unbalanced. For a row support, the columns that are conditionally
+    dominated given that support are discarded before any column support is
+    generated, and a pair is only yielded if no row in the row support is
+    conditionally dominated given the column support. None of the discarded
+    pairs can be the supports of a Nash equilibrium.
 
     Parameters
     ----------
@@ -99,17 +534,41 @@ def potential_support_pairs(
         A pair of possible supports.
     """
     p1_num_strategies, p2_num_strategies = A.shape
-    for support1 in (s for s in powerset(p1_num_strategies) if len(s) > 0):
-        for support2 in (
-            s
-            for s in powerset(p2_num_strategies)
-            if (len(s) > 0 and not non_degenerate) or len(s) == len(support1)
-        ):
-            yield support1, support2
+    sizes = sorted(
+        (
+            (size1, size2)
+            for size1 in range(1, p1_num_strategies + 1)
+            for size2 in range(1, p2_num_strategies + 1)
+            if not non_degenerate or size1 == size2
+        ),
+        key=lambda sizes: (abs(sizes[0] - sizes[1]), sum(sizes)),
+    )
+    for size1, size2 in sizes:
+        for support1 in combinations(range(p1_num_strategies), size1):
+            columns = [
+                column
+                for column, dominated in enumerate(
+                    is_conditionally_dominated(B.T, range(p2_num_strategies), support1)
+                )
+                if not dominated
+            ]
+            if len(columns) < size2 or any(
+                is_conditionally_dominated(A, support1, columns)
+            ):
+                continue
+            for support2 in combinations(columns, size2):
+                if not any(is_conditionally_dominated(A, support1, support2)):
+                    yield support1, support2
 
 
 def indifference_strategies(
-    A: npt.NDArray, B: npt.NDArray, non_degenerate: bool = False, tol: float = 10**-16
+    A: npt.NDArray,
+    B: npt.NDArray,
+    non_degenerate: bool = False,
+    tol: float = 10**-16,
+    row_supports: Optional[Iterable[tuple]] = None,
+    prune: bool = False,
+    start: int = 0,
 ) -> Generator[Tuple[bool, bool, Any, Any], Any, None]:
     """
     A generator for the strategies corresponding to the potential supports
@@ -125,6 +584,15 @@ def indifference_strategies(
         (False) only considers supports of equal size.
     tol : float
         A tolerance parameter for equality.
+    row_supports : Optional[Iterable]
+        The supports of the row player to consider. By default (None) all
+        non empty supports are considered. This is ignored if prune is True.
+    prune : bool
+        Whether or not to generate the support pairs with
+        `pruned_support_pairs`.
+    start : int
+        The number of support pairs of `potential_support_pairs` to skip.
+        This is ignored if prune is True.
 
     Yields
     ------
@@ -136,7 +604,18 @@ def indifference_strategies(
     if non_degenerate:
         tol = min(tol, 0)
 
-    for pair in potential_support_pairs(A, B, non_degenerate=non_degenerate):
+    pairs: Iterator[tuple]
+    if prune:
+        pairs = pruned_support_pairs(A, B, non_degenerate=non_degenerate)
+    else:
+        pairs = potential_support_pairs(
+            A,
+            B,
+            non_degenerate=non_degenerate,
+            row_supports=row_supports,
+            start=start,
+        )
+    for pair in pairs:
         s1 = solve_indifference(B.T, *(pair[::-1]))
         s2 = solve_indifference(A, *pair)
 
@@ -172,6 +651,35 @@ def obey_support(strategy, support: npt.NDArray, tol: float = 10**-16) -> bool:
     return True
 
 
+def obey_support_batch(
+    strategies: npt.NDArray, supports: npt.NDArray, tol: float = 10**-16
+) -> npt.NDArray:
+    """
+    Test if each of a stack of strategies is a probability vector that obeys
+    its support.
+
+    This is the batched counterpart of `obey_support`.
+
+    Parameters
+    ----------
+    strategies : array
+        A (k, n) array of strategies.
+    supports : array
+        A (k, n) boolean array of supports.
+    tol : float
+        A tolerance parameter for equality.
+
+    Returns
+    -------
+    array
+        A boolean array of length k: True for the strategies that are non
+        negative and have the given support.
+    """
+    return np.all(strategies >= 0, axis=1) & np.all(
+        np.where(supports, strategies > tol, strategies <= tol), axis=1
+    )
+
+
 def is_ne(
     strategy_pair: tuple,
     support_pair: Tuple[npt.NDArray, npt.NDArray],
@@ -212,9 +720,503 @@ def is_ne(
     )
 
 
+def is_ne_batch(
+    strategy_pairs: Tuple[npt.NDArray, npt.NDArray],
+    support_pairs: Tuple[npt.NDArray, npt.NDArray],
+    payoff_matrices: Tuple[npt.NDArray, npt.NDArray],
+    games: Optional[npt.NDArray] = None,
+) -> npt.NDArray:
+    """
+    Test if each of a stack of strategy pairs is a pair of best responses.
+
+    This is the batched counterpart of `is_ne`.
+
+    Parameters
+    ----------
+    strategy_pairs: tuple
+        a 2-tuple of (k, m) and (k, n) arrays of strategies.
+    support_pairs: tuple
+        a 2-tuple of (k, m) and (k, n) boolean arrays of supports.
+    payoff_matrices: tuple
+        a 2-tuple of numpy array of payoff matrices.
+    games : Optional[array]
+        If given, the payoff matrices are (g, m, n) stacks of matrices and
+        this is an array of length k of the index of the game of each pair.
+
+    Returns
+    -------
+    array
+        A boolean array of length k: True for the pairs of best responses.
+    """
+    A, B = payoff_matrices
+    row_strategies, column_strategies = strategy_pairs
+    row_supports, column_supports = support_pairs
+    # Payoff against opponents strategies:
+    if games is None:
+        row_payoffs = column_strategies @ A.T
+        column_payoffs = row_strategies @ B
+    else:
+        row_payoffs = np.einsum("kij,kj->ki", A[games], column_strategies)
+        column_payoffs = np.einsum("kij,ki->kj", B[games], row_strategies)
+
+    # Pure payoffs on current support:
+    row_support_payoffs = np.where(row_supports, row_payoffs, -np.inf)
+    column_support_payoffs = np.where(column_supports, column_payoffs, -np.inf)
+
+    return (row_payoffs.max(axis=1) == row_support_payoffs.max(axis=1)) & (
+        column_payoffs.max(axis=1) == column_support_payoffs.max(axis=1)
+    )
+
+
+def batched_equilibria(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    tol: float = 10**-16,
+    batch_size: int = 2**14,
+) -> Generator[Tuple[npt.NDArray, npt.NDArray, tuple, tuple], Any, None]:
+    """
+    A generator for the equilibria obtained by solving the indifference
+    equations of all support pairs of a given size at once.
+
+    Only supports of equal size can give a square system of indifference
+    equations so these are the only pairs considered. They are considered in
+    the same order as `potential_support_pairs`.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    tol : float
+        A tolerance parameter for equality.
+    batch_size : int
+        The maximum number of support pairs solved in a single call.
+
+    Yields
+    ------
+    Generator
+        The equilibria with their supports.
+    """
+    number_of_rows, number_of_columns = A.shape
+    for size in range(1, min(number_of_rows, number_of_columns) + 1):
+        row_supports = np.array(list(combinations(range(number_of_rows), size)))
+        column_supports = np.array(list(combinations(range(number_of_columns), size)))
+        number_of_pairs = len(row_supports) * len(column_supports)
+        for start in range(0, number_of_pairs, batch_size):
+            pair_indices = np.arange(start, min(start + batch_size, number_of_pairs))
+            rows = row_supports[pair_indices // len(column_supports)]
+            columns = column_supports[pair_indices % len(column_supports)]
+
+            s1, valid_s1 = solve_indifference_batch(B.T, columns, rows)
+            s2, valid_s2 = solve_indifference_batch(A, rows, columns)
+
+            row_masks = np.zeros(s1.shape, dtype=bool)
+            np.put_along_axis(row_masks, rows, True, axis=1)
+            column_masks = np.zeros(s2.shape, dtype=bool)
+            np.put_along_axis(column_masks, columns, True, axis=1)
+
+            valid = valid_s1 & valid_s2
+            valid &= obey_support_batch(s1, row_masks, tol=tol)
+            valid &= obey_support_batch(s2, column_masks, tol=tol)
+            valid[valid] = is_ne_batch(
+                (s1[valid], s2[valid]),
+                (row_masks[valid], column_masks[valid]),
+                (A, B),
+            )
+
+            for index in np.flatnonzero(valid):
+                yield s1[index], s2[index], tuple(rows[index]), tuple(columns[index])
+
+
+def bordered_indifference_matrix(A: npt.NDArray, dtype: Any = float) -> npt.NDArray:
+    """
+    Return the matrix of the indifference equations for a payoff matrix
+    restricted to a pair of supports: the solution of
+
+        [A: -1][y] = [0]
+        [1:  0][u]   [1]
+
+    is the probability vector y (on the columns of A) that makes the row
+    player indifferent between all rows of A with utility u.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix restricted to a pair of supports.
+    dtype : Any
+        The dtype of the bordered matrix.
+
+    Returns
+    -------
+    array
+        The bordered matrix.
+    """
+    number_of_rows, number_of_columns = A.shape
+    M = np.zeros((number_of_rows + 1, number_of_columns + 1), dtype=dtype)
+    M[:-1, :-1] = A
+    M[:-1, -1] = -1
+    M[-1, :-1] = 1
+    return M
+
+
+def solve_factorised_indifference(Q: npt.NDArray, R: npt.NDArray) -> Any:
+    """
+    Solve the bordered indifference equations from a QR factorisation of the
+    bordered matrix.
+
+    Parameters
+    ----------
+    Q : array
+        The orthogonal factor.
+    R : array
+        The upper triangular factor.
+
+    Returns
+    -------
+    Union
+        The probability vector or False if the matrix is singular.
+    """
+    diagonal = np.abs(np.diag(R))
+    if diagonal.min() <= len(R) * np.finfo(float).eps * diagonal.max():
+        return False
+    solution, _ = scipy.linalg.lapack.dtrtrs(R, Q[-1])
+    return solution[:-1]
+
+
+def solve_bordered_indifference(A: npt.NDArray, tol: float = 10**-16) -> Any:
+    """
+    Solve the bordered indifference equations of a payoff matrix restricted
+    to a pair of supports from scratch.
+
+    A probability is taken to be zero unless it is larger than tol and than
+    the rounding error of the solution relative to its largest probability.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix restricted to a pair of supports.
+    tol : float
+        A tolerance parameter for equality.
+
+    Returns
+    -------
+    Union
+        The probability vector or False if the matrix is singular or if one
+        of the probabilities is not positive.
+    """
+    M = bordered_indifference_matrix(A)
+    b = np.zeros(len(M))
+    b[-1] = 1
+    try:
+        probabilities = np.linalg.solve(M, b)[:-1]
+    except np.linalg.LinAlgError:
+        return False
+    threshold = len(M) * np.finfo(float).eps * probabilities.max()
+    if probabilities.min() <= max(tol, threshold):
+        return False
+    return probabilities
+
+
+def incremental_equilibria(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    tol: float = 10**-16,
+    refactor_every: int = 32,
+) -> Generator[Tuple[npt.NDArray, npt.NDArray, tuple, tuple], Any, None]:
+    """
+    A generator for the equilibria obtained by visiting the support pairs of
+    a given size so that neighbouring pairs differ by a single strategy.
+
+    The row supports are visited in revolving door order and, for each of
+    them, the column supports are visited in revolving door order, forwards
+    and backwards in turn. Exchanging a strategy changes a single row or
+    column of the bordered indifference matrix of the column player
+    (`bordered_indifference_matrix`) so instead of solving it from scratch
+    its QR factorisation is updated with the rank one updates of
+    `scipy.linalg.qr_update`. The factorisation is recomputed every
+    `refactor_every` updates to bound the accumulation of numerical error.
+
+    The factorisation is only used to discard the pairs for which the
+    strategy of the row player has a negative probability, which are most
+    of them. The indifference equations of the remaining pairs are solved
+    from scratch (see `solve_bordered_indifference`) before checking for
+    best responses, so the numerical error of the updates does not give
+    spurious equilibria.
+
+    Only supports of equal size can give a square system of indifference
+    equations so these are the only pairs considered.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    tol : float
+        A tolerance parameter for equality.
+    refactor_every : int
+        The number of updates after which the factorisations are recomputed.
+
+    Yields
+    ------
+    Generator
+        The equilibria with their supports.
+    """
+    number_of_rows, number_of_columns = A.shape
+    for size in range(1, min(number_of_rows, number_of_columns) + 1):
+        column_supports = list(revolving_door(number_of_columns, size))
+        updates = refactor_every
+        for index, support1 in enumerate(revolving_door(number_of_rows, size)):
+            for support2 in column_supports[:: 1 if index % 2 == 0 else -1]:
+                if updates >= refactor_every:
+                    rows, columns = list(support1), list(support2)
+                    Q, R = scipy.linalg.qr(
+                        bordered_indifference_matrix(B[np.ix_(rows, columns)].T)
+                    )
+                    updates = 0
+                else:
+                    u, v = np.zeros(size + 1), np.zeros(size + 1)
+                    if support1 != tuple(sorted(rows)):
+                        (old,) = set(rows) - set(support1)
+                        (new,) = set(support1) - set(rows)
+                        position = rows.index(old)
+                        rows[position] = new
+                        u[:-1] = B[new, columns] - B[old, columns]
+                        v[position] = 1
+                    else:
+                        (old,) = set(columns) - set(support2)
+                        (new,) = set(support2) - set(columns)
+                        position = columns.index(old)
+                        columns[position] = new
+                        u[position] = 1
+                        v[:-1] = B[rows, new] - B[rows, old]
+                    Q, R = scipy.linalg.qr_update(
+                        Q, R, u, v, overwrite_qruv=True, check_finite=False
+                    )
+                    updates += 1
+
+                x = solve_factorised_indifference(Q, R)
+                if x is False or x.min() < -DRIFT_TOLERANCE:
+                    continue
+                x = solve_bordered_indifference(B[np.ix_(rows, columns)].T, tol=tol)
+                if x is False:
+                    continue
+                y = solve_bordered_indifference(A[np.ix_(rows, columns)], tol=tol)
+                if y is False:
+                    continue
+                s1 = np.zeros(number_of_rows)
+                s1[rows] = x
+                s2 = np.zeros(number_of_columns)
+                s2[columns] = y
+                if is_ne((s1, s2), (np.array(rows), np.array(columns)), (A, B)):
+                    yield s1, s2, support1, support2
+
+
+def equilibria_on_row_supports(
+    row_supports: List[tuple],
+    A: npt.NDArray,
+    B: npt.NDArray,
+    non_degenerate: bool = False,
+    tol: float = 10**-16,
+) -> List[Tuple[Any, Any]]:
+    """
+    Obtain the equilibria for which the support of the row player is in a
+    given collection of supports.
+
+    This is the unit of work evaluated by each process of a parallel support
+    enumeration.
+
+    Parameters
+    ----------
+    row_supports : list
+        The supports of the row player to consider.
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    non_degenerate : bool
+        Whether or not to consider supports of equal size. By default
+        (False) only considers supports of equal size.
+    tol : float
+        A tolerance parameter for equality.
+
+    Returns
+    -------
+    list
+        The equilibria in the order in which they are obtained by support
+        enumeration.
+    """
+    return [
+        (s1, s2)
+        for s1, s2, sup1, sup2 in indifference_strategies(
+            A, B, non_degenerate=non_degenerate, tol=tol, row_supports=row_supports
+        )
+        if is_ne((s1, s2), (sup1, sup2), (A, B))
+    ]
+
+
+def solve_indifference_exact(
+    A: npt.NDArray, rows: Iterable[int], columns: Iterable[int]
+) -> Union[bool, Any]:
+    """
+    Solve the indifference equations exactly for an integer payoff matrix
+    using fraction free elimination (see `bareiss_solve`).
+
+    Only supports of equal sizes give a square system: as with
+    `solve_indifference` other supports have no solution.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix with integer entries.
+    rows : Iterable
+        The indices of the rows to consider.
+    columns : Iterable
+        The indices of the columns to consider.
+
+    Returns
+    -------
+    Union
+        The probability vector as an array of fractions or False if the
+        system is singular or has a negative solution.
+    """
+    rows, columns = list(rows), list(columns)
+    if len(rows) != len(columns):
+        return False
+    M = bordered_indifference_matrix(A[np.ix_(rows, columns)], dtype=A.dtype)
+    b = np.zeros(len(M), dtype=int)
+    b[-1] = 1
+    solution = bareiss_solve(M, b)
+    if solution is None or any(probability < 0 for probability in solution[:-1]):
+        return False
+    strategy = np.array([Fraction(0)] * A.shape[1], dtype=object)
+    strategy[columns] = solution[:-1]
+    return strategy
+
+
+def exact_equilibria(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    non_degenerate: bool = False,
+    prune: bool = False,
+) -> Generator[Tuple[Any, Any], Any, None]:
+    """
+    Obtain the Nash equilibria using support enumeration with exact rational
+    arithmetic.
+
+    The payoff matrices are scaled to integer matrices (see
+    `to_integer_matrix`), the indifference equations are solved with fraction
+    free elimination and the best responses are compared exactly so no
+    tolerance is needed.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    non_degenerate : bool
+        Whether or not to consider supports of equal size. By default
+        (False) only considers supports of equal size.
+    prune : bool
+        Whether or not to generate the support pairs with
+        `pruned_support_pairs`.
+
+    Yields
+    -------
+    Generator
+        The equilibria as arrays of fractions.
+    """
+    A, B = to_integer_matrix(A), to_integer_matrix(B)
+    pairs: Iterator[tuple]
+    if prune:
+        pairs = pruned_support_pairs(A, B, non_degenerate=non_degenerate)
+    else:
+        pairs = potential_support_pairs(A, B, non_degenerate=non_degenerate)
+    for support1, support2 in pairs:
+        s1 = solve_indifference_exact(B.T, support2, support1)
+        s2 = solve_indifference_exact(A, support1, support2)
+        if (
+            obey_support(s1, np.array(support1), tol=0)
+            and obey_support(s2, np.array(support2), tol=0)
+            and is_ne((s1, s2), (np.array(support1), np.array(support2)), (A, B))
+        ):
+            yield s1, s2
+
+
+def parallel_equilibria(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    non_degenerate: bool = False,
+    tol: float = 10**-16,
+    processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Generator[Tuple[Any, Any], Any, None]:
+    """
+    A generator for the equilibria obtained by splitting the supports of the
+    row player into contiguous chunks that are evaluated in parallel.
+
+    The equilibria are yielded in the same order as the serial support
+    enumeration.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+    non_degenerate : bool
+        Whether or not to consider supports of equal size. By default
+        (False) only considers supports of equal size.
+    tol : float
+        A tolerance parameter for equality.
+    processes : Optional[int]
+        The number of processes of the pool created to evaluate the chunks.
+        By default (None) this is the number of CPUs.
+    executor : Optional[Executor]
+        An executor used to evaluate the chunks. If given, no pool is created
+        and the executor is not shut down.
+
+    Yields
+    ------
+    Generator
+        The equilibria.
+    """
+    row_supports = [s for s in powerset(A.shape[0]) if len(s) > 0]
+    number_of_chunks = min(4 * (processes or os.cpu_count() or 1), len(row_supports))
+    bounds = np.linspace(0, len(row_supports), number_of_chunks + 1, dtype=int)
+    chunks = [row_supports[start:end] for start, end in zip(bounds, bounds[1:])]
+    evaluate = partial(
+        equilibria_on_row_supports, A=A, B=B, non_degenerate=non_degenerate, tol=tol
+    )
+
+    if executor is not None:
+        for equilibria in executor.map(evaluate, chunks):
+            yield from equilibria
+        return
+
+    pool = ProcessPoolExecutor(max_workers=processes)
+    try:
+        for equilibria in pool.map(evaluate, chunks):
+            yield from equilibria
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def support_enumeration(
-    A: npt.NDArray, B: npt.NDArray, non_degenerate: bool = False, tol: float = 10**-16
-) -> Generator[Tuple[bool, bool], Any, None]:
+    A: npt.NDArray,
+    B: npt.NDArray,
+    non_degenerate: bool = False,
+    tol: float = 10**-16,
+    batched: bool = False,
+    processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    eliminate_dominated: bool = False,
+    prune: bool = False,
+    incremental: bool = False,
+    exact: bool = False,
+) -> Generator[Tuple[npt.NDArray, npt.NDArray], Any, None]:
     """
     Obtain the Nash equilibria using support enumeration.
 
@@ -236,19 +1238,124 @@ def support_enumeration(
         (False) only considers supports of equal size.
     tol : float
         A tolerance parameter for equality.
+    batched : bool
+        Whether or not to solve the indifference equations of all support
+        pairs of a given size with a single vectorised call. This is much
+        faster for larger games and yields the equilibria in the same order.
+        As the probabilities outside of a support are exactly 0, this can
+        find equilibria that are otherwise lost to numerical error.
+    processes : Optional[int]
+        If given, the supports are evaluated in parallel on a pool of this
+        many processes. The equilibria are yielded in the same order.
+    executor : Optional[Executor]
+        If given, the supports are evaluated in parallel on this executor.
+        The equilibria are yielded in the same order.
+    eliminate_dominated : bool
+        Whether or not to iteratively remove strictly dominated strategies
+        (by pure or mixed strategies) before enumerating the supports. The
+        equilibria are returned in terms of the original strategies.
+    prune : bool
+        Whether or not to discard support pairs using conditional dominance
+        (see `pruned_support_pairs`). Supports are then considered from
+        small and balanced to large so the first equilibria are typically
+        found much faster, but not in the same order.
+    incremental : bool
+        Whether or not to visit the support pairs so that neighbouring pairs
+        differ by a single strategy and update the factorisations of the
+        indifference equations instead of solving them from scratch (see
+        `incremental_equilibria`). The equilibria are not yielded in the same
+        order.
+    exact : bool
+        Whether or not to use exact rational arithmetic (see
+        `exact_equilibria`). The payoffs can be integers, fractions or floats
+        (which are converted exactly), tol is not used and the equilibria are
+        arrays of fractions. This can be combined with prune.
 
     Yields
     -------
     Generator
         The equilibria.
+
+    Raises
+    ------
+    ValueError
+        If more than one of the batched, parallel, pruned and incremental
+        enumerations is requested or if an exact enumeration is batched,
+        parallel or incremental.
     """
+    parallel = processes is not None or executor is not None
+    if batched + parallel + prune + incremental > 1:
+        raise ValueError(
+            "At most one of the batched, parallel, pruned and incremental "
+            "enumerations can be used."
+        )
+    if exact and (batched or parallel or incremental):
+        raise ValueError(
+            "The exact enumeration cannot be batched, parallel or incremental."
+        )
+
+    if eliminate_dominated:
+        rows, columns = iterated_elimination_of_dominated_strategies(A, B)
+        for s1, s2 in support_enumeration(
+            A[np.ix_(rows, columns)],
+            B[np.ix_(rows, columns)],
+            non_degenerate=non_degenerate,
+            tol=tol,
+            batched=batched,
+            processes=processes,
+            executor=executor,
+            prune=prune,
+            incremental=incremental,
+            exact=exact,
+        ):
+            yield expand_strategy(s1, rows, A.shape[0]), expand_strategy(
+                s2, columns, A.shape[1]
+            )
+        return
+
+    equilibria: Iterator[Tuple[Any, Any]]
+    if exact:
+        equilibria = exact_equilibria(A, B, non_degenerate=non_degenerate, prune=prune)
+    elif parallel:
+        equilibria = parallel_equilibria(
+            A,
+            B,
+            non_degenerate=non_degenerate,
+            tol=tol,
+            processes=processes,
+            executor=executor,
+        )
+    elif batched or incremental:
+        if non_degenerate:
+            tol = min(tol, 0)
+        engine = batched_equilibria if batched else incremental_equilibria
+        equilibria = ((s1, s2) for s1, s2, _, _ in engine(A, B, tol=tol))
+    else:
+        equilibria = (
+            (s1, s2)
+            for s1, s2, sup1, sup2 in indifference_strategies(
+                A, B, non_degenerate=non_degenerate, tol=tol, prune=prune
+            )
+            if is_ne((s1, s2), (sup1, sup2), (A, B))
+        )
+
     count = 0
-    for s1, s2, sup1, sup2 in indifference_strategies(
-        A, B, non_degenerate=non_degenerate, tol=tol
-    ):
-        if is_ne((s1, s2), (sup1, sup2), (A, B)):
-            count += 1
-            yield s1, s2
+    for s1, s2 in equilibria:
+        count += 1
+        yield s1, s2
+    warn_if_even(count)
+
+
+def warn_if_even(count: int) -> None:
+    """
+    Warn that the game is degenerate if an even number of equilibria was
+    obtained: a non degenerate game has an odd number of equilibria.
+
+    Parameters
+    ----------
+    count : int
+        The number of equilibria obtained.
+    """
     if count % 2 == 0:
         warning = """
 An even number of ({}) equilibria was returned. This
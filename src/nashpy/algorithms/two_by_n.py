@@ -0,0 +1,204 @@
+"""Closed form equilibria of games in which a player has two strategies"""
+
+import numpy as np
+import numpy.typing as npt
+from typing import Any, List, Optional, Tuple
+
+
+def upper_envelope(
+    slopes: npt.NDArray, intercepts: npt.NDArray
+) -> Tuple[List[int], List[float]]:
+    """
+    Obtain the upper envelope over [0, 1] of the lines y = intercept + slope *
+    p by sorting them by slope and sweeping with a stack (the convex hull
+    trick) in O(N log N).
+
+    Parameters
+    ----------
+    slopes : array
+        The slopes of the lines.
+    intercepts : array
+        The intercepts of the lines.
+
+    Returns
+    -------
+    Tuple
+        The indices of the lines that form the envelope from p = 0 to p = 1
+        and the values of p (in (0, 1)) at which consecutive lines of the
+        envelope intersect.
+    """
+    hull: List[int] = []
+    for line in np.lexsort((intercepts, slopes)):
+        if hull and slopes[hull[-1]] == slopes[line]:
+            hull.pop()
+        while len(hull) >= 2:
+            first, second = hull[-2], hull[-1]
+            # The second line is below the others if the first line meets the
+            # new line before it meets the second line.
+            if (intercepts[first] - intercepts[line]) * (
+                slopes[second] - slopes[first]
+            ) > (intercepts[first] - intercepts[second]) * (
+                slopes[line] - slopes[first]
+            ):
+                break
+            hull.pop()
+        hull.append(line)
+
+    intersections = [
+        (intercepts[first] - intercepts[second]) / (slopes[second] - slopes[first])
+        for first, second in zip(hull, hull[1:])
+    ]
+    start = sum(intersection <= 0 for intersection in intersections)
+    end = len(hull) - sum(intersection >= 1 for intersection in intersections)
+    return hull[start:end], intersections[start : end - 1]
+
+
+def is_degenerate(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    envelope: List[int],
+    breakpoints: List[float],
+) -> bool:
+    """
+    Check if a 2xN game is degenerate: if a pure strategy has more than one
+    pure best response or if a strategy of the row player with support of
+    size 2 has more than two pure best responses.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix (with 2 rows).
+    B : array
+        The column player utility matrix (with 2 rows).
+    envelope : list
+        The best responses of the column player as given by `upper_envelope`.
+    breakpoints : list
+        The strategies of the row player at which the best response of the
+        column player changes as given by `upper_envelope`.
+
+    Returns
+    -------
+    bool
+        Whether or not the game is degenerate.
+    """
+    if np.any(A[0] == A[1]):
+        return True
+    for payoffs in B:
+        if np.count_nonzero(payoffs == payoffs.max()) > 1:
+            return True
+    if len(breakpoints) == 0:
+        return False
+    p = np.array(breakpoints)[:, np.newaxis]
+    payoffs = p * B[0] + (1 - p) * B[1]
+    best_payoffs = payoffs.max(axis=1, keepdims=True)
+    return bool(np.any(np.isclose(payoffs, best_payoffs).sum(axis=1) > 2))
+
+
+def two_by_n_equilibria(A: npt.NDArray, B: npt.NDArray) -> Optional[List[Any]]:
+    """
+    Obtain the equilibria of a nondegenerate game in which the row player has
+    two strategies.
+
+    If the row player plays their first strategy with probability p, the
+    utility of each column is a line in p. The best responses of the column
+    player are given by the upper envelope of these lines. A pure strategy of
+    the row player is an equilibrium if it is a best response to the column
+    that is best at that end of the envelope and the breakpoints of the
+    envelope give the equilibria in which both players mix.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix (with 2 rows).
+    B : array
+        The column player utility matrix (with 2 rows).
+
+    Returns
+    -------
+    Optional[list]
+        The equilibria with their supports (s1, s2, support1, support2) or
+        None if the game is degenerate.
+    """
+    envelope, breakpoints = upper_envelope(B[0] - B[1], B[1])
+    if is_degenerate(A, B, envelope, breakpoints):
+        return None
+
+    number_of_columns = A.shape[1]
+    differences = A[0] - A[1]
+    equilibria: List[Any] = []
+    for row, column in ((1, envelope[0]), (0, envelope[-1])):
+        if (differences[column] > 0) == (row == 0):
+            s1 = np.zeros(2)
+            s1[row] = 1
+            s2 = np.zeros(number_of_columns)
+            s2[column] = 1
+            equilibria.append((s1, s2, (row,), (column,)))
+
+    for first, second in zip(envelope, envelope[1:]):
+        if (differences[first] > 0) != (differences[second] > 0):
+            # Each probability is obtained with a single division so that it
+            # is correctly rounded.
+            s1 = np.array([B[1, first] - B[1, second], B[0, second] - B[0, first]]) / (
+                B[0, second] - B[1, second] - B[0, first] + B[1, first]
+            )
+            s2 = np.zeros(number_of_columns)
+            s2[first], s2[second] = differences[second], -differences[first]
+            s2 /= differences[second] - differences[first]
+            equilibria.append(
+                (
+                    s1,
+                    s2,
+                    (0, 1),
+                    tuple(sorted((int(first), int(second)))),
+                )
+            )
+    return equilibria
+
+
+def small_game_equilibria(
+    A: npt.NDArray, B: npt.NDArray
+) -> Optional[List[Tuple[npt.NDArray, npt.NDArray]]]:
+    """
+    Obtain the equilibria of a nondegenerate 2xN or Nx2 game in the order in
+    which they are yielded by `support_enumeration`.
+
+    Parameters
+    ----------
+    A : array
+        The row player utility matrix.
+    B : array
+        The column player utility matrix
+
+    Returns
+    -------
+    Optional[list]
+        The equilibria or None if the game is degenerate.
+
+    Raises
+    ------
+    ValueError
+        If neither player has two strategies.
+    """
+    A, B = np.asarray(A), np.asarray(B)
+    if A.shape[0] == 2:
+        equilibria = two_by_n_equilibria(A, B)
+    elif A.shape[1] == 2:
+        equilibria = two_by_n_equilibria(B.T, A.T)
+        if equilibria is not None:
+            equilibria = [
+                (s1, s2, support1, support2)
+                for s2, s1, support2, support1 in equilibria
+            ]
+    else:
+        raise ValueError("One of the players must have two strategies.")
+    if equilibria is None:
+        return None
+    equilibria.sort(
+        key=lambda equilibrium: (
+            len(equilibrium[2]),
+            equilibrium[2],
+            len(equilibrium[3]),
+            equilibrium[3],
+        )
+    )
+    return [(s1, s2) for s1, s2, _, _ in equilibria]
@@ -2,13 +2,173 @@
 
 import numpy as np
 import numpy.typing as npt
-from typing import Generator, Tuple, Any
-from nashpy.polytope import build_halfspaces, non_trivial_vertices
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+from nashpy.polytope import (
+    best_response_matrices,
+    build_halfspaces,
+    non_trivial_vertex_array,
+    polytope_cache,
+    reverse_search_vertices,
+)
+from nashpy.algorithms.bounded_enumeration import has_expired
+from nashpy.utils.dominance import (
+    expand_strategy,
+    iterated_elimination_of_dominated_strategies,
+)
+
+
+def polytope_vertices(
+    M: npt.NDArray, vertex_method: str = "qhull", use_cache: bool = False
+) -> Iterable[Tuple[npt.NDArray, int]]:
+    """
+    Obtain the non trivial vertices of the polytope Mx <= 1, x >= 0 and
+    their labels as bitmasks (see `labels_to_bitmask`).
+
+    Parameters
+    ----------
+    M : array
+        A matrix with linear coefficients defining the polytope.
+    vertex_method : str
+        How to obtain the vertices: "qhull" (see `non_trivial_vertex_array`)
+        or "reverse_search" (see `reverse_search_vertices`).
+    use_cache : bool
+        Whether or not to obtain the polytope from `polytope_cache` (see
+        `PolytopeCache`).
+
+    Returns
+    -------
+    Iterable
+        The vertices and their bitmasks.
+
+    Raises
+    ------
+    ValueError
+        If the vertex method is not known.
+    """
+    if vertex_method not in ("qhull", "reverse_search"):
+        raise ValueError("vertex_method must be one of qhull or reverse_search.")
+    if use_cache:
+        polytope = polytope_cache.get(M, vertex_method)
+        return zip(polytope.vertices, labels_to_bitmasks(polytope.labels))
+    halfspaces = build_halfspaces(M)
+    if vertex_method == "qhull":
+        vertices, labels = non_trivial_vertex_array(halfspaces)
+        return zip(vertices, labels_to_bitmasks(labels))
+    return (
+        (vertex, labels_to_bitmask(labels))
+        for vertex, labels in reverse_search_vertices(halfspaces)
+    )
+
+
+def labels_to_bitmask(labels: Iterable[int]) -> int:
+    """
+    Encode a set of labels as an integer whose bits are the labels.
+
+    Parameters
+    ----------
+    labels : Iterable
+        The labels.
+
+    Returns
+    -------
+    int
+        The bitmask.
+    """
+    bitmask = 0
+    for label in labels:
+        bitmask |= 1 << int(label)
+    return bitmask
+
+
+def labels_to_bitmasks(labels: npt.NDArray) -> List[int]:
+    """
+    Encode the rows of a boolean label matrix (see `label_matrix`) as
+    bitmasks (see `labels_to_bitmask`) with a single matrix multiplication.
+
+    Parameters
+    ----------
+    labels : array
+        A boolean array with a row per vertex and a column per label.
+
+    Returns
+    -------
+    list
+        The bitmasks.
+    """
+    number_of_labels = labels.shape[1]
+    if number_of_labels < 63:
+        return (labels @ (1 << np.arange(number_of_labels, dtype=np.int64))).tolist()
+    powers = np.array([1 << label for label in range(number_of_labels)], dtype=object)
+    return list(labels.astype(object) @ powers)
+
+
+def matching_vertices(
+    row_bitmask: int,
+    col_bitmasks: List[int],
+    col_vertices_by_bitmask: Dict[int, List[int]],
+    degenerate_col_vertices: List[int],
+    number_of_row_strategies: int,
+    full_bitmask: int,
+) -> List[int]:
+    """
+    Find the vertices of the column polytope that form a fully labeled pair
+    with a vertex of the row polytope: their labels must include the labels
+    that the row vertex does not have, so that the bitwise or of the labels
+    of the pair is the bitmask of all labels.
+
+    A vertex of the row polytope has at least as many labels as the number
+    of row strategies and a vertex of the column polytope at least as many
+    as the number of column strategies. If the row vertex has exactly as
+    many labels as the number of row strategies, the column vertices with
+    as many labels as the number of column strategies must have exactly the
+    missing labels and are found with a single lookup. The others are
+    checked with bitwise operations.
+
+    Parameters
+    ----------
+    row_bitmask : int
+        The labels of the row vertex (see `labels_to_bitmask`).
+    col_bitmasks : list
+        The labels of the column vertices.
+    col_vertices_by_bitmask : dict
+        The indices of the column vertices for each bitmask.
+    degenerate_col_vertices : list
+        The indices of the column vertices with more labels than the number
+        of column strategies.
+    number_of_row_strategies : int
+        The number of row strategies.
+    full_bitmask : int
+        The bitmask of all labels.
+
+    Returns
+    -------
+    list
+        The indices of the matching column vertices in increasing order.
+    """
+    missing_bitmask = full_bitmask & ~row_bitmask
+    candidates: Iterable[int]
+    if bin(row_bitmask).count("1") == number_of_row_strategies:
+        candidates = degenerate_col_vertices
+        matches = list(col_vertices_by_bitmask.get(missing_bitmask, []))
+    else:
+        candidates = range(len(col_bitmasks))
+        matches = []
+    matches.extend(
+        index
+        for index in candidates
+        if (row_bitmask | col_bitmasks[index]) == full_bitmask
+    )
+    return sorted(matches)
 
 
 def vertex_enumeration(
-    A: npt.NDArray, B: npt.NDArray
-) -> Generator[Tuple[float, float], Any, None]:
+    A: npt.NDArray,
+    B: npt.NDArray,
+    eliminate_dominated: bool = False,
+    vertex_method: str = "qhull",
+    use_cache: bool = False,
+    deadline: Optional[float] = None,
+) -> Generator[Tuple[npt.NDArray, npt.NDArray], Any, bool]:
     """
     Obtain the Nash equilibria using enumeration of the vertices of the best
     response polytopes.
@@ -20,37 +180,94 @@ def vertex_enumeration(
     3. Check if pair is fully labelled
     4. Return the normalised pair
 
+    The vertices of the column polytope are obtained once and indexed by
+    their labels, encoded as bitmasks, so that the fully labelled pairs of
+    each vertex of the row polytope are found with a lookup (see
+    `matching_vertices`) rather than by checking every pair.
+
+    The equilibria are yielded in the order of the vertices of the row
+    polytope. With qhull this order depends on the interior point of the
+    polytope (see `find_interior_point`).
+
     Parameters
     ----------
     A : array
         The row player utility matrix.
     B : array
         The column player utility matrix
-
+    eliminate_dominated : bool
+        Whether or not to iteratively remove strictly dominated strategies
+        (by pure or mixed strategies) before building the polytopes. The
+        equilibria are returned in terms of the original strategies.
+    vertex_method : str
+        How to obtain the vertices of the polytopes: "qhull" (default, see
+        `non_trivial_vertex_array`) or "reverse_search" (see
+        `reverse_search_vertices`) which pivots exactly and returns the
+        vertices lazily without duplicates, even for degenerate games,
+        using constant memory.
+    use_cache : bool
+        Whether or not to obtain the polytopes from `polytope_cache` so that
+        they are only built once when the equilibria of the same game are
+        obtained repeatedly (see `PolytopeCache`).
+    deadline : Optional[float]
+        The deadline as a value of `time.perf_counter`. If None there is no
+        deadline. It is checked before each vertex is considered.
 
     Yields
     -------
     Generator
-        The equilibria.
-    """
+        The equilibria. The return value of the generator is whether or not
+        all the vertices were considered.
 
-    if np.min(A) < 0:
-        A = A + abs(np.min(A))
-    if np.min(B) < 0:
-        B = B + abs(np.min(B))
+    Raises
+    ------
+    ValueError
+        If the vertex method is not known.
+    """
+    number_of_rows, number_of_columns = A.shape
+    rows, columns = np.arange(number_of_rows), np.arange(number_of_columns)
+    if eliminate_dominated:
+        rows, columns = iterated_elimination_of_dominated_strategies(A, B)
+        A, B = A[np.ix_(rows, columns)], B[np.ix_(rows, columns)]
 
-    number_of_row_strategies, row_dimension = A.shape
+    row_matrix, col_matrix = best_response_matrices(A, B)
+    number_of_row_strategies, row_dimension = col_matrix.shape
     max_label = number_of_row_strategies + row_dimension
-    full_labels = set(range(max_label))
+    full_bitmask = (1 << max_label) - 1
 
-    row_halfspaces = build_halfspaces(B.transpose())
-    col_halfspaces = build_halfspaces(A)
+    col_vertices = []
+    col_bitmasks = []
+    col_vertices_by_bitmask: Dict[int, List[int]] = {}
+    degenerate_col_vertices = []
+    for index, (col_v, bitmask) in enumerate(
+        polytope_vertices(col_matrix, vertex_method, use_cache)
+    ):
+        if has_expired(deadline):
+            return False
+        col_vertices.append(col_v)
+        col_bitmasks.append(bitmask)
+        col_vertices_by_bitmask.setdefault(bitmask, []).append(index)
+        if bin(bitmask).count("1") > row_dimension:
+            degenerate_col_vertices.append(index)
 
-    for row_v, row_l in non_trivial_vertices(row_halfspaces):
-        adjusted_row_l = set(
-            (label + number_of_row_strategies) % (max_label) for label in row_l
+    for row_v, bitmask in polytope_vertices(row_matrix, vertex_method, use_cache):
+        if has_expired(deadline):
+            return False
+        # The labels of the row polytope are shifted by the number of row
+        # strategies: the bitmask is rotated.
+        row_bitmask = ((bitmask << number_of_row_strategies) & full_bitmask) | (
+            bitmask >> row_dimension
         )
-
-        for col_v, col_l in non_trivial_vertices(col_halfspaces):
-            if adjusted_row_l.union(col_l) == full_labels:
-                yield row_v / sum(row_v), col_v / sum(col_v)
+        for index in matching_vertices(
+            row_bitmask,
+            col_bitmasks,
+            col_vertices_by_bitmask,
+            degenerate_col_vertices,
+            number_of_row_strategies,
+            full_bitmask,
+        ):
+            col_v = col_vertices[index]
+            yield expand_strategy(
+                row_v / sum(row_v), rows, number_of_rows
+            ), expand_strategy(col_v / sum(col_v), columns, number_of_columns)
+    return True
@@ -1,11 +1,24 @@
 """A class for a normal form game"""
 
+import time
+
 import numpy as np
 import numpy.typing as npt
 from typing import Optional, Any, Generator
-from .algorithms.lemke_howson import lemke_howson
+from .algorithms.lemke_howson import (
+    lemke_howson,
+    lemke_howson_with_diagnostics,
+    warm_started_lemke_howson,
+    warn_if_stopped,
+)
+from .algorithms.lemke_howson_graph import lemke_howson_graph_enumeration
 from .algorithms.support_enumeration import support_enumeration
+from .algorithms.bounded_enumeration import (
+    bounded_enumeration,
+    timed_support_enumeration,
+)
 from .algorithms.vertex_enumeration import vertex_enumeration
+from .algorithms.two_by_n import small_game_equilibria
 from .linalg.minimax import linear_program
 from .egt.moran_process import moran_process, fixation_probabilities
 from .learning.fictitious_play import fictitious_play
@@ -20,6 +33,7 @@ from .learning.replicator_dynamics import (
 from .learning.introspection_dynamics import introspection_dynamics
 from .learning.stochastic_fictitious_play import stochastic_fictitious_play
 from .utils.is_best_response import is_best_response
+from .utils.dominance import iterated_elimination_of_dominated_strategies
 from .learning.regret_minimization import regret_minimization
 from .learning.imitation_dynamics import imitation_dynamics
 
@@ -74,7 +88,9 @@ Column player:
             ]
         )
 
-    def vertex_enumeration(self):
+    def vertex_enumeration(
+        self, eliminate_dominated=False, vertex_method="qhull", use_cache=False
+    ):
         """
         Obtain the Nash equilibria using enumeration of the vertices of the best
         response polytopes.
@@ -86,14 +102,45 @@ Column player:
         3. Check if pair is fully labelled
         4. Return the normalised pair
 
+        Parameters
+        ----------
+        eliminate_dominated : bool
+            Whether or not to iteratively remove strictly dominated strategies
+            before building the polytopes.
+        vertex_method : str
+            How to obtain the vertices of the polytopes: "qhull" (default) or
+            "reverse_search" which pivots exactly and returns each vertex
+            once, even for degenerate games, using constant memory.
+        use_cache : bool
+            Whether or not to keep the polytopes in
+            `nashpy.polytope.polytope_cache` so that they are only built once
+            when the equilibria of the game are obtained repeatedly. They are
+            removed with `polytope_cache.invalidate_game`.
+
         Returns
         -------
         generator
             The equilibria.
         """
-        return vertex_enumeration(*self.payoff_matrices)
+        return vertex_enumeration(
+            *self.payoff_matrices,
+            eliminate_dominated=eliminate_dominated,
+            vertex_method=vertex_method,
+            use_cache=use_cache,
+        )
 
-    def support_enumeration(self, non_degenerate=False, tol=10**-16):
+    def support_enumeration(
+        self,
+        non_degenerate=False,
+        tol=10**-16,
+        batched=False,
+        processes=None,
+        executor=None,
+        eliminate_dominated=False,
+        prune=False,
+        incremental=False,
+        exact=False,
+    ):
         """
         Obtain the Nash equilibria using support enumeration.
 
@@ -104,6 +151,11 @@ Column player:
         3. Solve indifference conditions
         4. Check that have Nash Equilibrium.
 
+        If a player has two strategies, the game is nondegenerate and no
+        option other than non_degenerate is used, the equilibria are
+        obtained in closed form from the upper envelope of the best
+        responses of the other player. They are yielded in the same order.
+
         Parameters
         ----------
         non_degenerate : bool
@@ -111,17 +163,166 @@ Column player:
             (False) only considers supports of equal size.
         tol : float
             A tolerance parameter for equality.
+        batched : bool
+            Whether or not to solve the indifference equations of all support
+            pairs of a given size with a single vectorised call.
+        processes : int
+            If given, the supports are evaluated in parallel on a pool of this
+            many processes. The equilibria are yielded in the same order.
+        executor : Executor
+            If given, the supports are evaluated in parallel on this executor.
+            The equilibria are yielded in the same order.
+        eliminate_dominated : bool
+            Whether or not to iteratively remove strictly dominated strategies
+            before enumerating the supports.
+        prune : bool
+            Whether or not to discard support pairs using conditional
+            dominance. Supports are then considered from small and balanced
+            to large and the equilibria are not yielded in the same order.
+        incremental : bool
+            Whether or not to visit the support pairs so that neighbouring
+            pairs differ by a single strategy and update the factorisations
+            of the indifference equations instead of solving them from
+            scratch. The equilibria are not yielded in the same order.
+        exact : bool
+            Whether or not to use exact rational arithmetic. The payoffs can
+            be integers, fractions or floats, tol is not used and the
+            equilibria are arrays of fractions.
 
         Returns
         -------
         generator
             The equilibria.
         """
+        if tol == 10**-16 and not (
+            batched
+            or processes is not None
+            or executor is not None
+            or eliminate_dominated
+            or prune
+            or incremental
+            or exact
+        ):
+            equilibria = self._small_game_equilibria()
+            if equilibria is not None:
+                return (equilibrium for equilibrium in equilibria)
         return support_enumeration(
-            *self.payoff_matrices, non_degenerate=non_degenerate, tol=tol
+            *self.payoff_matrices,
+            non_degenerate=non_degenerate,
+            tol=tol,
+            batched=batched,
+            processes=processes,
+            executor=executor,
+            eliminate_dominated=eliminate_dominated,
+            prune=prune,
+            incremental=incremental,
+            exact=exact,
         )
 
-    def lemke_howson_enumeration(self):
+    def _small_game_equilibria(self):
+        """
+        Obtain the equilibria of a nondegenerate game in which a player has
+        two strategies in closed form (see `small_game_equilibria`).
+
+        Returns
+        -------
+        Optional[list]
+            The equilibria in the order of support enumeration or None if no
+            player has two strategies or the game is degenerate.
+        """
+        if 2 not in self.payoff_matrices[0].shape:
+            return None
+        return small_game_equilibria(*self.payoff_matrices)
+
+    def equilibria(
+        self,
+        method="support_enumeration",
+        max_equilibria=None,
+        time_budget=None,
+        **kwargs,
+    ):
+        """
+        Obtain at most a given number of Nash equilibria within a time budget.
+
+        The enumeration stops as soon as the number of equilibria or the time
+        budget is reached. The time budget is checked each time an
+        equilibrium is found, before each support pair for the default
+        support enumeration and before each vertex for vertex enumeration.
+
+        Parameters
+        ----------
+        method : str
+            The algorithm to use: one of "support_enumeration",
+            "vertex_enumeration", "lemke_howson_enumeration" or
+            "lemke_howson_graph_enumeration".
+        max_equilibria : int
+            The maximum number of equilibria to obtain. By default (None) all
+            equilibria are obtained.
+        time_budget : float
+            The time budget in seconds. By default (None) there is no budget.
+        **kwargs
+            The keyword arguments passed to the algorithm. For example `tol`
+            for `Game.support_enumeration`.
+
+        Returns
+        -------
+        EquilibriaResult
+            A named tuple of the list of equilibria and a boolean `complete`
+            that is True if the enumeration ran to the end.
+
+        Raises
+        ------
+        ValueError
+            If the method is not known or if max_equilibria or time_budget
+            is negative.
+        """
+        methods = {
+            "support_enumeration": self.support_enumeration,
+            "vertex_enumeration": self.vertex_enumeration,
+            "lemke_howson_enumeration": self.lemke_howson_enumeration,
+            "lemke_howson_graph_enumeration": self.lemke_howson_graph_enumeration,
+        }
+        if method not in methods:
+            raise ValueError(
+                "method must be one of {}.".format(", ".join(sorted(methods)))
+            )
+        if max_equilibria is not None and max_equilibria < 0:
+            raise ValueError("max_equilibria must be non negative.")
+        if time_budget is not None and time_budget < 0:
+            raise ValueError("time_budget must be non negative.")
+
+        deadline = None
+        if time_budget is not None:
+            deadline = time.perf_counter() + time_budget
+        small_game_equilibria = None
+        if method == "support_enumeration" and set(kwargs) <= {"non_degenerate"}:
+            small_game_equilibria = self._small_game_equilibria()
+        if small_game_equilibria is not None:
+            equilibria = (equilibrium for equilibrium in small_game_equilibria)
+        elif method == "support_enumeration" and set(kwargs) <= {
+            "non_degenerate",
+            "tol",
+        }:
+            equilibria = timed_support_enumeration(
+                *self.payoff_matrices, deadline=deadline, **kwargs
+            )
+        elif method == "vertex_enumeration":
+            equilibria = vertex_enumeration(
+                *self.payoff_matrices, deadline=deadline, **kwargs
+            )
+        else:
+            equilibria = methods[method](**kwargs)
+        return bounded_enumeration(
+            equilibria, max_equilibria=max_equilibria, deadline=deadline
+        )
+
+    def lemke_howson_enumeration(
+        self,
+        eliminate_dominated=False,
+        exact=False,
+        fraction_free=False,
+        max_pivots=None,
+    ):
         """
         Obtain Nash equilibria for all possible starting dropped labels
         using the lemke howson algorithm. See `Game.lemke_howson` for more
@@ -129,15 +330,93 @@ Column player:
 
         Note: this is not guaranteed to find all equilibria.
 
+        The runs that stop before reaching an equilibrium (because the
+        maximum number of pivots is reached or the path cycles) are skipped
+        with a warning.
+
+        Parameters
+        ----------
+        eliminate_dominated : bool
+            Whether or not to iteratively remove strictly dominated strategies
+            before pivoting. If so, only the labels of the remaining
+            strategies are used as starting dropped labels.
+        exact : bool
+            Whether or not to pivot exactly with fraction free integer
+            pivoting. The equilibria are then arrays of fractions.
+        fraction_free : bool
+            Whether or not to pivot with fraction free integer pivoting
+            (which keeps the tableaux bounded on large integer games) and
+            return floating point equilibria.
+        max_pivots : int
+            The maximum number of pivots of each run. By default (None) there
+            is no maximum.
+
         Yields
         ------
         Tuple
             An equilibria
         """
-        for label in range(sum(self.payoff_matrices[0].shape)):
-            yield self.lemke_howson(initial_dropped_label=label)
+        labels = range(sum(self.payoff_matrices[0].shape))
+        if eliminate_dominated:
+            rows, columns = iterated_elimination_of_dominated_strategies(
+                *self.payoff_matrices
+            )
+            labels = [*rows, *(columns + self.payoff_matrices[0].shape[0])]
+        for label in labels:
+            result = self.lemke_howson(
+                initial_dropped_label=label,
+                eliminate_dominated=eliminate_dominated,
+                exact=exact,
+                fraction_free=fraction_free,
+                max_pivots=max_pivots,
+                diagnostics=True,
+            )
+            if result.status != "equilibrium":
+                warn_if_stopped(result.status, result.pivots)
+                continue
+            yield result.row_strategy, result.column_strategy
 
-    def lemke_howson(self, initial_dropped_label):
+    def lemke_howson_graph_enumeration(self, exact=False, fraction_free=False):
+        """
+        Obtain Nash equilibria by following the Lemke Howson paths for all
+        dropped labels from the artificial equilibrium and from every
+        equilibrium that is reached. See `Game.lemke_howson` for more
+        information.
+
+        Each equilibrium is obtained once. Note: this is not guaranteed to
+        find all equilibria but finds all those that can be reached by the
+        Lemke Howson algorithm, which includes all those that
+        `Game.lemke_howson_enumeration` finds.
+
+        Parameters
+        ----------
+        exact : bool
+            Whether or not to pivot exactly with fraction free integer
+            pivoting. The equilibria are then arrays of fractions.
+        fraction_free : bool
+            Whether or not to pivot with fraction free integer pivoting
+            (which keeps the tableaux bounded on large integer games) and
+            return floating point equilibria.
+
+        Yields
+        ------
+        Tuple
+            An equilibria
+        """
+        return lemke_howson_graph_enumeration(
+            *self.payoff_matrices, exact=exact, fraction_free=fraction_free
+        )
+
+    def lemke_howson(
+        self,
+        initial_dropped_label,
+        eliminate_dominated=False,
+        exact=False,
+        fraction_free=False,
+        max_pivots=None,
+        backend="dense",
+        diagnostics=False,
+    ):
         """
         Obtain the Nash equilibria using the Lemke Howson algorithm implemented
         using integer pivoting.
@@ -157,14 +436,121 @@ Column player:
         ----------
         initial_dropped_label: int
             The initial dropped label.
+        eliminate_dominated : bool
+            Whether or not to iteratively remove strictly dominated strategies
+            before pivoting.
+        exact : bool
+            Whether or not to pivot exactly with fraction free integer
+            pivoting. The equilibria are then arrays of fractions.
+        fraction_free : bool
+            Whether or not to pivot with fraction free integer pivoting
+            (which keeps the tableaux bounded on large integer games) and
+            return floating point equilibria.
+        max_pivots : int
+            The maximum number of pivots. By default (None) there is no
+            maximum. If it is reached, or if the pivots cycle, a warning is
+            issued and the strategies are arrays of nan.
+        backend : str
+            The storage of the tableaux: "dense" (default) or "sparse". The
+            sparse backend is suited to large games with mostly zero
+            payoffs and only supports floating point pivoting.
+        diagnostics : bool
+            Whether or not to return the diagnostics of the run. If so, no
+            warning is issued when the run stops before reaching an
+            equilibrium.
 
         Returns
         -------
         Tuple
-            An equilibria
+            An equilibria or, if diagnostics is True, a `LemkeHowsonResult`:
+            a named tuple of the strategies, the basis of the tableaux, the
+            number of `pivots`, the `dropped_labels`, the `elapsed_time` and
+            the `status` ("equilibrium", "max_pivots" or "cycle").
         """
+        if diagnostics:
+            return lemke_howson_with_diagnostics(
+                *self.payoff_matrices,
+                initial_dropped_label=initial_dropped_label,
+                eliminate_dominated=eliminate_dominated,
+                exact=exact,
+                fraction_free=fraction_free,
+                max_pivots=max_pivots,
+                backend=backend,
+            )
         return lemke_howson(
-            *self.payoff_matrices, initial_dropped_label=initial_dropped_label
+            *self.payoff_matrices,
+            initial_dropped_label=initial_dropped_label,
+            eliminate_dominated=eliminate_dominated,
+            exact=exact,
+            fraction_free=fraction_free,
+            max_pivots=max_pivots,
+            backend=backend,
+        )
+
+    def warm_started_lemke_howson(
+        self,
+        basis=None,
+        strategies=None,
+        initial_dropped_label=0,
+        exact=False,
+        fraction_free=False,
+        max_pivots=None,
+        backend="dense",
+    ):
+        """
+        Obtain a Nash equilibrium using the Lemke Howson algorithm starting
+        from the basis of a previous result or from a pair of strategies.
+
+        This is suited to solving a sequence of games that differ by small
+        perturbations: the basis of the equilibrium of a game is typically
+        that of an equilibrium of the next game which is then obtained
+        without following a path. If the basis does not correspond to an
+        equilibrium, a path is followed from the basis to a nearby
+        equilibrium with Lemke's algorithm. If that fails, or with exact or
+        fraction free pivoting or the sparse backend, the path obtained by
+        dropping the initial dropped label is followed as in
+        `Game.lemke_howson`.
+
+        Parameters
+        ----------
+        basis : Tuple
+            The basis to start from: the `basis` of a previous result.
+        strategies : Tuple
+            A pair of strategies to start from if no basis is given.
+        initial_dropped_label: int
+            The initial dropped label if the path from the artificial
+            equilibrium is followed.
+        exact : bool
+            Whether or not to pivot exactly with fraction free integer
+            pivoting. The equilibria are then arrays of fractions.
+        fraction_free : bool
+            Whether or not to pivot with fraction free integer pivoting
+            and return floating point equilibria.
+        max_pivots : int
+            The maximum number of pivots along the path. By default (None)
+            there is no maximum.
+        backend : str
+            The storage of the tableaux: "dense" (default) or "sparse".
+
+        Returns
+        -------
+        LemkeHowsonResult
+            A named tuple of the strategies, the basis of the equilibrium, a
+            boolean `warm_started` that is True if the equilibrium was
+            obtained from the basis or strategies and the diagnostics of
+            the run: the number of `pivots`, the `dropped_labels`, the
+            `elapsed_time` and the `status`
+            ("equilibrium", "max_pivots" or "cycle").
+        """
+        return warm_started_lemke_howson(
+            *self.payoff_matrices,
+            basis=basis,
+            strategies=strategies,
+            initial_dropped_label=initial_dropped_label,
+            exact=exact,
+            fraction_free=fraction_free,
+            max_pivots=max_pivots,
+            backend=backend,
         )
 
     def fictitious_play(self, iterations, play_counts=None):
@@ -223,7 +609,7 @@ Column player:
             iterations=iterations,
             play_counts=play_counts,
             etha=etha,
-            epsilon_bar=epsilon_bar
+            epsilon_bar=epsilon_bar,
         )
 
     def replicator_dynamics(self, y0=None, timepoints=None, mutation_matrix=None):
@@ -448,6 +834,9 @@ Column player:
         Returns the Nash Equilibrium for a zero sum game by solving the Linear
         Program that corresponds to the minimax theorem.
 
+        The column player's strategy is given by the dual values of the row
+        player's Linear Program so only one Linear Program is solved.
+
         Returns
         -------
         tuple
@@ -461,9 +850,8 @@ Column player:
             raise ValueError(
                 "The Linear Program corresponding to the minimax theorem is defined only for Zero Sum games."
             )
-        A, B = self.payoff_matrices
-        row_strategy = linear_program(row_player_payoff_matrix=A)
-        column_strategy = linear_program(row_player_payoff_matrix=B.T)
+        A, _ = self.payoff_matrices
+        row_strategy, column_strategy, _ = linear_program(row_player_payoff_matrix=A)
         return row_strategy, column_strategy
 
     def regret_minimization(self, learning_rate=0.1, iterations=100):
@@ -0,0 +1,248 @@
+"""Functions for exact fraction free (Bareiss) integer elimination"""
+
+import math
+from fractions import Fraction
+
+import numpy as np
+import numpy.typing as npt
+from typing import Any, Optional
+
+INT64_HEADROOM = 2**31
+
+
+def as_integer_array(M: npt.NDArray) -> npt.NDArray:
+    """
+    Return an integer matrix as an int64 array if its entries can be
+    multiplied and subtracted without overflow and as an array of Python
+    integers otherwise.
+
+    Parameters
+    ----------
+    M : array
+        An integer matrix.
+
+    Returns
+    -------
+    array
+        The matrix with dtype int64 or object.
+    """
+    if M.size == 0:
+        return np.array(M, dtype=np.int64)
+    if M.dtype.kind in "iub":
+        largest = max(abs(int(M.min())), abs(int(M.max())))
+    else:
+        largest = max(abs(int(value)) for value in M.flat)
+    if largest < INT64_HEADROOM:
+        return np.array(M, dtype=np.int64)
+    return np.array([int(value) for value in M.flat], dtype=object).reshape(M.shape)
+
+
+def to_integer_matrix(A: npt.NDArray) -> npt.NDArray:
+    """
+    Scale a matrix of integers, fractions or floats by a positive constant
+    so that all its entries are integers. Floats are converted exactly.
+
+    Multiplying a payoff matrix by a positive constant does not change the
+    equilibria of a game.
+
+    Parameters
+    ----------
+    A : array
+        The matrix.
+
+    Returns
+    -------
+    array
+        The integer matrix with dtype int64 or object (see
+        `as_integer_array`).
+    """
+    A = np.asarray(A)
+    if A.dtype.kind in "iub":
+        return as_integer_array(A)
+    entries = [Fraction(value) for value in A.flat]
+    scale = math.lcm(*(entry.denominator for entry in entries))
+    integers = np.array([int(entry * scale) for entry in entries], dtype=object)
+    return as_integer_array(integers.reshape(A.shape))
+
+
+def bareiss_pivot(
+    M: npt.NDArray, row: int, column: int, previous_pivot: Any = 1
+) -> npt.NDArray:
+    """
+    Perform a fraction free pivot on an integer matrix: every row but the
+    pivot row is multiplied by the pivot element, has the pivot row times
+    its entry in the pivot column removed and is divided by the previous
+    pivot element. This division is exact so the entries remain integers
+    (they are minors of the original matrix) and do not grow without bound.
+
+    If the int64 entries could overflow, the pivot is carried out with Python
+    integers instead.
+
+    Parameters
+    ----------
+    M : array
+        The integer matrix with dtype int64 or object.
+    row : int
+        The pivot row.
+    column : int
+        The pivot column.
+    previous_pivot : Any
+        The pivot element of the previous pivot (1 for the first pivot).
+
+    Returns
+    -------
+    array
+        The pivoted matrix. A new array is returned as its dtype may change.
+    """
+    if M.dtype != object and np.abs(M).max() >= INT64_HEADROOM:
+        M = M.astype(object)
+    pivot_row = M[row].copy()
+    pivoted = (M * M[row, column] - np.outer(M[:, column], pivot_row)) // (
+        previous_pivot
+    )
+    pivoted[row] = pivot_row
+    return pivoted
+
+
+def bareiss_solve(M: npt.NDArray, b: npt.NDArray) -> Optional[npt.NDArray]:
+    """
+    Solve the square integer linear system M x = b exactly using fraction
+    free Gauss-Jordan elimination.
+
+    Parameters
+    ----------
+    M : array
+        A square integer matrix.
+    b : array
+        An integer vector.
+
+    Returns
+    -------
+    Optional[array]
+        The solution as an array of fractions or None if M is singular.
+    """
+    augmented = as_integer_array(np.column_stack((M, b)))
+    previous_pivot: Any = 1
+    for k in range(len(augmented)):
+        candidates = np.flatnonzero(augmented[k:, k])
+        if len(candidates) == 0:
+            return None
+        pivot_row = k + candidates[0]
+        augmented[[k, pivot_row]] = augmented[[pivot_row, k]]
+        augmented = bareiss_pivot(augmented, k, k, previous_pivot)
+        previous_pivot = augmented[k, k]
+    determinant = int(previous_pivot)
+    return np.array(
+        [Fraction(int(value), determinant) for value in augmented[:, -1]],
+        dtype=object,
+    )
+
+
+def exact_ratios(numerators: npt.NDArray, denominators: npt.NDArray) -> npt.NDArray:
+    """
+    Return the exact element wise ratios of two integer arrays.
+
+    A division of a non zero value by zero gives an infinity of the sign of
+    the numerator and zero divided by zero gives minus infinity so that it is
+    never the largest ratio.
+
+    Parameters
+    ----------
+    numerators : array
+        The integer numerators.
+    denominators : array
+        The integer denominators.
+
+    Returns
+    -------
+    array
+        The ratios as an array of fractions and infinities.
+    """
+    numerators, denominators = np.broadcast_arrays(numerators, denominators)
+    ratios = np.empty(numerators.shape, dtype=object)
+    for index, numerator in np.ndenumerate(numerators):
+        denominator = int(denominators[index])
+        if denominator != 0:
+            ratios[index] = Fraction(int(numerator), denominator)
+        elif numerator > 0:
+            ratios[index] = np.inf
+        else:
+            ratios[index] = -np.inf
+    return ratios
+
+
+def approximate_ratios(
+    numerators: npt.NDArray, denominators: npt.NDArray
+) -> npt.NDArray:
+    """
+    Return floating point approximations of the element wise ratios of two
+    integer vectors with the same conventions as `exact_ratios`.
+
+    Each ratio is obtained with a single division so that it is correctly
+    rounded when the integers are exactly represented as floats. Python
+    integers of any size are divided without being converted to floats.
+
+    Parameters
+    ----------
+    numerators : array
+        The integer numerators.
+    denominators : array
+        The integer denominators.
+
+    Returns
+    -------
+    array
+        The approximate ratios as floats.
+    """
+    if numerators.dtype != object and denominators.dtype != object:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = numerators / denominators
+        ratios[np.isnan(ratios)] = -np.inf
+        return ratios
+    return np.array(
+        [
+            (
+                numerator / denominator
+                if denominator != 0
+                else (np.inf if numerator > 0 else -np.inf)
+            )
+            for numerator, denominator in zip(numerators, denominators)
+        ],
+        dtype=float,
+    )
+
+
+def largest_ratio_rows(
+    numerators: npt.NDArray, denominators: npt.NDArray
+) -> npt.NDArray:
+    """
+    Find the entries at which the exact ratio of two integer vectors (see
+    `exact_ratios`) is largest.
+
+    The ratios are first compared as floats and only the ratios that are
+    close to the largest one are compared exactly.
+
+    Parameters
+    ----------
+    numerators : array
+        The integer numerators.
+    denominators : array
+        The integer denominators.
+
+    Returns
+    -------
+    array
+        A boolean array indicating the entries with the largest ratio.
+    """
+    approximations = approximate_ratios(numerators, denominators)
+    largest = approximations.max()
+    candidates = np.flatnonzero(
+        (approximations == largest)
+        | np.isclose(approximations, largest, rtol=10**-9, atol=0)
+    )
+    if len(candidates) > 1 and np.isfinite(largest):
+        ratios = exact_ratios(numerators[candidates], denominators[candidates])
+        candidates = candidates[ratios == max(ratios)]
+    rows = np.zeros(len(approximations), dtype=bool)
+    rows[candidates] = True
+    return rows
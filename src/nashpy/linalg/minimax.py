@@ -5,6 +5,7 @@ This module contains
 import numpy as np
 import numpy.typing as npt
 import scipy.optimize
+from typing import Optional, Tuple
 
 
 def get_c(number_of_rows: int) -> npt.NDArray:
@@ -102,10 +103,16 @@ def get_bounds(number_of_rows: int) -> list:
     return [(0, None) for _ in range(number_of_rows)] + [(None, None)]
 
 
-def linear_program(row_player_payoff_matrix: npt.NDArray) -> npt.NDArray:
+def linear_program(
+    row_player_payoff_matrix: npt.NDArray,
+) -> Tuple[npt.NDArray, npt.NDArray, float]:
     """
     The Linear Program that corresponds to the minimax theorem. This builds and
-    returns the row players' strategy.
+    solves the row player's linear program.
+
+    The column player's linear program is its dual: the column player's
+    minmax strategy is given by the marginals (the dual values) of the upper
+    bound constraints, so both strategies are obtained from a single solve.
 
     Parameters
     ----------
@@ -113,8 +120,9 @@ def linear_program(row_player_payoff_matrix: npt.NDArray) -> npt.NDArray:
         The payoff matrix
     Returns
     -------
-    array
-        The row player maxmin strategy
+    tuple
+        The row player maxmin strategy, the column player minmax strategy and
+        the value of the game to the row player.
     """
     number_of_rows, number_of_columns = row_player_payoff_matrix.shape
     c = get_c(number_of_rows=number_of_rows)
@@ -131,5 +139,242 @@ def linear_program(row_player_payoff_matrix: npt.NDArray) -> npt.NDArray:
         A_eq=A_eq,
         b_eq=b_eq,
         bounds=bounds,
+        method="highs",
     )
-    return res.x[:-1]
+    # The marginals of the upper bound constraints are minus the column
+    # player's strategy. Adding 0 turns negative zeros into zeros.
+    return res.x[:-1], -res.ineqlin.marginals + 0, float(res.x[-1] + 0)
+
+
+class ZeroSumSolver(object):
+    """
+    A solver of zero sum games that keeps the optimal basis of the linear
+    program of the last game solved and starts from it when solving the
+    next game, so that a stream of games with slowly changing payoffs is
+    solved in a few pivots.
+
+    The payoffs are shifted so that they are positive, which does not change
+    the optimal strategies, and the column player's linear program:
+
+        max 1w such that Aw + s = 1, w >= 0, s >= 0
+
+    is solved with the revised simplex method. Its optimal w divided by its
+    sum is the column player's strategy, its dual (the row player's linear
+    program) gives the row player's strategy and the inverse of the sum of w
+    is the value of the game.
+
+    If the previous basis is feasible for the new game, the primal simplex
+    method is carried on from it. If it is not feasible but still optimal
+    for the new objective (its reduced costs are not positive), the dual
+    simplex method restores feasibility. Otherwise the solve starts from the
+    basis of the slack variables. Pivots follow Bland's rule so that they do
+    not cycle.
+    """
+
+    def __init__(self, tol: float = 10**-9):
+        """
+        Constructs a solver without a basis.
+
+        Parameters
+        ----------
+        tol : float
+            The tolerance used to check the signs of the values and reduced
+            costs.
+        """
+        self.tol = tol
+        self.basis: Optional[npt.NDArray] = None
+        self.pivots = 0
+        self.warm_started = False
+
+    def reset(self) -> None:
+        """
+        Forget the basis so that the next game is solved from the basis of
+        the slack variables.
+        """
+        self.basis = None
+
+    def _starting_basis(self, M: npt.NDArray) -> Tuple[npt.NDArray, npt.NDArray]:
+        """
+        Return the previous basis and its inverse if it can be used for the
+        constraint matrix M and otherwise the basis of the slack variables.
+
+        Parameters
+        ----------
+        M : array
+            The constraint matrix [A | I].
+
+        Returns
+        -------
+        Tuple
+            The basic variables and the inverse of the basis.
+        """
+        number_of_rows, number_of_variables = M.shape
+        self.warm_started = False
+        if self.basis is not None and len(self.basis) == number_of_rows:
+            if self.basis.max() < number_of_variables:
+                try:
+                    inverse = np.linalg.inv(M[:, self.basis])
+                    # A nearly singular basis gives an inaccurate inverse
+                    # without raising an error.
+                    self.warm_started = bool(
+                        np.all(np.isfinite(inverse))
+                        and np.allclose(
+                            M[:, self.basis] @ inverse, np.eye(number_of_rows)
+                        )
+                    )
+                except np.linalg.LinAlgError:
+                    pass
+        if self.warm_started:
+            return self.basis.copy(), inverse  # type: ignore
+        basis = np.arange(number_of_variables - number_of_rows, number_of_variables)
+        return basis, np.eye(number_of_rows)
+
+    def _simplex(
+        self,
+        M: npt.NDArray,
+        c: npt.NDArray,
+        basis: npt.NDArray,
+        inverse: npt.NDArray,
+    ) -> Optional[Tuple[npt.NDArray, npt.NDArray]]:
+        """
+        Pivot from a basis until it is optimal for max cz such that Mz = 1,
+        z >= 0: with the dual simplex method while the basis is not
+        feasible and then with the primal simplex method.
+
+        Parameters
+        ----------
+        M : array
+            The constraint matrix [A | I].
+        c : array
+            The objective.
+        basis : array
+            The basic variables, either feasible or with non positive
+            reduced costs.
+        inverse : array
+            The inverse of the basis.
+
+        Returns
+        -------
+        Optional[Tuple]
+            The optimal basic variables and the inverse of the basis or None
+            if the dual simplex method finds no entering variable (the
+            linear program is not feasible or the inverse is inaccurate).
+        """
+        while True:
+            values = inverse.sum(axis=1)
+            duals = c[basis] @ inverse
+            reduced_costs = c - duals @ M
+            reduced_costs[basis] = 0
+            infeasible = np.flatnonzero(values < -self.tol)
+            if len(infeasible) > 0:
+                # Dual simplex: the negative basic variable with the smallest
+                # index leaves the basis and the ratio test keeps the reduced
+                # costs non positive.
+                row = infeasible[np.argmin(basis[infeasible])]
+                pivot_row = inverse[row] @ M
+                candidates = np.flatnonzero(pivot_row < -self.tol)
+                if len(candidates) == 0:
+                    return None
+                ratios = reduced_costs[candidates] / pivot_row[candidates]
+                column = candidates[np.argmax(ratios <= ratios.min() + self.tol)]
+                direction = inverse @ M[:, column]
+            else:
+                # Primal simplex: the variable with the smallest index among
+                # those with a positive reduced cost enters the basis.
+                improving = np.flatnonzero(reduced_costs > self.tol)
+                if len(improving) == 0:
+                    return basis, inverse
+                column = improving[0]
+                direction = inverse @ M[:, column]
+                candidates = np.flatnonzero(direction > self.tol)
+                ratios = values[candidates] / direction[candidates]
+                ties = candidates[ratios <= ratios.min() + self.tol]
+                row = ties[np.argmin(basis[ties])]
+            pivot_inverse_row = inverse[row] / direction[row]
+            inverse = inverse - np.outer(direction, pivot_inverse_row)
+            inverse[row] = pivot_inverse_row
+            basis[row] = column
+            self.pivots += 1
+
+    def _is_optimal(self, M: npt.NDArray, c: npt.NDArray, basis: npt.NDArray) -> bool:
+        """
+        Check that a basis is feasible and optimal for max cz such that
+        Mz = 1, z >= 0 by solving for its values and dual values (rather
+        than using the inverse updated by the pivots).
+
+        Parameters
+        ----------
+        M : array
+            The constraint matrix [A | I].
+        c : array
+            The objective.
+        basis : array
+            The basic variables.
+
+        Returns
+        -------
+        bool
+            Whether or not the basis is optimal.
+        """
+        try:
+            values = np.linalg.solve(M[:, basis], np.ones(len(basis)))
+            duals = np.linalg.solve(M[:, basis].transpose(), c[basis])
+        except np.linalg.LinAlgError:
+            return False
+        reduced_costs = c - duals @ M
+        reduced_costs[basis] = 0
+        return bool(np.all(values >= -self.tol) and np.all(reduced_costs <= self.tol))
+
+    def solve(self, A: npt.NDArray) -> Tuple[npt.NDArray, npt.NDArray, float]:
+        """
+        Solve the zero sum game with row player payoff matrix A.
+
+        If the solve from the previous basis fails or does not give a
+        feasible and optimal basis, the game is solved again from the basis
+        of the slack variables.
+
+        Parameters
+        ----------
+        A : array
+            The row player payoff matrix.
+
+        Returns
+        -------
+        Tuple
+            The row player's maxmin strategy, the column player's minmax
+            strategy and the value of the game to the row player.
+        """
+        A = np.asarray(A, dtype=float)
+        number_of_rows, number_of_columns = A.shape
+        shift = 1 - A.min()
+        M = np.hstack((A + shift, np.eye(number_of_rows)))
+        c = np.concatenate((np.ones(number_of_columns), np.zeros(number_of_rows)))
+        slack_basis = np.arange(number_of_columns, number_of_columns + number_of_rows)
+        basis, inverse = self._starting_basis(M)
+        values = inverse.sum(axis=1)
+        reduced_costs = c - (c[basis] @ inverse) @ M
+        reduced_costs[basis] = 0
+        if not np.all(values >= -self.tol) and np.any(reduced_costs > self.tol):
+            basis, inverse = slack_basis.copy(), np.eye(number_of_rows)
+            self.warm_started = False
+        self.pivots = 0
+        optimum = self._simplex(M, c, basis, inverse)
+        if self.warm_started and (
+            optimum is None or not self._is_optimal(M, c, optimum[0])
+        ):
+            self.warm_started = False
+            optimum = self._simplex(M, c, slack_basis, np.eye(number_of_rows))
+        basis, inverse = optimum  # type: ignore
+        self.basis = basis
+        values = inverse.sum(axis=1)
+        duals = c[basis] @ inverse
+        column_weights = np.zeros(number_of_rows + number_of_columns)
+        column_weights[basis] = np.maximum(values, 0)
+        column_weights = column_weights[:number_of_columns]
+        row_weights = np.maximum(duals, 0)
+        total = column_weights.sum()
+        return (
+            row_weights / row_weights.sum(),
+            column_weights / total,
+            float(1 / total - shift),
+        )
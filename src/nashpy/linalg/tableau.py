@@ -1,12 +1,33 @@
 """A class for the tableaus used in the Lemke Howson algorithms"""
 
 import warnings
+from fractions import Fraction
+
 import numpy as np
 import numpy.typing as npt
-from typing import Set, List, Iterable, Optional
-
-
-def create_row_tableau(payoffs: npt.NDArray, lexicographic=True):
+import scipy.sparse
+from typing import Any, Set, List, Iterable, Optional, Tuple
+
+from .bareiss import (
+    as_integer_array,
+    bareiss_pivot,
+    exact_ratios,
+    largest_ratio_rows,
+    to_integer_matrix,
+)
+
+RESCALE_THRESHOLD = 2.0**256
+ZERO_TOLERANCE = 2.0**-44
+
+
+def create_row_tableau(
+    payoffs: npt.NDArray,
+    lexicographic=True,
+    exact=False,
+    fraction_free=False,
+    backend="dense",
+    normalise=False,
+):
     """
     Creates a row tableau
 
@@ -16,18 +37,46 @@ def create_row_tableau(payoffs: npt.NDArray, lexicographic=True):
         The payoff matrix, typically for column (B) player
     lexicographic : bool
         Whether the tableau should use lex sorting to handle degenerate games
+    exact : bool
+        Whether the tableau should use exact fraction free integer pivoting
+    fraction_free : bool
+        Whether the tableau should use fraction free integer pivoting with
+        floating point strategies
+    backend : str
+        Whether the tableau is a "dense" array or a "sparse" matrix (see
+        `SparseTableau`)
+    normalise : bool
+        Whether the rows of a floating point tableau are cleaned and rescaled
+        after each pivot (see `Tableau._normalise_rows`)
     Returns
     -------
     Tableau
         The corresponding row tableau for the payoff matrix
     """
-    tableau = _build_tableau_matrix(payoffs.transpose(), False)
+    if _is_sparse_backend(backend, exact or fraction_free):
+        tableau = _build_sparse_tableau_matrix(payoffs.transpose(), False)
+        non_basic_variables = range(payoffs.shape[0])
+        if lexicographic:
+            return SparseTableauLex(tableau, non_basic_variables, normalise)
+        return SparseTableau(tableau, non_basic_variables, normalise)
+    tableau = _build_tableau_matrix(payoffs.transpose(), False, exact or fraction_free)
     if lexicographic:
-        return TableauLex(tableau)
-    return Tableau(tableau)
-
-
-def create_col_tableau(payoffs: npt.NDArray, lexicographic=False):
+        return TableauLex(
+            tableau, exact=exact, fraction_free=fraction_free, normalise=normalise
+        )
+    return Tableau(
+        tableau, exact=exact, fraction_free=fraction_free, normalise=normalise
+    )
+
+
+def create_col_tableau(
+    payoffs: npt.NDArray,
+    lexicographic=False,
+    exact=False,
+    fraction_free=False,
+    backend="dense",
+    normalise=False,
+):
     """
     Creates a column tableau
 
@@ -37,18 +86,120 @@ def create_col_tableau(payoffs: npt.NDArray, lexicographic=False):
         The payoff matrix, typically for row (A) player
     lexicographic : bool
         Whether the tableau should use lex sorting to handle degenerate games
+    exact : bool
+        Whether the tableau should use exact fraction free integer pivoting
+    fraction_free : bool
+        Whether the tableau should use fraction free integer pivoting with
+        floating point strategies
+    backend : str
+        Whether the tableau is a "dense" array or a "sparse" matrix (see
+        `SparseTableau`)
+    normalise : bool
+        Whether the rows of a floating point tableau are cleaned and rescaled
+        after each pivot (see `Tableau._normalise_rows`)
     Returns
     -------
     Tableau
         The corresponding column tableau for the payoff matrix
     """
-    tableau = _build_tableau_matrix(payoffs, True)
+    if _is_sparse_backend(backend, exact or fraction_free):
+        tableau = _build_sparse_tableau_matrix(payoffs, True)
+        non_basic_variables = range(payoffs.shape[0], sum(payoffs.shape))
+        if lexicographic:
+            return SparseTableauLex(tableau, non_basic_variables, normalise)
+        return SparseTableau(tableau, non_basic_variables, normalise)
+    tableau = _build_tableau_matrix(payoffs, True, exact or fraction_free)
     if lexicographic:
-        return TableauLex(tableau)
-    return Tableau(tableau)
+        return TableauLex(
+            tableau, exact=exact, fraction_free=fraction_free, normalise=normalise
+        )
+    return Tableau(
+        tableau, exact=exact, fraction_free=fraction_free, normalise=normalise
+    )
 
 
-def _build_tableau_matrix(payoffs: npt.NDArray, shifted: bool) -> npt.NDArray:
+def create_covering_tableau(row_tableau: "Tableau", col_tableau: "Tableau"):
+    """
+    Creates a tableau of both polytopes with a covering variable, for
+    Lemke's algorithm (see `follow_lemke_path`), from a pair of dense
+    floating point tableaux.
+
+    The rows of the row tableau are followed by those of the column tableau.
+    The variables of the row tableau keep their indices, the variables of
+    the column tableau are shifted by the number of labels and the last
+    variable is the covering variable, whose column is zero. The label of a
+    variable is its index modulo the number of labels. The basis and the
+    number of pivots are those of both tableaux and the rows are cleaned
+    and rescaled after each pivot (see `Tableau._normalise_rows`).
+
+    Parameters
+    ----------
+    row_tableau : Tableau
+        The row player tableau
+    col_tableau : Tableau
+        The column player tableau
+    Returns
+    -------
+    Tableau
+        The tableau of both polytopes, with lex sorting if the row tableau
+        uses it
+    """
+    number_of_labels = row_tableau._number_of_labels
+    number_of_columns = row_tableau._tableau.shape[0]
+    tableau = np.zeros((number_of_labels, 2 * number_of_labels + 2))
+    tableau[:number_of_columns, :number_of_labels] = row_tableau._tableau[:, :-1]
+    tableau[number_of_columns:, number_of_labels:-2] = col_tableau._tableau[:, :-1]
+    tableau[:number_of_columns, -1] = row_tableau._column(-1)
+    tableau[number_of_columns:, -1] = col_tableau._column(-1)
+    original_basic_labels = row_tableau._original_basic_labels.union(
+        label + number_of_labels for label in col_tableau._original_basic_labels
+    )
+    original_basic_labels.add(2 * number_of_labels)
+    tableau_class = TableauLex if isinstance(row_tableau, TableauLex) else Tableau
+    covering_tableau = tableau_class(tableau, original_basic_labels, normalise=True)
+    covering_tableau._is_basic = np.concatenate(
+        (row_tableau._is_basic, col_tableau._is_basic, [False])
+    )
+    covering_tableau._basis = np.concatenate(
+        (row_tableau._basis, col_tableau._basis + number_of_labels)
+    )
+    covering_tableau.pivots = row_tableau.pivots + col_tableau.pivots
+    return covering_tableau
+
+
+def _is_sparse_backend(backend: str, integer_pivoting: bool) -> bool:
+    """
+    Checks the backend of a tableau.
+
+    Parameters
+    ----------
+    backend : str
+        The backend: "dense" or "sparse".
+    integer_pivoting : bool
+        Whether the tableau should use exact or fraction free integer
+        pivoting.
+
+    Returns
+    -------
+    bool
+        Whether or not the backend is sparse.
+
+    Raises
+    ------
+    ValueError
+        If the backend is not known or if it is sparse and integer pivoting
+        is requested.
+    """
+    if backend not in ("dense", "sparse"):
+        raise ValueError("backend must be one of dense or sparse.")
+    if backend == "sparse" and integer_pivoting:
+        raise ValueError("The sparse backend only supports floating point pivoting.")
+    return backend == "sparse"
+
+
+def _build_tableau_matrix(
+    payoffs: npt.NDArray, shifted: bool, exact: bool = False
+) -> npt.NDArray:
     """
     Build the tableau matrix from payoff. Can be shifted to preserve label indices.
     As required in lemke howson, payoffs are ensured to be positive.
@@ -60,30 +211,83 @@ def _build_tableau_matrix(payoffs: npt.NDArray, shifted: bool) -> npt.NDArray:
         The payoff matrix
     shifted : bool
         When True, first indices will be slack vars
+    exact : bool
+        When True, the payoffs are scaled to integers and the tableau is an
+        integer matrix
 
     Returns
     -------
     array
         the tableau matrix
     """
+    if exact:
+        payoffs = to_integer_matrix(payoffs).astype(object)
     if np.min(payoffs) <= 0:
         payoffs = payoffs + abs(np.min(payoffs)) + 1
     slack_vars = np.eye(payoffs.shape[0])
     targets = np.ones((payoffs.shape[0], 1))
+    if exact:
+        slack_vars = slack_vars.astype(int)
+        targets = targets.astype(int)
+        if shifted:
+            return as_integer_array(
+                np.concatenate([slack_vars, payoffs, targets], axis=1)
+            )
+        return as_integer_array(np.concatenate([payoffs, slack_vars, targets], axis=1))
     if shifted:
         return np.concatenate([slack_vars, payoffs, targets], axis=1)
     return np.concatenate([payoffs, slack_vars, targets], axis=1)
 
 
+def _build_sparse_tableau_matrix(payoffs: Any, shifted: bool) -> Any:
+    """
+    Build the tableau matrix from payoff as a sparse matrix. Can be shifted
+    to preserve label indices.
+
+    The polytope of a tableau is bounded if the payoffs are non negative and
+    each column has a positive entry. Unlike `_build_tableau_matrix`, the
+    payoffs are then not shifted so that their zeros are preserved.
+    Otherwise they are made positive as for a dense tableau, and the
+    tableau is then dense.
+
+    Parameters
+    ----------
+    payoffs : Any
+        The payoff matrix: an array or a scipy sparse matrix
+    shifted : bool
+        When True, first indices will be slack vars
+
+    Returns
+    -------
+    csc_matrix
+        the tableau matrix
+    """
+    payoffs = scipy.sparse.csc_matrix(payoffs, dtype=float)
+    if payoffs.min() < 0 or np.any(payoffs.max(axis=0).toarray() <= 0):
+        payoffs = scipy.sparse.csc_matrix(payoffs.toarray() + abs(payoffs.min()) + 1)
+    slack_vars = scipy.sparse.identity(payoffs.shape[0], format="csc")
+    targets = scipy.sparse.csc_matrix(np.ones((payoffs.shape[0], 1)))
+    if shifted:
+        return scipy.sparse.hstack([slack_vars, payoffs, targets], format="csc")
+    return scipy.sparse.hstack([payoffs, slack_vars, targets], format="csc")
+
+
 class Tableau(object):
     """
     An implementation of a standard Tableau
     Tableaus are well known in linear optimizations
     problems and e.g. part of the simplex algorithm.
+
+    The number of pivots carried out is counted by the `pivots` attribute.
     """
 
     def __init__(
-        self, tableau: npt.NDArray, original_basic_labels: Optional[Iterable] = None
+        self,
+        tableau: npt.NDArray,
+        original_basic_labels: Optional[Iterable] = None,
+        exact: bool = False,
+        fraction_free: bool = False,
+        normalise: bool = False,
     ):
         """
         Constructs a Tableau for solving lemke-howson algorithm.
@@ -96,12 +300,100 @@ class Tableau(object):
             By default this corresponds to the non-basic variables.
             There should be no need to override this unless tableau
             matrix was manipulated prior to calling constructor
+        exact : bool
+            Whether the tableau is an integer matrix to pivot exactly using
+            fraction free pivoting. Ratios and strategies are then fractions.
+        fraction_free : bool
+            Whether the tableau is an integer matrix to pivot using fraction
+            free pivoting: each pivot divides by the previous pivot element
+            which keeps the entries bounded. The ratio tests are exact and
+            the strategies are floats. This is implied by exact.
+        normalise : bool
+            Whether the rows of a floating point tableau are cleaned and
+            rescaled after each pivot (see `_normalise_rows`). This is used
+            when paths are followed from equilibria for long sequences of
+            pivots.
         """
-        self._tableau = tableau
+        self._tableau: Any = tableau
+        self._exact = exact
+        self._fraction_free = fraction_free or exact
+        self._normalise = normalise
+        self._previous_pivot: Any = 1
+        self.pivots = 0
+        self._number_of_labels = tableau.shape[1] - 1
+        self._is_basic, self._basis = self._find_basis()
         if original_basic_labels is not None:
             self._original_basic_labels = set(original_basic_labels)
         else:
             self._original_basic_labels = self.non_basic_variables
+        self._slack_variables = np.array(sorted(self.slack_variables), dtype=int)
+        if not self._fraction_free and isinstance(tableau, np.ndarray):
+            self._outer_product = np.empty_like(tableau)
+
+    def _find_basis(self) -> Tuple[npt.NDArray, npt.NDArray]:
+        """
+        Identifies the basic variables from the structure of the tableau:
+        a variable is basic if its column has a single non zero entry.
+
+        This is only done once. The basis is then updated by each pivot.
+
+        Returns
+        -------
+        Tuple
+            A boolean array indicating if each variable is basic and an
+            array with the basic variable of each row (-1 if no column has
+            a single non zero entry in that row).
+        """
+        is_basic = np.count_nonzero(self._tableau[:, :-1] != 0, axis=0) == 1
+        basis = np.full(self._tableau.shape[0], -1, dtype=int)
+        for column in np.flatnonzero(is_basic)[::-1]:
+            basis[np.flatnonzero(self._tableau[:, column] != 0)[0]] = column
+        return is_basic, basis
+
+    def _column(self, column_index: int) -> npt.NDArray:
+        """
+        Returns a column of the tableau.
+
+        Parameters
+        ----------
+        column_index : int
+            The index of the column (-1 for the right hand side).
+
+        Returns
+        -------
+        array
+            The column
+        """
+        return self._tableau[:, column_index]
+
+    def _block(self, rows: npt.NDArray, columns: npt.NDArray) -> npt.NDArray:
+        """
+        Returns the entries of the tableau in given rows and columns.
+
+        Parameters
+        ----------
+        rows : array
+            The indices of the rows.
+        columns : array
+            The indices of the columns.
+
+        Returns
+        -------
+        array
+            The block of the tableau
+        """
+        return self._tableau[np.ix_(rows, columns)]
+
+    def _basic_entries(self) -> npt.NDArray:
+        """
+        Returns the entry of each row in the column of its basic variable.
+
+        Returns
+        -------
+        array
+            The entries
+        """
+        return self._tableau[np.arange(self._tableau.shape[0]), self._basis]
 
     @property
     def labels(self) -> Set:
@@ -113,9 +405,36 @@ class Tableau(object):
         Set
             All lables
         """
-        h, w = self._tableau.shape
-        real_w = w - h - 1
-        return set(range(h + real_w))
+        return set(range(self._number_of_labels))
+
+    def is_non_basic(self, label: int) -> bool:
+        """
+        Checks if a variable is non basic (and so if the corresponding
+        label is a basic label) in constant time.
+
+        Parameters
+        ----------
+        label : int
+            The index of the variable.
+
+        Returns
+        -------
+        bool
+            Whether or not the variable is non basic.
+        """
+        return not self._is_basic[label]
+
+    @property
+    def basis_key(self) -> bytes:
+        """
+        A hashable key of the basis of the tableau that is cheap to obtain.
+
+        Returns
+        -------
+        bytes
+            Whether or not each variable is basic, as bytes.
+        """
+        return self._is_basic.tobytes()
 
     @property
     def non_basic_variables(self) -> Set:
@@ -128,9 +447,7 @@ class Tableau(object):
         Set
             The indices of the non basic variables.
         """
-
-        columns = self._tableau[:, :-1].transpose()
-        return set(np.where([np.count_nonzero(col) != 1 for col in columns])[0])
+        return set(np.flatnonzero(~self._is_basic).tolist())
 
     @property
     def basic_variables(self) -> Set:
@@ -143,7 +460,7 @@ class Tableau(object):
         Set
             The indices of the basic variables.
         """
-        return self.labels - self.non_basic_variables
+        return set(np.flatnonzero(self._is_basic).tolist())
 
     @property
     def slack_variables(self) -> Set:
@@ -174,30 +491,43 @@ class Tableau(object):
         int
             The row to pivot against
         """
-        row_ratios = self._tableau[:, column_index] / self._tableau[:, -1]
+        if self._fraction_free:
+            return int(
+                np.argmax(
+                    largest_ratio_rows(self._column(column_index), self._column(-1))
+                )
+            )
+        row_ratios = self._ratios(self._column(column_index), self._column(-1))
         return int(np.argmax(row_ratios))
 
-    def _pivot_on_column(self, column_index: int):
+    def _ratios(self, numerators: npt.NDArray, denominators: npt.NDArray):
         """
-        Perform a column pivot, returning the row/dropped label
+        Divides two arrays of the tableau element wise. For a fraction free
+        tableau the ratios are fractions (see `exact_ratios`).
 
         Parameters
         ----------
-        column_index : int
-            The column/label to pivot.
+        numerators : array
+            The numerators.
+        denominators : array
+            The denominators.
 
         Returns
         -------
-        int
-            The row chosen to pivot against
+        array
+            The ratios
         """
-        pivot_row_index = self._find_pivot_row(column_index)
-        self._pivot(column_index, pivot_row_index)
-        return pivot_row_index
+        if self._fraction_free:
+            return exact_ratios(numerators, denominators)
+        return numerators / denominators
 
     def _pivot(self, column_index: int, pivot_row_index: int):
         """
-        Perform row operations to drop column from all but the pivot row
+        Perform row operations to drop column from all but the pivot row.
+
+        Every row is multiplied by the pivot element and has the pivot row
+        times its entry in the pivot column removed with a single in place
+        outer product update, after which the pivot row is restored.
 
         Parameters
         ----------
@@ -206,28 +536,78 @@ class Tableau(object):
         pivot_row_index : int
             The row to pivot
         """
-        for i in range(self._tableau.shape[0]):
-            if i != pivot_row_index:
-                self._apply_pivot(column_index, pivot_row_index, i)
-
-    def _apply_pivot(self, pivot_col: int, pivot_row: int, applying_row: int):
+        if self._fraction_free:
+            self._fraction_free_pivot(column_index, pivot_row_index)
+            return
+        pivot_row = self._tableau[pivot_row_index].copy()
+        np.outer(self._tableau[:, column_index], pivot_row, out=self._outer_product)
+        self._tableau *= pivot_row[column_index]
+        self._tableau -= self._outer_product
+        self._tableau[pivot_row_index] = pivot_row
+        if self._normalise:
+            self._normalise_rows()
+
+    def _normalise_rows(self):
+        """
+        Clean and rescale the rows of a floating point tableau after a pivot.
+
+        The entries that are within rounding error of zero relative to the
+        largest entry of their row are set to zero: such an entry in the
+        pivot column or the last column would otherwise decide the ratio test
+        with its sign. The rows whose entries are very large or very small
+        are then multiplied by powers of two so that repeated pivots do not
+        overflow or underflow.
+
+        Multiplying a row by a positive constant does not change the ratios,
+        the labels or the strategies and multiplying by a power of two is
+        exact.
         """
-        Dropping pivot value on the applying row
+        largest = np.abs(self._tableau).max(axis=1)
+        self._tableau[
+            np.abs(self._tableau) <= ZERO_TOLERANCE * largest[:, np.newaxis]
+        ] = 0
+        rows = (largest > RESCALE_THRESHOLD) | (
+            (largest > 0) & (largest < 1 / RESCALE_THRESHOLD)
+        )
+        if not rows.any():
+            return
+        _, exponents = np.frexp(largest[rows])
+        self._tableau[rows] *= np.ldexp(1.0, -exponents)[:, np.newaxis]
+
+    def _fraction_free_pivot(self, column_index: int, pivot_row_index: int):
+        """
+        Perform a fraction free pivot (see `bareiss_pivot`).
+
+        After each fraction free pivot the column of a basic variable is the
+        pivot element times a unit vector. Such a column that is not that of
+        the dropped variable only has its entry in its row updated, the
+        other columns are pivoted.
 
         Parameters
         ----------
-        pivot_col : int
+        column_index : int
             The column/label to pivot.
-        pivot_row : int
+        pivot_row_index : int
             The row to pivot
-        applying_row : int
-            The row to drop pivot column from
         """
-        pivot_element = self._tableau[pivot_row, pivot_col]
-        row_pivot_val = self._tableau[applying_row, pivot_col]
-        row = self._tableau[applying_row, :] * pivot_element
-        row -= self._tableau[pivot_row, :] * row_pivot_val
-        self._tableau[applying_row, :] = row
+        rows = np.flatnonzero(self._basis >= 0)
+        rows = rows[rows != pivot_row_index]
+        rows = rows[self._tableau[rows, self._basis[rows]] == self._previous_pivot]
+        pivoted_columns = np.ones(self._tableau.shape[1], dtype=bool)
+        pivoted_columns[self._basis[rows]] = False
+        columns = np.flatnonzero(pivoted_columns)
+
+        pivoted = bareiss_pivot(
+            self._tableau[:, columns],
+            pivot_row_index,
+            int(np.searchsorted(columns, column_index)),
+            self._previous_pivot,
+        )
+        if pivoted.dtype != self._tableau.dtype:
+            self._tableau = self._tableau.astype(pivoted.dtype)
+        self._tableau[:, columns] = pivoted
+        self._previous_pivot = self._tableau[pivot_row_index, column_index]
+        self._tableau[rows, self._basis[rows]] = self._previous_pivot
 
     def pivot_and_drop_label(self, column_index: int) -> int:
         """
@@ -243,21 +623,154 @@ class Tableau(object):
         int
             The dropped label.
         """
-        prev_basic_vars = self.basic_variables
-        row = self._pivot_on_column(column_index)
-        dropped = self._find_dropped(row, prev_basic_vars)
+        return self._pivot_and_update_basis(
+            column_index, self._find_pivot_row(column_index)
+        )
+
+    def _pivot_and_update_basis(self, column_index: int, pivot_row_index: int) -> int:
+        """
+        Pivots the tableau on a given row and updates the basis.
+
+        Parameters
+        ----------
+        column_index : int
+            The column/label to pivot.
+        pivot_row_index : int
+            The row to pivot
+
+        Returns
+        -------
+        int
+            The dropped label.
+        """
+        dropped = self._find_dropped(pivot_row_index)
+        self._pivot(column_index, pivot_row_index)
+        self._is_basic[dropped] = False
+        self._is_basic[column_index] = True
+        self._basis[pivot_row_index] = column_index
+        self.pivots += 1
         return dropped
 
-    def _find_dropped(self, pivot_row_index: int, prev_basic_variables: Set) -> int:
+    def pivot_to_basis(self, basic_variables: Iterable[int]) -> bool:
         """
-        Identifies the dropped label
+        Pivots the tableau so that the given variables are basic.
+
+        Each variable that is not basic enters the basis on the row, amongst
+        those whose basic variable is not one of the given variables, with
+        the largest entry in its column. No ratio test is carried out so the
+        basis that is reached need not be feasible.
+
+        Parameters
+        ----------
+        basic_variables : Iterable[int]
+            The variables to make basic: one for each row of the tableau.
+
+        Returns
+        -------
+        bool
+            Whether or not the given variables form a basis and the values of
+            the basic variables are non negative. If not, the tableau should
+            not be pivoted further.
+        """
+        target = set(basic_variables)
+        if len(target) != self._tableau.shape[0] or not target <= self.labels:
+            return False
+        for variable in sorted(target - self.basic_variables):
+            column = np.where(
+                np.isin(self._basis, sorted(target)), 0, self._column(variable)
+            )
+            magnitudes = np.abs(column)
+            if not np.any(magnitudes != 0):
+                return False
+            self._pivot_and_update_basis(variable, int(np.argmax(magnitudes)))
+        return self.is_feasible()
+
+    def can_enter(self, column_index: int) -> bool:
+        """
+        Checks if a variable can enter the basis with the ratio test: if its
+        column has a positive entry. Otherwise increasing the variable never
+        makes a basic variable negative.
+
+        Parameters
+        ----------
+        column_index : int
+            The column/label to pivot.
+
+        Returns
+        -------
+        bool
+            Whether or not the variable can enter the basis.
+        """
+        return bool(np.any(self._column(column_index) > 0))
+
+    def pivot_covering_variable(self, column_index: int) -> int:
+        """
+        Pivots a covering variable into the basis of a floating point tableau
+        so that the values of all the basic variables are non negative.
+
+        The column of the covering variable, which is zero, is set so that
+        increasing it increases the value of each basic variable by the same
+        amount. It enters the basis on the row of the basic variable with
+        the smallest value. The rows are scaled so that the entries of the
+        basic variables are positive, as they are after the pivots of the
+        ratio test.
+
+        Parameters
+        ----------
+        column_index : int
+            The index of the covering variable.
+
+        Returns
+        -------
+        int
+            The dropped label.
+        """
+        self._tableau *= np.sign(self._basic_entries())[:, np.newaxis]
+        self._tableau[:, column_index] = -self._basic_entries()
+        values = self._column(-1) / self._basic_entries()
+        dropped = self._pivot_and_update_basis(column_index, int(np.argmin(values)))
+        self._tableau *= -1
+        return dropped
+
+    def variable_values(self) -> npt.NDArray:
+        """
+        Calculates the values of the variables of a floating point tableau:
+        the right hand side of the row of a basic variable divided by its
+        entry. The non basic variables are zero.
+
+        Returns
+        -------
+        array
+            The value of each variable.
+        """
+        values = np.zeros(self._number_of_labels)
+        values[self._basis] = self._column(-1) / self._basic_entries()
+        return values
+
+    def is_feasible(self) -> bool:
+        """
+        Checks if the values of the basic variables are non negative: if
+        the right hand side of each row has the sign of the entry of its
+        basic variable or is zero.
+
+        Returns
+        -------
+        bool
+            Whether or not the basis is feasible.
+        """
+        values = self._column(-1)
+        return bool(
+            np.all((values == 0) | ((values > 0) == (self._basic_entries() > 0)))
+        )
+
+    def _find_dropped(self, pivot_row_index: int) -> int:
+        """
+        Identifies the dropped label: the basic variable of the pivot row.
 
         Parameters
         ----------
         pivot_row_index : int
             The row to find dropped label from
-        prev_basic_variables : Set
-            The candidates for labels that might have been dropped
 
         Returns
         -------
@@ -269,10 +782,10 @@ class Tableau(object):
         ValueError
             if no dropped label is identified.
         """
-        for i in prev_basic_variables:
-            if self._tableau[pivot_row_index, i] != 0:
-                return i
-        raise ValueError("could not find dropped label")
+        dropped = int(self._basis[pivot_row_index])
+        if dropped == -1:
+            raise ValueError("could not find dropped label")
+        return dropped
 
     def _extract_label_values(self, column_index: int) -> List:
         """
@@ -288,10 +801,15 @@ class Tableau(object):
         List
             The computed unnormalized strategy
         """
-        vertex = []
-        for row, value in zip(self._tableau[:, column_index], self._tableau[:, -1]):
+        vertex: List[Any] = []
+        for row, value in zip(self._column(column_index), self._column(-1)):
             if row != 0:
-                vertex.append(value / row)
+                if self._exact:
+                    vertex.append(Fraction(int(value), int(row)))
+                elif self._fraction_free:
+                    vertex.append(int(value) / int(row))
+                else:
+                    vertex.append(value / row)
         return vertex
 
     def to_strategy(self, basic_labels: Set) -> npt.NDArray:
@@ -326,38 +844,6 @@ class TableauLex(Tableau):
     tableau when applied on degenerate games.
     """
 
-    def __init__(self, *kargs, **kwargs):
-        """
-        Constructs a lex Tableau for solving degenerate games.
-        Parameters are inherited from Tableau
-
-        Parameters
-        ----------
-        *kargs : Any
-            Positional arguments passed to Tableau constructor
-        **kwargs : Any
-            Key value arguments passed to Tableau constructor
-        """
-        self._non_basic_variables = None
-        super().__init__(*kargs, **kwargs)
-
-    @property
-    def non_basic_variables(self) -> Set:
-        """
-        Identifies the non basic variables of the tableau,
-        these correspond to the basic labels. For lex algorithm
-        a non-basic variable must have been dropped in an earlier pivot
-
-        Returns
-        -------
-        Set
-            The indices of the non basic variables.
-        """
-
-        if self._non_basic_variables is None:
-            self._non_basic_variables = super().non_basic_variables
-        return set(self._non_basic_variables)
-
     def _find_pivot_row(self, column_index: int) -> int:
         """
         Finding the row to pivot like std tableau, but applying lex sorting to resolve ties in minratio.
@@ -377,12 +863,15 @@ class TableauLex(Tableau):
                 "ignore",
                 r"invalid value encountered in true_divide|divide by zero encountered in true_divide",
             )
-            row_ratios = self._tableau[:, column_index] / self._tableau[:, -1]
-            row_ratios[np.isnan(row_ratios)] = -np.inf
-            ties = row_ratios == np.max(row_ratios)
-            if sum(ties) > 1:
+            if self._fraction_free:
+                ties = largest_ratio_rows(self._column(column_index), self._column(-1))
+            else:
+                row_ratios = self._ratios(self._column(column_index), self._column(-1))
+                row_ratios[np.isnan(row_ratios)] = -np.inf
+                ties = row_ratios == np.max(row_ratios)
+            if np.count_nonzero(ties) > 1:
                 return self._tie_break_lex(column_index, ties)
-            return int(np.argmax(row_ratios))
+            return int(np.argmax(ties))
 
     def _tie_break_lex(self, column_index: int, ties: npt.NDArray) -> int:
         """
@@ -394,6 +883,12 @@ class TableauLex(Tableau):
         to tie break we apply minratio test on the pertubed problem. Rather than setting a value for the error, we simply
         rely on error << min(tableau) so we can lexiographically compare entries in tableau
 
+        The slack columns are the inverse of the basis and are updated in
+        place by each pivot. Rather than sorting the rows of ratios, the
+        tied rows are narrowed down one slack column at a time to those
+        with the largest ratio (see `_lexicographic_argmax`) so that only
+        the columns needed to break the tie are read.
+
         Parameters
         ----------
         column_index : int
@@ -406,44 +901,299 @@ class TableauLex(Tableau):
         int
             The row to pivot on
         """
-        errs = self._tableau[:, sorted(self.slack_variables)]
-        pivot_column = self._tableau[:, (column_index,)]
-        err_ratios = errs / pivot_column
-        err_ratios[np.isnan(err_ratios)] = -np.inf
-        err_ratios[np.logical_not(ties), :] = -np.inf
-        return self._row_sort_asc(err_ratios)[-1]
+        return self._lexicographic_argmax(
+            np.flatnonzero(ties), self._column(column_index)
+        )
 
-    def _row_sort_asc(self, m: npt.NDArray) -> npt.NDArray:
+    def _lexicographic_argmax(
+        self, rows: npt.NDArray, pivot_column: npt.NDArray
+    ) -> int:
         """
-        Sorts the rows in m in ascending order, starting with comparing 0th then 1st column
+        Find the row whose vector of ratios of the slack columns to the
+        pivot column is lexicographically largest without sorting: the
+        slack columns on which all the rows have the same ratio are skipped
+        and the rows are narrowed down to those with the largest ratio on
+        each remaining column in turn. The last row is returned if rows
+        remain tied.
 
         Parameters
         ----------
-        m : array
-            The matrix to sort
+        rows : array
+            The indices of the candidate rows.
+        pivot_column : array
+            The pivot column.
 
         Returns
         -------
-        array
-            The order of the entries
+        int
+            The row to pivot on
         """
-        return np.lexsort(np.flipud(m.transpose()))
+        ratios = self._ratios(
+            self._block(rows, self._slack_variables), pivot_column[rows, np.newaxis]
+        )
+        if not self._fraction_free:
+            ratios[np.isnan(ratios)] = -np.inf
+        candidates = np.arange(len(rows))
+        for column in np.flatnonzero(np.any(ratios != ratios[0], axis=0)):
+            column_ratios = ratios[candidates, column]
+            candidates = candidates[column_ratios == column_ratios.max()]
+            if len(candidates) == 1:
+                break
+        return int(rows[candidates[-1]])
+
+
+class SparseTableau(Tableau):
+    """
+    A tableau stored as a sparse matrix in compressed sparse column format.
+
+    Only the non zero entries are stored so the slack variables take memory
+    proportional to the number of rows rather than its square and the
+    tableau of a game with sparse payoffs remains sparse until the pivots
+    fill it in. The columns, which are used by the ratio tests, are read
+    directly from the compressed format and each pivot only updates the
+    entries in the rows that are non zero in the pivot column and the columns
+    that are non zero in the pivot row, in place when no entry is filled in.
+    Only floating point pivoting is supported.
+    """
 
-    def pivot_and_drop_label(self, column_index: int) -> int:
+    def __init__(
+        self,
+        tableau: Any,
+        original_basic_labels: Optional[Iterable] = None,
+        normalise: bool = False,
+    ):
+        """
+        Constructs a sparse Tableau for solving lemke-howson algorithm.
+
+        Parameters
+        ----------
+        tableau : Any
+            The tableau off a payoff matrix: an array or a scipy sparse matrix
+        original_basic_labels : Optional[Iterable]
+            By default this corresponds to the non-basic variables. As the
+            payoffs can have zeros, a column of the payoffs can have a single
+            non zero entry: these labels should then be given so that such a
+            column is not taken to be basic.
+        normalise : bool
+            Whether the rows are cleaned and rescaled after each pivot (see
+            `Tableau._normalise_rows`).
+        """
+        tableau = scipy.sparse.csc_matrix(tableau, dtype=float)
+        tableau.eliminate_zeros()
+        tableau.sort_indices()
+        self._non_basic_hint = (
+            None if original_basic_labels is None else list(original_basic_labels)
+        )
+        super().__init__(tableau, original_basic_labels, normalise=normalise)
+
+    def _find_basis(self) -> Tuple[npt.NDArray, npt.NDArray]:
+        """
+        Identifies the basic variables from the structure of the tableau:
+        a variable is basic if its column has a single non zero entry and it
+        is not one of the given original basic labels.
+
+        Returns
+        -------
+        Tuple
+            A boolean array indicating if each variable is basic and an
+            array with the basic variable of each row (-1 if no column has
+            a single non zero entry in that row).
+        """
+        is_basic = np.diff(self._tableau.indptr)[:-1] == 1
+        if self._non_basic_hint is not None:
+            is_basic[self._non_basic_hint] = False
+        basis = np.full(self._tableau.shape[0], -1, dtype=int)
+        for column in np.flatnonzero(is_basic)[::-1]:
+            basis[self._tableau.indices[self._tableau.indptr[column]]] = column
+        return is_basic, basis
+
+    def _column(self, column_index: int) -> npt.NDArray:
         """
-        In addition to standard tableau logic this ensures entering and leaving labels are recorded
+        Returns a column of the tableau as an array.
 
         Parameters
         ----------
         column_index : int
-            The index of a tableau on which to pivot.
+            The index of the column (-1 for the right hand side).
 
         Returns
         -------
-        int
-            The dropped label.
+        array
+            The column
         """
-        dropped = super().pivot_and_drop_label(column_index)
-        self._non_basic_variables.add(dropped)
-        self._non_basic_variables.remove(column_index)
-        return dropped
+        column_index %= self._tableau.shape[1]
+        start, end = self._tableau.indptr[column_index : column_index + 2]
+        column = np.zeros(self._tableau.shape[0])
+        column[self._tableau.indices[start:end]] = self._tableau.data[start:end]
+        return column
+
+    def _block(self, rows: npt.NDArray, columns: npt.NDArray) -> npt.NDArray:
+        """
+        Returns the entries of the tableau in given rows and columns as an
+        array.
+
+        Parameters
+        ----------
+        rows : array
+            The indices of the rows.
+        columns : array
+            The indices of the columns.
+
+        Returns
+        -------
+        array
+            The block of the tableau
+        """
+        return self._tableau[:, columns][rows].toarray()
+
+    def _basic_entries(self) -> npt.NDArray:
+        """
+        Returns the entry of each row in the column of its basic variable.
+
+        Returns
+        -------
+        array
+            The entries
+        """
+        rows = np.arange(self._tableau.shape[0])
+        columns = self._basis % self._tableau.shape[1]
+        return np.asarray(self._tableau[rows, columns]).ravel()
+
+    def _pivot(self, column_index: int, pivot_row_index: int):
+        """
+        Perform row operations to drop column from all but the pivot row.
+
+        Only the rows with a non zero entry in the pivot column and the
+        columns with a non zero entry in the pivot row are updated: each of
+        these rows has the pivot row times the ratio of its entry in the
+        pivot column to the pivot element removed. Unlike a dense tableau,
+        the other rows are not multiplied by the pivot element. This only
+        scales the rows by non zero constants, which changes neither the
+        ratios, the labels nor the strategies. The entries of the pivot
+        column are set to zero exactly and the updated columns are written
+        back in place (see `_set_columns`).
+
+        Parameters
+        ----------
+        column_index : int
+            The column/label to pivot.
+        pivot_row_index : int
+            The row to pivot
+        """
+        column = self._column(column_index)
+        rows = np.flatnonzero(column)
+        rows = rows[rows != pivot_row_index]
+        if len(rows) > 0:
+            positions = np.flatnonzero(self._tableau.indices == pivot_row_index)
+            columns = np.searchsorted(self._tableau.indptr, positions, side="right") - 1
+            updates = -np.outer(
+                column[rows] / column[pivot_row_index], self._tableau.data[positions]
+            )
+            updates[:, columns == column_index] = -column[rows, np.newaxis]
+            update = scipy.sparse.csc_matrix(
+                (
+                    updates.ravel(),
+                    (
+                        np.repeat(rows, len(columns)),
+                        np.tile(np.arange(len(columns)), len(rows)),
+                    ),
+                ),
+                shape=(self._tableau.shape[0], len(columns)),
+            )
+            block = self._tableau[:, columns] + update
+            block.eliminate_zeros()
+            self._set_columns(columns, block)
+        if self._normalise:
+            self._normalise_rows()
+
+    def _set_columns(self, columns: npt.NDArray, block: Any):
+        """
+        Replace some columns of the tableau.
+
+        If the new columns are not filled in, that is if their non zero
+        entries are in rows where the old ones are stored, the stored entries
+        are overwritten in place and those that become zero are kept as
+        explicit zeros. Otherwise the compressed arrays are rebuilt with the
+        entries of the other columns copied unchanged.
+
+        Parameters
+        ----------
+        columns : array
+            The sorted indices of the columns.
+        block : csc_matrix
+            The new columns.
+        """
+        tableau = self._tableau
+        counts = np.diff(tableau.indptr)
+        block_counts = np.diff(block.indptr)
+        old_counts = counts[columns]
+        old_positions = np.arange(old_counts.sum()) + np.repeat(
+            tableau.indptr[columns] - np.cumsum(old_counts) + old_counts,
+            old_counts,
+        )
+        old_keys = (
+            np.repeat(np.arange(len(columns)), old_counts) * tableau.shape[0]
+            + tableau.indices[old_positions]
+        )
+        keys = (
+            np.repeat(np.arange(len(columns)), block_counts) * tableau.shape[0]
+            + block.indices
+        )
+        found = np.searchsorted(old_keys, keys).clip(max=len(old_keys) - 1)
+        if np.array_equal(old_keys[found], keys):
+            tableau.data[old_positions] = 0
+            tableau.data[old_positions[found]] = block.data
+            return
+        kept = np.ones(tableau.shape[1], dtype=bool)
+        kept[columns] = False
+        counts[columns] = block_counts
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        entry_columns = np.repeat(np.arange(tableau.shape[1]), np.diff(tableau.indptr))
+        kept_entries = kept[entry_columns]
+        kept_positions = (
+            np.flatnonzero(kept_entries)
+            - tableau.indptr[entry_columns[kept_entries]]
+            + indptr[entry_columns[kept_entries]]
+        )
+        positions = np.arange(block.nnz) + np.repeat(
+            indptr[columns] - block.indptr[:-1], block_counts
+        )
+        data = np.empty(indptr[-1])
+        indices = np.empty(indptr[-1], dtype=tableau.indices.dtype)
+        data[kept_positions] = tableau.data[kept_entries]
+        indices[kept_positions] = tableau.indices[kept_entries]
+        data[positions] = block.data
+        indices[positions] = block.indices
+        self._tableau = scipy.sparse.csc_matrix(
+            (data, indices, indptr), shape=tableau.shape
+        )
+
+    def _normalise_rows(self):
+        """
+        Clean and rescale the rows of the tableau after a pivot (see
+        `Tableau._normalise_rows`) by only considering the non zero entries.
+        The entries that are set to zero are removed.
+        """
+        magnitudes = np.abs(self._tableau.data)
+        largest = np.zeros(self._tableau.shape[0])
+        np.maximum.at(largest, self._tableau.indices, magnitudes)
+        self._tableau.data[
+            magnitudes <= ZERO_TOLERANCE * largest[self._tableau.indices]
+        ] = 0
+        self._tableau.eliminate_zeros()
+        rows = (largest > RESCALE_THRESHOLD) | (
+            (largest > 0) & (largest < 1 / RESCALE_THRESHOLD)
+        )
+        if not rows.any():
+            return
+        scale = np.ones(len(largest))
+        _, exponents = np.frexp(largest[rows])
+        scale[rows] = np.ldexp(1.0, -exponents)
+        self._tableau.data *= scale[self._tableau.indices]
+
+
+class SparseTableauLex(SparseTableau, TableauLex):
+    """
+    A sparse tableau with lexiographic sorting to break ties when pivoting
+    (see `TableauLex`).
+    """
@@ -1,6 +1,19 @@
 from .polytope import (
+    analytic_feasible_point,
+    best_response_matrices,
     build_halfspaces,
     find_feasible_point,
+    find_interior_point,
+    label_matrix,
     labels,
+    non_trivial_vertex_array,
     non_trivial_vertices,
 )
+from .reverse_search import reverse_search_vertices
+from .cache import (
+    Polytope,
+    PolytopeCache,
+    build_polytope,
+    fingerprint,
+    polytope_cache,
+)
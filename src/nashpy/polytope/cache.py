@@ -0,0 +1,251 @@
+"""A least recently used cache of the vertices of polytopes"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import numpy.typing as npt
+from typing import Any, NamedTuple, Optional, Tuple
+
+from .polytope import (
+    best_response_matrices,
+    build_halfspaces,
+    find_interior_point,
+    non_trivial_vertex_array,
+)
+from .reverse_search import reverse_search_vertices
+from nashpy.utils.dominance import iterated_elimination_of_dominated_strategies
+
+
+class Polytope(NamedTuple):
+    """
+    The halfspaces, interior point, vertices and labels of the polytope
+    Mx <= 1, x >= 0. The arrays are read only.
+
+    Attributes
+    ----------
+    halfspaces : array
+        The halfspaces as given by `build_halfspaces`.
+    feasible_point : Optional[array]
+        The point inside the halfspaces used by qhull (None if the vertices
+        were obtained with reverse search).
+    vertices : array
+        The non trivial vertices, one per row.
+    labels : array
+        A boolean array with a row per vertex indicating the halfspaces on
+        which it lies.
+    """
+
+    halfspaces: npt.NDArray
+    feasible_point: Optional[npt.NDArray]
+    vertices: npt.NDArray
+    labels: npt.NDArray
+
+
+def fingerprint(M: npt.NDArray) -> str:
+    """
+    Return a hash of the contents of a matrix: its dtype, shape and entries.
+
+    Parameters
+    ----------
+    M : array
+        A matrix.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest.
+    """
+    M = np.ascontiguousarray(M)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(M.dtype.str.encode())
+    digest.update(str(M.shape).encode())
+    if M.dtype == object:
+        digest.update(repr(M.tolist()).encode())
+    else:
+        digest.update(M.tobytes())
+    return digest.hexdigest()
+
+
+def build_polytope(M: npt.NDArray, vertex_method: str = "qhull") -> Polytope:
+    """
+    Build the halfspaces of the polytope Mx <= 1, x >= 0 and obtain its non
+    trivial vertices and their labels.
+
+    Parameters
+    ----------
+    M : array
+        A matrix with linear coefficients defining the polytope.
+    vertex_method : str
+        How to obtain the vertices: "qhull" (see `non_trivial_vertex_array`) or
+        "reverse_search" (see `reverse_search_vertices`).
+
+    Returns
+    -------
+    Polytope
+        The polytope.
+
+    Raises
+    ------
+    ValueError
+        If the vertex method is not known.
+    """
+    halfspaces = build_halfspaces(M)
+    feasible_point = None
+    if vertex_method == "qhull":
+        feasible_point = find_interior_point(halfspaces)
+        vertices, labels = non_trivial_vertex_array(halfspaces, feasible_point)
+    elif vertex_method == "reverse_search":
+        pairs = list(reverse_search_vertices(halfspaces))
+        vertices = np.array([vertex for vertex, _ in pairs], dtype=float).reshape(
+            len(pairs), halfspaces.shape[1] - 1
+        )
+        labels = np.zeros((len(pairs), halfspaces.shape[0]), dtype=bool)
+        for row, (_, vertex_labels) in enumerate(pairs):
+            labels[row, list(vertex_labels)] = True
+    else:
+        raise ValueError("vertex_method must be one of qhull or reverse_search.")
+    for array in (halfspaces, feasible_point, vertices, labels):
+        if array is not None:
+            array.setflags(write=False)
+    return Polytope(halfspaces, feasible_point, vertices, labels)
+
+
+class PolytopeCache(object):
+    """
+    A least recently used cache of polytopes (see `build_polytope`) keyed by
+    the fingerprint of their matrix and the vertex method.
+
+    Repeatedly obtaining the vertices of the polytopes of the same games
+    then only builds them once. The cache holds at most `maxsize` polytopes:
+    the least recently used polytope is discarded when it is full. The
+    numbers of `hits` and `misses` are counted. It can be used from several
+    threads.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Constructs an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of polytopes.
+
+        Raises
+        ------
+        ValueError
+            If the maximum number of polytopes is negative.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non negative.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._polytopes: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Return the number of polytopes in the cache.
+
+        Returns
+        -------
+        int
+            The number of polytopes.
+        """
+        return len(self._polytopes)
+
+    def get(self, M: npt.NDArray, vertex_method: str = "qhull") -> Polytope:
+        """
+        Return the polytope Mx <= 1, x >= 0, building it if it is not in the
+        cache.
+
+        Parameters
+        ----------
+        M : array
+            A matrix with linear coefficients defining the polytope.
+        vertex_method : str
+            How to obtain the vertices (see `build_polytope`).
+
+        Returns
+        -------
+        Polytope
+            The polytope.
+        """
+        key: Tuple[Any, ...] = (fingerprint(M), vertex_method)
+        with self._lock:
+            if key in self._polytopes:
+                self.hits += 1
+                self._polytopes.move_to_end(key)
+                return self._polytopes[key]
+            self.misses += 1
+        polytope = build_polytope(M, vertex_method)
+        with self._lock:
+            self._polytopes[key] = polytope
+            while len(self._polytopes) > self.maxsize:
+                self._polytopes.popitem(last=False)
+        return polytope
+
+    def invalidate(self, M: npt.NDArray) -> int:
+        """
+        Remove the polytopes of a matrix (for all vertex methods) from the
+        cache.
+
+        Parameters
+        ----------
+        M : array
+            A matrix with linear coefficients defining the polytope.
+
+        Returns
+        -------
+        int
+            The number of polytopes removed.
+        """
+        key = fingerprint(M)
+        with self._lock:
+            keys = [cached for cached in self._polytopes if cached[0] == key]
+            for cached in keys:
+                del self._polytopes[cached]
+        return len(keys)
+
+    def invalidate_game(self, A: npt.NDArray, B: npt.NDArray) -> int:
+        """
+        Remove the polytopes of both players of a game (for all vertex
+        methods) from the cache: the polytopes that `vertex_enumeration`
+        obtains from the payoff matrices (see `best_response_matrices`) and
+        from the payoff matrices without the strictly dominated strategies
+        (with `eliminate_dominated=True`).
+
+        Parameters
+        ----------
+        A : array
+            The row player payoff matrix.
+        B : array
+            The column player payoff matrix.
+
+        Returns
+        -------
+        int
+            The number of polytopes removed.
+        """
+        rows, columns = iterated_elimination_of_dominated_strategies(A, B)
+        reduced = np.ix_(rows, columns)
+        matrices = best_response_matrices(A, B) + best_response_matrices(
+            A[reduced], B[reduced]
+        )
+        return sum(self.invalidate(M) for M in matrices)
+
+    def clear(self) -> None:
+        """
+        Remove all polytopes from the cache and reset the counts of hits and
+        misses.
+        """
+        with self._lock:
+            self._polytopes.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+polytope_cache = PolytopeCache()
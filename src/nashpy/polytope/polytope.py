@@ -2,7 +2,7 @@
 
 import numpy as np
 import numpy.typing as npt
-from typing import Generator, Any, Set
+from typing import Generator, Any, Optional, Set, Tuple
 from scipy.optimize import linprog
 from scipy.spatial import HalfspaceIntersection
 
@@ -38,6 +38,36 @@ def build_halfspaces(M: npt.NDArray) -> npt.NDArray:
     return halfspaces
 
 
+def best_response_matrices(
+    A: npt.NDArray, B: npt.NDArray
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    """
+    Return the matrices M of the best response polytopes Mx <= 1, x >= 0 of
+    a game: the payoff matrices are made non negative (which does not change
+    the equilibria) and the row player's polytope is defined by the column
+    player's payoffs transposed while the column player's polytope is
+    defined by the row player's payoffs.
+
+    Parameters
+    ----------
+    A : array
+        The row player payoff matrix.
+    B : array
+        The column player payoff matrix.
+
+    Returns
+    -------
+    Tuple
+        The matrices of the row player's and of the column player's
+        polytopes.
+    """
+    if np.min(A) < 0:
+        A = A + abs(np.min(A))
+    if np.min(B) < 0:
+        B = B + abs(np.min(B))
+    return B.transpose(), A
+
+
 def find_feasible_point(halfspaces: npt.NDArray) -> npt.NDArray:
     """
     Use linear programming to find a point inside the halfspaces (needed to
@@ -67,6 +97,68 @@ def find_feasible_point(halfspaces: npt.NDArray) -> npt.NDArray:
     return res.x[:-1]
 
 
+def analytic_feasible_point(halfspaces: npt.NDArray) -> Optional[npt.NDArray]:
+    """
+    Find a point inside the halfspaces without linear programming: the
+    multiple t(1, ..., 1) of the vector of ones with t in the middle of the
+    interval of positive values for which it is strictly inside all the
+    halfspaces.
+
+    For the halfspaces of `build_halfspaces` with a non negative matrix M
+    this is t = 1 / (2 max_i sum_j M_ij).
+
+    Parameters
+    ----------
+    halfspaces : array
+        a matrix representation of halfspaces.
+
+    Returns
+    -------
+    Optional[array]
+        A point strictly inside the halfspaces or None if there is no such
+        multiple of the vector of ones (or it is not strictly inside the
+        halfspaces because of rounding).
+    """
+    M, b = halfspaces[:, :-1], halfspaces[:, -1]
+    slopes = M.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bounds = -b / slopes
+    lower = bounds[slopes < 0].max(initial=0)
+    upper = bounds[slopes > 0].min(initial=np.inf)
+    if not lower < upper:
+        return None
+    t = (lower + upper) / 2 if upper < np.inf else lower + 1
+    point = np.full(M.shape[1], t)
+    if np.all(M @ point + b < 0):
+        return point
+    return None
+
+
+def find_interior_point(halfspaces: npt.NDArray) -> npt.NDArray:
+    """
+    Find a point inside the halfspaces: the point of
+    `analytic_feasible_point` if there is one and otherwise the point of
+    `find_feasible_point` which solves a linear program.
+
+    The order in which qhull returns the vertices, and the last bits of
+    their coordinates, depend on this point.
+
+    Parameters
+    ----------
+    halfspaces : array
+        a matrix representation of halfspaces.
+
+    Returns
+    -------
+    array
+        A feasible point inside the halfspace.
+    """
+    point = analytic_feasible_point(halfspaces)
+    if point is None:
+        point = find_feasible_point(halfspaces)
+    return point
+
+
 def labels(vertex: npt.NDArray, halfspaces: npt.NDArray) -> Set[npt.NDArray]:
     """
     Return the labels of the facets on which lie a given vertex. This is
@@ -89,8 +181,69 @@ def labels(vertex: npt.NDArray, halfspaces: npt.NDArray) -> Set[npt.NDArray]:
     return set(np.where(np.isclose(np.dot(M, vertex), -b))[0])
 
 
+def label_matrix(vertices: npt.NDArray, halfspaces: npt.NDArray) -> npt.NDArray:
+    """
+    Return the labels of the facets on which lie a number of vertices. This
+    is calculated with a single matrix multiplication.
+
+    Parameters
+    ----------
+    vertices: array
+        The vertices of a polytope, one per row.
+    halfspaces: array
+        A halfspace definition of a polytope.
+
+    Returns
+    -------
+    array
+        A boolean array with a row per vertex and a column per halfspace
+        indicating the labels of the vertex.
+    """
+    b = halfspaces[:, -1]
+    M = halfspaces[:, :-1]
+    return np.isclose(vertices @ M.transpose(), -b)
+
+
+def non_trivial_vertex_array(
+    halfspaces: npt.NDArray, feasible_point: Optional[npt.NDArray] = None
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    """
+    Returns all vertices (ignoring the origin) and their labels as arrays.
+
+    The coordinates of a vertex that lie on their non negativity facets are
+    set to exactly zero, so that the rounding of qhull does not leave small
+    or negative zero entries.
+
+    Parameters
+    ----------
+    halfspaces: array
+        A halfspace definition of a polytope.
+    feasible_point: Optional[array]
+        A point inside the halfspaces. By default it is obtained with
+        `find_interior_point`.
+
+    Returns
+    -------
+    Tuple
+        The non trivial vertices, one per row, and their labels (see
+        `label_matrix`).
+    """
+    if feasible_point is None:
+        feasible_point = find_interior_point(halfspaces)
+    hs = HalfspaceIntersection(halfspaces, feasible_point)
+    hs.close()
+    vertices = hs.intersections
+    vertices = vertices[
+        ~np.all(np.isclose(vertices, 0), axis=1) & (vertices.max(axis=1) < np.inf)
+    ]
+    vertex_labels = label_matrix(vertices, halfspaces)
+    number_of_strategies = halfspaces.shape[0] - halfspaces.shape[1] + 1
+    vertices[vertex_labels[:, number_of_strategies:]] = 0
+    return vertices, vertex_labels
+
+
 def non_trivial_vertices(
-    halfspaces: npt.NDArray,
+    halfspaces: npt.NDArray, feasible_point: Optional[npt.NDArray] = None
 ) -> Generator[tuple, Any, None]:
     """
     Returns all vertex, label pairs (ignoring the origin).
@@ -99,17 +252,17 @@ def non_trivial_vertices(
     ----------
     halfspaces: array
         A halfspace definition of a polytope.
+    feasible_point: Optional[array]
+        A point inside the halfspaces. By default it is obtained with
+        `find_interior_point`.
 
     Returns
     -------
     generator
         A generator of non trivial vertices and their labels.
     """
-    feasible_point = find_feasible_point(halfspaces)
-    hs = HalfspaceIntersection(halfspaces, feasible_point)
-    hs.close()
+    vertices, vertex_labels = non_trivial_vertex_array(halfspaces, feasible_point)
     return (
-        (v, labels(v, halfspaces))
-        for v in hs.intersections
-        if not np.all(np.isclose(v, 0)) and max(v) < np.inf
+        (v, set(np.flatnonzero(v_labels).tolist()))
+        for v, v_labels in zip(vertices, vertex_labels)
     )
@@ -0,0 +1,301 @@
+"""Vertex enumeration of a polytope with the reverse search of Avis and Fukuda"""
+
+import numpy as np
+import numpy.typing as npt
+from typing import Any, Generator, Optional, Set
+
+from itertools import chain
+
+from nashpy.linalg.bareiss import (
+    approximate_ratios,
+    as_integer_array,
+    bareiss_pivot,
+    exact_ratios,
+    to_integer_matrix,
+)
+
+
+class Dictionary(object):
+    """
+    A fraction free dictionary of the polytope Mx <= b, x >= 0 (with b > 0)
+    for the reverse search of its vertices.
+
+    The variables are the slack variables s = b - Mx (labelled 0 to m - 1)
+    and x (labelled m to m + d - 1), as the halfspaces, and the constraints
+    s + Mx = b are kept as an integer tableau [I | M | b] with an additional
+    objective row for maximising -sum(x). The tableau is pivoted with `bareiss_pivot` so that
+    its entries are the entries of the dictionary times the current
+    denominator. The unique optimal basis is the basis of slack variables
+    which corresponds to the origin.
+    """
+
+    def __init__(self, halfspaces: npt.NDArray):
+        """
+        Constructs the dictionary of the origin.
+
+        Parameters
+        ----------
+        halfspaces : array
+            A halfspace definition of a polytope as given by
+            `build_halfspaces`: the rows of M with -b and then the rows of
+            -I with 0.
+        """
+        self.dimension = halfspaces.shape[1] - 1
+        self.number_of_constraints = halfspaces.shape[0] - self.dimension
+        constraints = halfspaces[: self.number_of_constraints]
+        # Scaling the constraints by a positive constant scales the slack
+        # variables which keeps the slack columns as an identity.
+        integers = to_integer_matrix(
+            np.column_stack((constraints[:, :-1], -constraints[:, -1]))
+        )
+        objective = np.concatenate(
+            (np.zeros(self.number_of_constraints), np.ones(self.dimension), [0])
+        ).astype(int)
+        self._tableau = as_integer_array(
+            np.vstack(
+                (
+                    np.column_stack(
+                        (
+                            np.eye(self.number_of_constraints, dtype=int),
+                            integers,
+                        )
+                    ),
+                    objective,
+                )
+            )
+        )
+        self._denominator: Any = 1
+        self._number_of_variables = self.dimension + self.number_of_constraints
+        self._basis = np.arange(self.number_of_constraints)
+        self._is_basic = np.zeros(self._number_of_variables, dtype=bool)
+        self._is_basic[self._basis] = True
+
+    def is_basic(self, variable: int) -> bool:
+        """
+        Checks if a variable is basic.
+
+        Parameters
+        ----------
+        variable : int
+            The variable.
+
+        Returns
+        -------
+        bool
+            Whether or not the variable is basic.
+        """
+        return bool(self._is_basic[variable])
+
+    def leaving_row(self, column: int) -> Optional[int]:
+        """
+        Find the row of the basic variable that leaves the basis when a
+        variable enters it using the lexicographic minimum ratio test: the
+        rows are compared by their right hand side and then by the entries
+        of the inverse of the basis (the slack columns) divided by their
+        entry in the column.
+
+        Parameters
+        ----------
+        column : int
+            The entering variable.
+
+        Returns
+        -------
+        Optional[int]
+            The row or None if the entering variable can increase without
+            bound.
+        """
+        entries = self._tableau[:-1, column]
+        rows = np.flatnonzero(entries > 0)
+        if len(rows) == 0:
+            return None
+        right_hand_side = self._tableau[rows, -1]
+        candidate = np.argmin(approximate_ratios(right_hand_side, entries[rows]))
+        # Only the rows whose ratio is not larger than that of the candidate
+        # (which is checked exactly) are compared exactly.
+        rows = rows[
+            right_hand_side * entries[rows[candidate]]
+            <= right_hand_side[candidate] * entries[rows]
+        ]
+        for lexicographic_column in chain([-1], range(self.number_of_constraints)):
+            if len(rows) == 1:
+                break
+            ratios = exact_ratios(
+                self._tableau[rows, lexicographic_column], entries[rows]
+            )
+            rows = rows[ratios == min(ratios)]
+        return int(rows[0])
+
+    def pivot(self, row: int, column: int) -> int:
+        """
+        Pivot a variable into the basis.
+
+        Parameters
+        ----------
+        row : int
+            The row of the leaving variable.
+        column : int
+            The entering variable.
+
+        Returns
+        -------
+        int
+            The leaving variable.
+        """
+        self._tableau = bareiss_pivot(self._tableau, row, column, self._denominator)
+        self._denominator = self._tableau[row, column]
+        leaving_variable = int(self._basis[row])
+        self._basis[row] = column
+        self._is_basic[leaving_variable] = False
+        self._is_basic[column] = True
+        return leaving_variable
+
+    def parent_pivot(self) -> Optional[int]:
+        """
+        Carry out the pivot of the simplex method with Bland's rule: the
+        entering variable is the smallest variable whose reduced cost is
+        positive and the leaving variable is given by `leaving_row`.
+
+        Returns
+        -------
+        Optional[int]
+            The leaving variable or None if the dictionary is optimal (and
+            corresponds to the origin).
+        """
+        improving = np.flatnonzero((self._tableau[-1, :-1] < 0) & ~self._is_basic)
+        if len(improving) == 0:
+            return None
+        column = int(improving[0])
+        row = self.leaving_row(column)
+        return self.pivot(row, column)  # type: ignore
+
+    def reverse_pivot_row(self, column: int) -> Optional[int]:
+        """
+        Find the row of a pivot that brings a variable into the basis such
+        that `parent_pivot` leads back to the current basis: the reduced
+        cost of the variable must be negative, its leaving row is given by
+        `leaving_row` and no variable smaller than the leaving variable can
+        have a positive reduced cost after the pivot.
+
+        Parameters
+        ----------
+        column : int
+            A non basic variable.
+
+        Returns
+        -------
+        Optional[int]
+            The row or None if there is no such pivot.
+        """
+        objective = self._tableau[-1]
+        if objective[column] <= 0:
+            return None
+        row = self.leaving_row(column)
+        if row is None:
+            return None
+        smaller = np.flatnonzero(~self._is_basic[: self._basis[row]])
+        smaller = smaller[smaller != column]
+        pivot_row = self._tableau[row]
+        reduced_costs = (
+            objective[smaller] * pivot_row[column]
+            - objective[column] * pivot_row[smaller]
+        )
+        if np.any(reduced_costs < 0):
+            return None
+        return row
+
+    def is_lexicographic_minimum(self) -> bool:
+        """
+        Checks if the basis is the lexicographically smallest basis of its
+        vertex: no degenerate basic variable (with value 0) can be replaced
+        by a smaller non basic variable.
+
+        Returns
+        -------
+        bool
+            Whether or not the basis is the smallest basis of its vertex.
+        """
+        for row in np.flatnonzero(self._tableau[:-1, -1] == 0):
+            smaller = np.flatnonzero(~self._is_basic[: self._basis[row]])
+            if np.any(self._tableau[row, smaller] != 0):
+                return False
+        return True
+
+    def vertex(self) -> npt.NDArray:
+        """
+        Return the vertex of the basis. Each coordinate is obtained with a
+        single division so that it is correctly rounded.
+
+        Returns
+        -------
+        array
+            The vertex.
+        """
+        vertex = np.zeros(self.dimension)
+        for row in np.flatnonzero(self._basis >= self.number_of_constraints):
+            vertex[self._basis[row] - self.number_of_constraints] = int(
+                self._tableau[row, -1]
+            ) / int(self._denominator)
+        return vertex
+
+    def labels(self) -> Set[int]:
+        """
+        Return the labels of the facets on which the vertex of the basis
+        lies: the variables that are 0.
+
+        Returns
+        -------
+        set
+            The labels.
+        """
+        is_zero = ~self._is_basic
+        is_zero[self._basis[self._tableau[:-1, -1] == 0]] = True
+        return set(np.flatnonzero(is_zero).tolist())
+
+
+def reverse_search_vertices(
+    halfspaces: npt.NDArray,
+) -> Generator[tuple, Any, None]:
+    """
+    Returns all vertex, label pairs (ignoring the origin) using the reverse
+    search of [Avis1992]_.
+
+    The simplex method with Bland's rule pivots from any basis of the
+    polytope to the basis of the origin and so defines a tree of bases. The
+    tree is traversed depth first from the origin by undoing these pivots.
+    Only the current dictionary is kept: the traversal goes back up the
+    tree by carrying out the simplex pivot and then carries on with the
+    next variable. The pivots are exact and lexicographic so that the bases
+    of degenerate vertices are traversed without cycling and each vertex is
+    only returned for its lexicographically smallest basis. The vertices
+    are thus returned lazily and without duplicates.
+
+    Parameters
+    ----------
+    halfspaces: array
+        A halfspace definition of a polytope as given by `build_halfspaces`.
+
+    Yields
+    -------
+    Generator
+        The non trivial vertices and their labels.
+    """
+    dictionary = Dictionary(halfspaces)
+    number_of_variables = dictionary.dimension + dictionary.number_of_constraints
+    variable = 0
+    while True:
+        while variable < number_of_variables:
+            row = None
+            if not dictionary.is_basic(variable):
+                row = dictionary.reverse_pivot_row(variable)
+            if row is None:
+                variable += 1
+                continue
+            dictionary.pivot(row, variable)
+            if dictionary.is_lexicographic_minimum():
+                yield dictionary.vertex(), dictionary.labels()
+            variable = 0
+        entered_variable = dictionary.parent_pivot()
+        if entered_variable is None:
+            return
+        variable = entered_variable + 1
@@ -0,0 +1,134 @@
+"""Functions for the iterated elimination of strictly dominated strategies"""
+
+import numpy as np
+import numpy.typing as npt
+from typing import Tuple
+from scipy.optimize import linprog
+
+
+def is_strictly_dominated(
+    A: npt.NDArray,
+    strategy: int,
+    mixed: bool = True,
+    tol: float = 10**-10,
+) -> bool:
+    """
+    Checks if a pure strategy of the row player is strictly dominated by
+    another pure strategy or, optionally, by a mixed strategy over the other
+    pure strategies.
+
+    Mixed dominance is checked by solving the linear program that maximises
+    the smallest gain epsilon of a mixed strategy over the given strategy.
+
+    Parameters
+    ----------
+    A : array
+        The payoff matrix of the player whose strategy is checked (rows
+        correspond to their strategies).
+    strategy : int
+        The index of the pure strategy to check.
+    mixed : bool
+        Whether or not to consider dominance by mixed strategies.
+    tol : float
+        A tolerance parameter: a mixed strategy must gain more than this
+        against every strategy of the opponent.
+
+    Returns
+    -------
+    bool
+        If True it indicates that the strategy is strictly dominated.
+    """
+    others = np.delete(A, strategy, axis=0)
+    if len(others) == 0:
+        return False
+    if np.any(np.all(others > A[strategy], axis=1)):
+        return True
+    if not mixed or len(others) == 1:
+        return False
+
+    number_of_others, number_of_columns = others.shape
+    c = np.zeros(number_of_others + 1)
+    c[-1] = -1
+    A_ub = np.hstack((-others.T, np.ones((number_of_columns, 1))))
+    b_ub = -A[strategy]
+    A_eq = np.ones((1, number_of_others + 1))
+    A_eq[0, -1] = 0
+    bounds = [(0, None) for _ in range(number_of_others)] + [(None, None)]
+    res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=1, bounds=bounds)
+    return bool(res.x[-1] > tol)
+
+
+def iterated_elimination_of_dominated_strategies(
+    A: npt.NDArray,
+    B: npt.NDArray,
+    mixed: bool = True,
+    tol: float = 10**-10,
+) -> Tuple[npt.NDArray, npt.NDArray]:
+    """
+    Iteratively remove the strictly dominated strategies of both players.
+
+    Strictly dominated strategies are never played in a Nash equilibrium so
+    the equilibria of the reduced game are exactly the equilibria of the
+    original game (once mapped back with `expand_strategy`).
+
+    Parameters
+    ----------
+    A : array
+        The row player payoff matrix
+    B : array
+        The column player payoff matrix
+    mixed : bool
+        Whether or not to consider dominance by mixed strategies.
+    tol : float
+        A tolerance parameter for dominance by mixed strategies.
+
+    Returns
+    -------
+    Tuple
+        The indices of the remaining row strategies and of the remaining
+        column strategies. The reduced game is given by
+        `A[np.ix_(rows, columns)]` and `B[np.ix_(rows, columns)]`.
+    """
+    rows = np.arange(A.shape[0])
+    columns = np.arange(A.shape[1])
+    eliminated = True
+    while eliminated:
+        eliminated = False
+        for i in range(len(rows)):
+            if is_strictly_dominated(A[np.ix_(rows, columns)], i, mixed, tol):
+                rows = np.delete(rows, i)
+                eliminated = True
+                break
+        for j in range(len(columns)):
+            if is_strictly_dominated(B[np.ix_(rows, columns)].T, j, mixed, tol):
+                columns = np.delete(columns, j)
+                eliminated = True
+                break
+    return rows, columns
+
+
+def expand_strategy(
+    strategy: npt.NDArray, indices: npt.NDArray, number_of_strategies: int
+) -> npt.NDArray:
+    """
+    Map a strategy of a reduced game back to the strategies of the original
+    game: strategies that were removed are played with probability 0.
+
+    Parameters
+    ----------
+    strategy : array
+        A strategy in the reduced game.
+    indices : array
+        The indices in the original game of the strategies of the reduced
+        game.
+    number_of_strategies : int
+        The number of strategies in the original game.
+
+    Returns
+    -------
+    array
+        The strategy in the original game.
+    """
+    expanded_strategy = np.zeros(number_of_strategies, dtype=strategy.dtype)
+    expanded_strategy[indices] = strategy
+    return expanded_strategy
@@ -0,0 +1,113 @@
+"""
+Tests for the fraction free integer elimination
+"""
+
+from fractions import Fraction
+
+import numpy as np
+from hypothesis import given, settings
+from hypothesis.extra.numpy import arrays
+
+from nashpy.linalg.bareiss import (
+    INT64_HEADROOM,
+    approximate_ratios,
+    as_integer_array,
+    bareiss_pivot,
+    bareiss_solve,
+    exact_ratios,
+    largest_ratio_rows,
+    to_integer_matrix,
+)
+
+
+def test_as_integer_array():
+    M = as_integer_array(np.array([[1, -2], [3, 4]], dtype=object))
+    assert M.dtype == np.int64
+    M = as_integer_array(np.array([[1, -INT64_HEADROOM]], dtype=object))
+    assert M.dtype == object
+    assert M[0, 1] == -(2**31)
+    M = as_integer_array(np.array([[2, -INT64_HEADROOM]]))
+    assert M.dtype == object
+    M = as_integer_array(np.zeros((0, 2), dtype=object))
+    assert M.dtype == np.int64
+
+
+def test_to_integer_matrix():
+    A = np.array([[Fraction(1, 3), 0.5], [2, Fraction(-1, 4)]], dtype=object)
+    M = to_integer_matrix(A)
+    assert M.dtype == np.int64
+    assert np.array_equal(M, np.array([[4, 6], [24, -3]]))
+
+    M = to_integer_matrix(np.array([[0.1, 1]]))
+    assert M.dtype == object
+    assert Fraction(int(M[0, 0]), int(M[0, 1])) == Fraction(0.1)
+
+
+def test_bareiss_pivot():
+    M = np.array([[2, 1, 1], [1, 3, 2]])
+    pivoted = bareiss_pivot(M, 0, 0)
+    assert np.array_equal(pivoted, np.array([[2, 1, 1], [0, 5, 3]]))
+    pivoted = bareiss_pivot(pivoted, 1, 1, previous_pivot=2)
+    assert np.array_equal(pivoted, np.array([[5, 0, 1], [0, 5, 3]]))
+    assert np.array_equal(M, np.array([[2, 1, 1], [1, 3, 2]]))
+
+
+def test_bareiss_pivot_falls_back_to_python_integers():
+    M = np.array([[2**40, 1], [1, 2**40]], dtype=np.int64)
+    pivoted = bareiss_pivot(M, 0, 0)
+    assert pivoted.dtype == object
+    assert pivoted[1, 1] == 2**80 - 1
+
+
+def test_bareiss_solve():
+    M = np.array([[0, 1], [2, 1]])
+    b = np.array([1, 0])
+    assert list(bareiss_solve(M, b)) == [Fraction(-1, 2), Fraction(1)]
+    assert bareiss_solve(np.array([[1, 2], [2, 4]]), b) is None
+
+
+@settings(max_examples=20)
+@given(M=arrays(np.int8, (4, 4)), b=arrays(np.int8, 4))
+def test_bareiss_solve_against_float_solve(M, b):
+    solution = bareiss_solve(M, b)
+    if solution is None:
+        assert np.linalg.matrix_rank(M) < 4
+    else:
+        assert all(np.dot(M.astype(object), solution) == b)
+
+
+def test_exact_ratios():
+    ratios = exact_ratios(np.array([1, -1, 0, 2]), np.array([0, 0, 0, 4]))
+    assert list(ratios) == [np.inf, -np.inf, -np.inf, Fraction(1, 2)]
+
+
+def test_approximate_ratios():
+    for dtype in (np.int64, object):
+        ratios = approximate_ratios(
+            np.array([1, -1, 0, 2], dtype=dtype), np.array([0, 0, 0, 4], dtype=dtype)
+        )
+        assert ratios.dtype == float
+        assert list(ratios) == [np.inf, -np.inf, -np.inf, 0.5]
+    ratios = approximate_ratios(
+        np.array([3 * 10**400], dtype=object), np.array([10**400], dtype=object)
+    )
+    assert list(ratios) == [3]
+
+
+def test_largest_ratio_rows():
+    rows = largest_ratio_rows(np.array([1, 2, 4, 0]), np.array([2, 4, 7, 0]))
+    assert list(rows) == [False, False, True, False]
+    rows = largest_ratio_rows(np.array([1, 2, 1, 0]), np.array([2, 4, 3, 0]))
+    assert list(rows) == [True, True, False, False]
+    rows = largest_ratio_rows(np.array([1, 0, 1]), np.array([0, 2, 0]))
+    assert list(rows) == [True, False, True]
+
+
+def test_largest_ratio_rows_separates_ratios_that_are_equal_as_floats():
+    """Test that ratios that are equal as floats are compared exactly"""
+    big = 10**30
+    numerators = np.array([big + 1, big, 1], dtype=object)
+    denominators = np.array([big, big - 1, 1], dtype=object)
+    assert approximate_ratios(numerators, denominators)[0] == 1
+    rows = largest_ratio_rows(numerators, denominators)
+    assert list(rows) == [False, True, False]
@@ -0,0 +1,79 @@
+"""
+Tests for solving a stack of games
+"""
+
+import numpy as np
+import pytest
+
+import nashpy as nash
+from nashpy.algorithms.batch import equilibria_dtype, stacked_support_enumeration
+from nashpy.algorithms.support_enumeration import support_enumeration
+
+
+def test_equilibria_dtype():
+    dtype = equilibria_dtype(3, 2)
+    assert dtype.names == ("game", "row_strategy", "column_strategy")
+    assert dtype["row_strategy"].shape == (3,)
+    assert dtype["column_strategy"].shape == (2,)
+
+
+def test_stacked_support_enumeration():
+    A_stack = np.array([[[1, -1], [-1, 1]], [[3, 0], [5, 1]], [[2, 0], [0, 1]]])
+    B_stack = np.array([[[-1, 1], [1, -1]], [[3, 5], [0, 1]], [[1, 0], [0, 2]]])
+    equilibria = stacked_support_enumeration(A_stack, B_stack, batch_size=3)
+    assert list(equilibria["game"]) == [0, 1, 2, 2, 2]
+    expected_equilibria = [
+        ([1 / 2, 1 / 2], [1 / 2, 1 / 2]),
+        ([0, 1], [0, 1]),
+        ([1, 0], [1, 0]),
+        ([0, 1], [0, 1]),
+        ([2 / 3, 1 / 3], [1 / 3, 2 / 3]),
+    ]
+    for equilibrium, (s1, s2) in zip(equilibria, expected_equilibria):
+        assert np.allclose(equilibrium["row_strategy"], s1)
+        assert np.allclose(equilibrium["column_strategy"], s2)
+
+
+def test_stacked_support_enumeration_matches_support_enumeration():
+    rng = np.random.default_rng(0)
+    A_stack = rng.random((20, 4, 3))
+    B_stack = rng.random((20, 4, 3))
+    equilibria = stacked_support_enumeration(A_stack, B_stack, batch_size=50)
+    expected_equilibria = [
+        (game, s1, s2)
+        for game in range(20)
+        for s1, s2 in support_enumeration(A_stack[game], B_stack[game], batched=True)
+    ]
+    assert len(equilibria) == len(expected_equilibria)
+    for equilibrium, (game, s1, s2) in zip(equilibria, expected_equilibria):
+        assert equilibrium["game"] == game
+        assert np.allclose(equilibrium["row_strategy"], s1)
+        assert np.allclose(equilibrium["column_strategy"], s2)
+
+
+def test_solve_batch_with_other_methods():
+    A_stack = np.array([[[1, -1], [-1, 1]], [[3, 0], [5, 1]]])
+    B_stack = -A_stack
+    B_stack[1] = A_stack[1].T
+    for method, games in (("vertex_enumeration", [0, 1]), ("lemke_howson", [0, 1])):
+        equilibria = nash.solve_batch(A_stack, B_stack, method=method)
+        assert list(equilibria["game"]) == games
+        assert np.allclose(equilibria[0]["row_strategy"], [1 / 2, 1 / 2])
+        assert np.allclose(equilibria[1]["column_strategy"], [0, 1])
+
+
+def test_solve_batch_with_no_equilibria_found():
+    A_stack = np.zeros((2, 2, 2))
+    equilibria = nash.solve_batch(A_stack, A_stack, tol=1)
+    assert len(equilibria) == 0
+    assert equilibria.dtype == equilibria_dtype(2, 2)
+
+
+def test_solve_batch_with_invalid_arguments():
+    A_stack = np.zeros((2, 2, 2))
+    with pytest.raises(ValueError):
+        nash.solve_batch(A_stack, np.zeros((2, 2, 3)))
+    with pytest.raises(ValueError):
+        nash.solve_batch(A_stack[0], A_stack[0])
+    with pytest.raises(ValueError):
+        nash.solve_batch(A_stack, A_stack, method="not_a_method")
@@ -0,0 +1,107 @@
+"""
+Tests for the bounded enumeration of equilibria
+"""
+
+import time
+import warnings
+
+import numpy as np
+
+from nashpy.algorithms.bounded_enumeration import (
+    EquilibriaResult,
+    bounded_enumeration,
+    timed_support_enumeration,
+)
+from nashpy.algorithms.support_enumeration import support_enumeration
+from nashpy.algorithms.vertex_enumeration import vertex_enumeration
+
+
+class CountdownDeadline(float):
+    """A deadline that passes once it has been checked a number of times"""
+
+    def __new__(cls, checks):
+        deadline = super().__new__(cls, float("inf"))
+        deadline.checks = checks
+        return deadline
+
+    def __le__(self, other):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_timed_support_enumeration_without_deadline():
+    A = np.array([[3, 3], [2, 5], [0, 6]])
+    B = np.array([[3, 2], [2, 6], [3, 1]])
+    for non_degenerate in (False, True):
+        expected_equilibria = list(
+            support_enumeration(A, B, non_degenerate=non_degenerate)
+        )
+        equilibria = list(
+            timed_support_enumeration(A, B, non_degenerate=non_degenerate)
+        )
+        assert len(equilibria) == len(expected_equilibria)
+        for equilibrium, expected_equilibrium in zip(equilibria, expected_equilibria):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                assert np.array_equal(strategy, expected_strategy)
+
+
+def test_timed_support_enumeration_with_passed_deadline():
+    A = np.array([[0, 0], [0, 0]])
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        result = bounded_enumeration(
+            timed_support_enumeration(A, A, deadline=time.perf_counter())
+        )
+        assert len(w) == 0
+    assert result == EquilibriaResult(equilibria=[], complete=False)
+
+
+def test_bounded_enumeration_closes_the_generator():
+    closed = []
+
+    def equilibria():
+        try:
+            for i in range(10):
+                yield np.array([i]), np.array([i])
+        finally:
+            closed.append(True)
+
+    result = bounded_enumeration(equilibria(), max_equilibria=3)
+    assert closed == [True]
+    assert not result.complete
+    assert [s1[0] for s1, _ in result.equilibria] == [0, 1, 2]
+
+    result = bounded_enumeration(equilibria())
+    assert result.complete
+    assert len(result.equilibria) == 10
+
+
+def test_deadline_is_checked_within_the_enumerations():
+    """Test that the enumerations stop after a given number of checks of the
+    deadline, including between the column supports of a row support and
+    between the vertices"""
+    A = np.array([[3, 3], [2, 5], [0, 6]])
+    B = np.array([[3, 2], [2, 6], [3, 1]])
+    for enumeration in (timed_support_enumeration, vertex_enumeration):
+        expected_equilibria = list(enumeration(A, B))
+        numbers_of_equilibria = []
+        checks = 0
+        result = EquilibriaResult(equilibria=[], complete=False)
+        while not result.complete:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                result = bounded_enumeration(
+                    enumeration(A, B, deadline=CountdownDeadline(checks))
+                )
+            for equilibrium, expected_equilibrium in zip(
+                result.equilibria, expected_equilibria
+            ):
+                for strategy, expected_strategy in zip(
+                    equilibrium, expected_equilibrium
+                ):
+                    assert np.array_equal(strategy, expected_strategy)
+            numbers_of_equilibria.append(len(result.equilibria))
+            checks += 1
+        assert numbers_of_equilibria == sorted(numbers_of_equilibria)
+        assert numbers_of_equilibria[-1] == len(expected_equilibria)
+        assert len(set(numbers_of_equilibria)) > 2
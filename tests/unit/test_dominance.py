@@ -0,0 +1,74 @@
+"""
+Tests for the iterated elimination of strictly dominated strategies
+"""
+
+import numpy as np
+
+from nashpy.utils.dominance import (
+    expand_strategy,
+    is_strictly_dominated,
+    iterated_elimination_of_dominated_strategies,
+)
+
+
+def test_is_strictly_dominated_by_pure_strategy():
+    A = np.array([[3, 0], [5, 1]])
+    assert is_strictly_dominated(A, 0) is True
+    assert is_strictly_dominated(A, 1) is False
+    assert is_strictly_dominated(A, 0, mixed=False) is True
+
+
+def test_is_strictly_dominated_by_mixed_strategy():
+    A = np.array([[3, 0], [0, 3], [1, 1]])
+    assert is_strictly_dominated(A, 2) is True
+    assert is_strictly_dominated(A, 2, mixed=False) is False
+    assert is_strictly_dominated(A, 0) is False
+
+
+def test_is_strictly_dominated_with_weak_dominance():
+    """A weakly dominated strategy is not removed"""
+    A = np.array([[3, 0], [0, 3], [3 / 2, 3 / 2]])
+    assert is_strictly_dominated(A, 2) is False
+    A = np.array([[1, 1], [1, 2]])
+    assert is_strictly_dominated(A, 0) is False
+
+
+def test_is_strictly_dominated_with_single_strategy():
+    A = np.array([[3, 0]])
+    assert is_strictly_dominated(A, 0) is False
+
+
+def test_iterated_elimination_for_prisoners_dilemma():
+    A = np.array([[3, 0], [5, 1]])
+    rows, columns = iterated_elimination_of_dominated_strategies(A, A.T)
+    assert np.array_equal(rows, [1])
+    assert np.array_equal(columns, [1])
+
+
+def test_iterated_elimination_with_mixed_dominance():
+    """
+    The third row is dominated by a mixture of the first two. Once it is
+    removed the last column is dominated by the first.
+    """
+    A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+    B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+    rows, columns = iterated_elimination_of_dominated_strategies(A, B)
+    assert np.array_equal(rows, [0, 1])
+    assert np.array_equal(columns, [0, 1])
+
+    rows, columns = iterated_elimination_of_dominated_strategies(A, B, mixed=False)
+    assert np.array_equal(rows, [0, 1, 2])
+    assert np.array_equal(columns, [0, 1, 2])
+
+
+def test_iterated_elimination_without_dominated_strategies():
+    A = np.array([[1, -1], [-1, 1]])
+    rows, columns = iterated_elimination_of_dominated_strategies(A, -A)
+    assert np.array_equal(rows, [0, 1])
+    assert np.array_equal(columns, [0, 1])
+
+
+def test_expand_strategy():
+    strategy = np.array([1 / 4, 3 / 4])
+    expanded_strategy = expand_strategy(strategy, np.array([0, 2]), 4)
+    assert np.array_equal(expanded_strategy, np.array([1 / 4, 0, 3 / 4, 0]))
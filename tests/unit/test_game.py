@@ -402,6 +402,259 @@ Column player:
             for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
                 self.assertTrue(all(np.isclose(strategy, expected_strategy)))
 
+    def test_lemke_howson_enumeration_with_eliminate_dominated(self):
+        """Test for the enumeration of equilibrium using Lemke Howson once
+        dominated strategies are removed"""
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+        g = nash.Game(A, B)
+        expected_equilibria = [
+            (np.array([1, 0, 0]), np.array([1, 0, 0])),
+            (np.array([0, 1, 0]), np.array([0, 1, 0])),
+        ] * 2
+        equilibria = list(g.lemke_howson_enumeration(eliminate_dominated=True))
+        self.assertEqual(len(equilibria), len(expected_equilibria))
+        for equilibrium, expected_equilibrium in zip(equilibria, expected_equilibria):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                self.assertTrue(all(np.isclose(strategy, expected_strategy)))
+
+    def test_lemke_howson_enumeration_with_fraction_free_pivoting(self):
+        """Test that fraction free pivoting gives the same equilibria"""
+        A = np.array([[3, 1, 0], [0, 2, 4], [1, 1, 1]])
+        B = np.array([[2, 1, 0], [0, 3, 1], [1, 0, 2]])
+        g = nash.Game(A, B)
+        equilibria = list(g.lemke_howson_enumeration(fraction_free=True))
+        expected_equilibria = list(g.lemke_howson_enumeration())
+        self.assertEqual(len(equilibria), len(expected_equilibria))
+        for equilibrium, expected_equilibrium in zip(equilibria, expected_equilibria):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                self.assertTrue(all(np.isclose(strategy, expected_strategy)))
+
+    def test_lemke_howson_graph_enumeration(self):
+        """Test for the enumeration of equilibria by following the Lemke
+        Howson paths from every equilibrium"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        g = nash.Game(A, B)
+        expected_equilibria = [
+            (np.array([1, 0, 0]), np.array([1, 0])),
+            (np.array([0, 1 / 3, 2 / 3]), np.array([1 / 3, 2 / 3])),
+            (np.array([4 / 5, 1 / 5, 0]), np.array([2 / 3, 1 / 3])),
+        ]
+        for kwargs in ({}, {"exact": True}, {"fraction_free": True}):
+            equilibria = list(g.lemke_howson_graph_enumeration(**kwargs))
+            self.assertEqual(len(equilibria), len(expected_equilibria))
+            for equilibrium, expected_equilibrium in zip(
+                equilibria, expected_equilibria
+            ):
+                for strategy, expected_strategy in zip(
+                    equilibrium, expected_equilibrium
+                ):
+                    self.assertTrue(
+                        np.allclose(strategy.astype(float), expected_strategy)
+                    )
+
+    def test_warm_started_lemke_howson(self):
+        """Test for the Lemke Howson algorithm started from the basis of the
+        equilibrium of a perturbed game"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        result = nash.Game(A, B).warm_started_lemke_howson(initial_dropped_label=1)
+        self.assertFalse(result.warm_started)
+        perturbation = np.array([[0.1, 0], [0, 0.2], [0, 0.1]])
+        g = nash.Game(A + perturbation, B - perturbation)
+        for kwargs in ({}, {"exact": True}, {"fraction_free": True}):
+            warm_result = g.warm_started_lemke_howson(basis=result.basis, **kwargs)
+            self.assertTrue(warm_result.warm_started)
+            self.assertEqual(warm_result.basis, result.basis)
+            for strategy, expected_strategy in zip(
+                warm_result, g.lemke_howson(initial_dropped_label=1, **kwargs)
+            ):
+                self.assertTrue(
+                    np.allclose(strategy.astype(float), expected_strategy.astype(float))
+                )
+            strategies = (warm_result.row_strategy, warm_result.column_strategy)
+            self.assertTrue(
+                g.warm_started_lemke_howson(strategies=strategies).warm_started
+            )
+
+    def test_lemke_howson_with_max_pivots(self):
+        """Test that the Lemke Howson algorithm stops after a maximum number
+        of pivots"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        g = nash.Game(A, B)
+        with self.assertWarns(RuntimeWarning):
+            eqs = g.lemke_howson(initial_dropped_label=1, max_pivots=3)
+        self.assertTrue(all(np.isnan(strategy).all() for strategy in eqs))
+        result = g.warm_started_lemke_howson(initial_dropped_label=1, max_pivots=3)
+        self.assertEqual(result.status, "max_pivots")
+        self.assertEqual(result.pivots, 3)
+        result = g.lemke_howson(initial_dropped_label=1, max_pivots=3, diagnostics=True)
+        self.assertEqual(result.status, "max_pivots")
+        self.assertEqual(result.pivots, 3)
+        result = g.lemke_howson(initial_dropped_label=1, diagnostics=True)
+        self.assertEqual(result.status, "equilibrium")
+        self.assertTrue(np.allclose(result.row_strategy, [0, 1 / 3, 2 / 3]))
+
+    def test_lemke_howson_enumeration_skips_failed_runs(self):
+        """Test that the runs that stop before reaching an equilibrium are
+        skipped with a warning"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        g = nash.Game(A, B)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            equilibria = list(g.lemke_howson_enumeration(max_pivots=3))
+        pivots = [
+            g.lemke_howson(initial_dropped_label=label, diagnostics=True).pivots
+            for label in range(5)
+        ]
+        self.assertEqual(len(equilibria), sum(number <= 3 for number in pivots))
+        self.assertEqual(len(w), sum(number > 3 for number in pivots))
+        self.assertGreater(len(w), 0)
+        for equilibrium in equilibria:
+            self.assertFalse(any(np.isnan(strategy).any() for strategy in equilibrium))
+
+    def test_lemke_howson_with_sparse_backend(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        g = nash.Game(A, B)
+        for label in range(5):
+            for strategy, expected_strategy in zip(
+                g.lemke_howson(initial_dropped_label=label, backend="sparse"),
+                g.lemke_howson(initial_dropped_label=label),
+            ):
+                self.assertTrue(np.allclose(strategy, expected_strategy))
+        result = g.warm_started_lemke_howson(initial_dropped_label=1, backend="sparse")
+        self.assertEqual(result.dropped_labels, [4, 2, 3, 1])
+
+    def test_vertex_enumeration_with_reverse_search(self):
+        A = np.array([[1, -1], [-1, 1]])
+        g = nash.Game(A)
+        equilibria = list(g.vertex_enumeration(vertex_method="reverse_search"))
+        self.assertEqual(len(equilibria), 1)
+        for strategy in equilibria[0]:
+            self.assertTrue(np.array_equal(strategy, np.array([0.5, 0.5])))
+
+    def test_vertex_enumeration_with_cache(self):
+        A = np.array([[1, -1], [-1, 1]])
+        g = nash.Game(A)
+        for _ in range(2):
+            equilibria = list(g.vertex_enumeration(use_cache=True))
+            self.assertEqual(len(equilibria), 1)
+            for strategy in equilibria[0]:
+                self.assertTrue(np.allclose(strategy, np.array([0.5, 0.5])))
+
+    def test_support_and_vertex_enumeration_with_eliminate_dominated(self):
+        """Test that removing dominated strategies does not change the
+        equilibria"""
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+        g = nash.Game(A, B)
+        expected_equilibria = list(g.support_enumeration())
+        for equilibria in (
+            list(g.support_enumeration(eliminate_dominated=True)),
+            list(g.vertex_enumeration(eliminate_dominated=True)),
+        ):
+            self.assertEqual(len(equilibria), len(expected_equilibria))
+            for equilibrium in equilibria:
+                self.assertTrue(
+                    any(
+                        all(
+                            np.allclose(strategy, expected_strategy)
+                            for strategy, expected_strategy in zip(
+                                equilibrium, expected_equilibrium
+                            )
+                        )
+                        for expected_equilibrium in expected_equilibria
+                    )
+                )
+
+    def test_support_enumeration_for_two_by_n_game(self):
+        """Test that the closed form equilibria of a game in which a player
+        has two strategies are those of support enumeration"""
+        A = np.array([[3, 0, 1, 2], [0, 3, 0, 1]])
+        B = np.array([[2, 0, 1, 0], [0, 2, 0, 1]])
+        for game in (nash.Game(A, B), nash.Game(B.T, A.T)):
+            obtained_equilibria = list(game.support_enumeration())
+            expected_equilibria = list(
+                nash.algorithms.support_enumeration.support_enumeration(
+                    *game.payoff_matrices
+                )
+            )
+            self.assertEqual(len(obtained_equilibria), 3)
+            self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+            for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+                for s1, s2 in zip(obtained, expected):
+                    self.assertTrue(np.allclose(s1, s2))
+            result = game.equilibria()
+            self.assertTrue(result.complete)
+            self.assertEqual(len(result.equilibria), 3)
+
+    def test_equilibria_with_max_equilibria(self):
+        """Test that only the first equilibria are obtained and that no
+        warning is issued for a partial enumeration"""
+        A = np.array([[0, 0], [0, 0]])
+        g = nash.Game(A)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected_equilibria = list(g.support_enumeration())
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = g.equilibria(max_equilibria=2)
+            self.assertEqual(len(w), 0)
+        self.assertFalse(result.complete)
+        self.assertEqual(len(result.equilibria), 2)
+        for equilibrium, expected_equilibrium in zip(
+            result.equilibria, expected_equilibria
+        ):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                self.assertTrue(np.array_equal(strategy, expected_strategy))
+
+    def test_equilibria_complete(self):
+        """Test that all the equilibria are obtained without a budget"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        g = nash.Game(A, B)
+        for method in (
+            "support_enumeration",
+            "vertex_enumeration",
+            "lemke_howson_enumeration",
+            "lemke_howson_graph_enumeration",
+        ):
+            result = g.equilibria(method=method)
+            self.assertTrue(result.complete)
+            self.assertGreater(len(result.equilibria), 0)
+        result = g.equilibria()
+        self.assertEqual(len(result.equilibria), 3)
+        result = g.equilibria(max_equilibria=5, tol=10**-10)
+        self.assertTrue(result.complete)
+        self.assertEqual(len(result.equilibria), 3)
+
+    def test_equilibria_with_time_budget(self):
+        """Test that the enumeration stops once the time budget is spent"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        g = nash.Game(A, B)
+        for kwargs in ({}, {"batched": True}, {"method": "vertex_enumeration"}):
+            result = g.equilibria(time_budget=0, **kwargs)
+            self.assertFalse(result.complete)
+            self.assertEqual(result.equilibria, [])
+        result = g.equilibria(time_budget=60)
+        self.assertTrue(result.complete)
+        self.assertEqual(len(result.equilibria), 3)
+
+    def test_equilibria_with_invalid_arguments(self):
+        """Test that invalid arguments raise an error"""
+        g = nash.Game(np.array([[1, -1], [-1, 1]]))
+        with self.assertRaises(ValueError):
+            g.equilibria(method="not_a_method")
+        with self.assertRaises(ValueError):
+            g.equilibria(max_equilibria=-1)
+        with self.assertRaises(ValueError):
+            g.equilibria(time_budget=-1)
+
     def test_get_item(self):
         """Test solve indifference"""
         A = np.array([[1, -1], [-1, 1]])
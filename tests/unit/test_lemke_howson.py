@@ -1,9 +1,33 @@
 import unittest
 import warnings
+from fractions import Fraction
 
 import numpy as np
+import scipy.sparse
 
-from nashpy.algorithms.lemke_howson import lemke_howson
+from nashpy.algorithms.lemke_howson import (
+    follow_lemke_howson_path,
+    follow_lemke_path,
+    lemke_howson,
+    lemke_howson_with_diagnostics,
+    resume_lemke_howson,
+    strategies_basis,
+    warm_started_lemke_howson,
+)
+from nashpy.linalg import (
+    create_col_tableau,
+    create_covering_tableau,
+    create_row_tableau,
+)
+
+
+def tableaux_at_basis(A, B, basis, lexicographic=True):
+    """Return the tableaux of a game pivoted to a basis"""
+    row_tableau = create_row_tableau(B, lexicographic)
+    col_tableau = create_col_tableau(A, lexicographic)
+    row_tableau.pivot_to_basis(basis[0])
+    col_tableau.pivot_to_basis(basis[1])
+    return row_tableau, col_tableau
 
 
 class TestLemkeHowson(unittest.TestCase):
@@ -41,11 +65,10 @@ class TestLemkeHowson(unittest.TestCase):
         A = np.array([[-1, -1, -1], [0, 0, 0], [-1, -1, -10000]])
         B = np.array([[-1, -1, -1], [0, 0, 0], [-1, -1, -10000]])
         with warnings.catch_warnings(record=True) as w:
-            eqs = lemke_howson(A, B, initial_dropped_label=0, lexicographic=False)
-            self.assertEqual(len(eqs[0]), 2)
-            self.assertEqual(len(eqs[1]), 4)
+            lemke_howson(A, B, initial_dropped_label=0, lexicographic=False)
             self.assertGreater(len(w), 0)
             self.assertEqual(w[-1].category, RuntimeWarning)
+            self.assertIn("incorrect shapes", str(w[-1].message))
 
     def test_particular_lemke_howson_with_lexicographic_ratio_test(self):
         """
@@ -131,3 +154,455 @@ class TestLemkeHowson(unittest.TestCase):
         self.assertGreaterEqual(
             nonnans, 14, msg="at least 14 eqs without nan values produced"
         )
+
+    def test_lemke_howson_with_eliminate_dominated(self):
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+        for label, output in [
+            (0, (np.array([1, 0, 0]), np.array([1, 0, 0]))),
+            (1, (np.array([0, 1, 0]), np.array([0, 1, 0]))),
+            (3, (np.array([1, 0, 0]), np.array([1, 0, 0]))),
+            (4, (np.array([0, 1, 0]), np.array([0, 1, 0]))),
+        ]:
+            eqs = lemke_howson(A, B, label, eliminate_dominated=True)
+            for eq, expected_eq in zip(eqs, output):
+                self.assertTrue(all(np.isclose(eq, expected_eq)), msg=str(eq))
+
+    def test_lemke_howson_with_eliminate_dominated_and_dominated_label(self):
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+        for label in (2, 5):
+            with self.assertRaises(ValueError):
+                lemke_howson(A, B, label, eliminate_dominated=True)
+
+    def test_exact_lemke_howson(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        for lexicographic in (True, False):
+            eqs = lemke_howson(A, B, 1, lexicographic=lexicographic, exact=True)
+            self.assertEqual(
+                [list(eq) for eq in eqs],
+                [[0, Fraction(1, 3), Fraction(2, 3)], [Fraction(1, 3), Fraction(2, 3)]],
+            )
+
+    def test_exact_lemke_howson_on_large_integer_game(self):
+        """Test that exact pivoting gives a Nash equilibrium of a large
+        integer game, which requires arbitrary precision integers"""
+        rng = np.random.default_rng(0)
+        A = rng.integers(-100, 100, (30, 30))
+        B = rng.integers(-100, 100, (30, 30))
+        row_strategy, column_strategy = lemke_howson(A, B, 0, exact=True)
+        self.assertEqual(sum(row_strategy), 1)
+        self.assertEqual(sum(column_strategy), 1)
+        row_payoffs = A @ column_strategy
+        column_payoffs = B.T @ row_strategy
+        self.assertEqual(max(row_payoffs), max(row_payoffs[row_strategy > 0]))
+        self.assertEqual(max(column_payoffs), max(column_payoffs[column_strategy > 0]))
+
+    def test_fraction_free_lemke_howson(self):
+        """Test that fraction free pivoting gives the floating point
+        equilibria of exact pivoting"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        for label in range(5):
+            for lexicographic in (True, False):
+                eqs = lemke_howson(
+                    A, B, label, lexicographic=lexicographic, fraction_free=True
+                )
+                exact_eqs = lemke_howson(
+                    A, B, label, lexicographic=lexicographic, exact=True
+                )
+                for strategy, exact_strategy in zip(eqs, exact_eqs):
+                    self.assertEqual(strategy.dtype, float)
+                    self.assertTrue(np.allclose(strategy, exact_strategy.astype(float)))
+
+    def test_fraction_free_lemke_howson_on_degenerate_game(self):
+        """Test that the lexicographic tie breaks of fraction free pivoting
+        are those of exact pivoting"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 3], [2, 6], [3, 1]])
+        for label in range(5):
+            eqs = lemke_howson(A, B, label, fraction_free=True)
+            exact_eqs = lemke_howson(A, B, label, exact=True)
+            for strategy, exact_strategy in zip(eqs, exact_eqs):
+                self.assertTrue(np.allclose(strategy, exact_strategy.astype(float)))
+
+    def test_fraction_free_lemke_howson_on_large_integer_game(self):
+        """Test that fraction free pivoting gives a Nash equilibrium of a
+        large integer game on which floating point pivoting overflows"""
+        rng = np.random.default_rng(0)
+        A = rng.integers(-100, 100, (30, 30))
+        B = rng.integers(-100, 100, (30, 30))
+        row_strategy, column_strategy = lemke_howson(A, B, 0, fraction_free=True)
+        self.assertTrue(np.isclose(sum(row_strategy), 1))
+        self.assertTrue(np.isclose(sum(column_strategy), 1))
+        row_payoffs = A @ column_strategy
+        column_payoffs = B.T @ row_strategy
+        self.assertTrue(
+            np.isclose(max(row_payoffs), max(row_payoffs[row_strategy > 0]))
+        )
+        self.assertTrue(
+            np.isclose(max(column_payoffs), max(column_payoffs[column_strategy > 0]))
+        )
+
+    def test_strategies_basis(self):
+        row_strategy = np.array([0.8, 0.2, 0])
+        column_strategy = np.array([2 / 3, 1 / 3])
+        self.assertEqual(
+            strategies_basis(row_strategy, column_strategy),
+            (frozenset({0, 1}), frozenset({2, 3, 4})),
+        )
+        self.assertEqual(
+            strategies_basis(np.array([1, 0, 0]), np.array([1, 10**-20])),
+            (frozenset({0, 4}), frozenset({1, 2, 3})),
+        )
+        with self.assertRaises(ValueError):
+            strategies_basis(np.zeros(2), np.array([0.5, 0.5]))
+        with self.assertRaises(ValueError):
+            strategies_basis(np.array([0.5, 0.5]), np.zeros(2))
+
+    def test_warm_started_lemke_howson(self):
+        """Test that the equilibrium of a perturbed game is obtained from the
+        basis of the equilibrium of the game"""
+        rng = np.random.default_rng(0)
+        A = rng.random((20, 20))
+        B = rng.random((20, 20))
+        result = warm_started_lemke_howson(A, B)
+        self.assertFalse(result.warm_started)
+        for strategy, expected_strategy in zip(result, lemke_howson(A, B)):
+            self.assertTrue(np.allclose(strategy, expected_strategy))
+        for _ in range(5):
+            A = A + rng.normal(0, 10**-4, A.shape)
+            B = B + rng.normal(0, 10**-4, B.shape)
+            result = warm_started_lemke_howson(A, B, basis=result.basis)
+            self.assertTrue(result.warm_started)
+            row_strategy, column_strategy = result.row_strategy, result.column_strategy
+            self.assertTrue(np.all(row_strategy >= 0) and np.all(column_strategy >= 0))
+            self.assertTrue(
+                np.isclose(
+                    (A @ column_strategy).max(), row_strategy @ A @ column_strategy
+                )
+            )
+            self.assertTrue(
+                np.isclose((row_strategy @ B).max(), row_strategy @ B @ column_strategy)
+            )
+
+    def test_warm_started_lemke_howson_from_strategies(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        for strategies, expected_equilibrium, expected_warm_started in (
+            (
+                (np.array([0.8, 0.2, 0]), np.array([0.6, 0.4])),
+                (np.array([0.8, 0.2, 0]), np.array([2 / 3, 1 / 3])),
+                True,
+            ),
+            (
+                (np.array([0.5, 0, 0.5]), np.array([0.5, 0.5])),
+                (np.array([1, 0, 0]), np.array([1, 0])),
+                True,
+            ),
+            (
+                (np.array([0.5, 0.5, 0]), np.array([1, 0])),
+                lemke_howson(A, B, 2),
+                False,
+            ),
+        ):
+            result = warm_started_lemke_howson(
+                A, B, strategies=strategies, initial_dropped_label=2
+            )
+            self.assertEqual(result.warm_started, expected_warm_started)
+            for strategy, expected_strategy in zip(result, expected_equilibrium):
+                self.assertTrue(np.allclose(strategy, expected_strategy))
+
+    def test_warm_started_lemke_howson_resumes_from_basis(self):
+        """Test that the equilibrium of a perturbed game that the basis does
+        not correspond to is reached with fewer pivots than from the
+        artificial equilibrium"""
+        rng = np.random.default_rng(24)
+        A = rng.random((10, 10))
+        B = rng.random((10, 10))
+        basis = warm_started_lemke_howson(A, B).basis
+        A = A + rng.normal(0, 0.02, A.shape)
+        B = B + rng.normal(0, 0.02, B.shape)
+        result = warm_started_lemke_howson(A, B, basis=basis)
+        self.assertTrue(result.warm_started)
+        self.assertEqual(result.status, "equilibrium")
+        self.assertEqual(len(result.dropped_labels), 2)
+        self.assertNotEqual(result.basis, basis)
+        self.assertLess(result.pivots, warm_started_lemke_howson(A, B).pivots)
+        row_strategy, column_strategy = result.row_strategy, result.column_strategy
+        self.assertTrue(np.all(row_strategy >= 0) and np.all(column_strategy >= 0))
+        self.assertTrue(
+            np.isclose((A @ column_strategy).max(), row_strategy @ A @ column_strategy)
+        )
+        self.assertTrue(
+            np.isclose((row_strategy @ B).max(), row_strategy @ B @ column_strategy)
+        )
+        self.assertEqual(
+            strategies_basis(row_strategy, column_strategy, tol=10**-12), result.basis
+        )
+
+    def test_resume_lemke_howson(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        basis = (frozenset({0, 2}), frozenset({1, 3, 4}))
+        for lexicographic in (True, False):
+            row_tableau, col_tableau = tableaux_at_basis(A, B, basis, lexicographic)
+            result = resume_lemke_howson(row_tableau, col_tableau, A.shape)
+            self.assertTrue(result.warm_started)
+            self.assertEqual(result.status, "equilibrium")
+            self.assertEqual(result.basis, (frozenset({0, 4}), frozenset({1, 2, 3})))
+            self.assertEqual(result.dropped_labels, [2, 4])
+            self.assertEqual(result.pivots, 7)
+            self.assertTrue(np.allclose(result.row_strategy, [1, 0, 0]))
+            self.assertTrue(np.allclose(result.column_strategy, [1, 0]))
+
+        row_tableau, col_tableau = tableaux_at_basis(A, B, basis)
+        result = resume_lemke_howson(row_tableau, col_tableau, A.shape, max_pivots=1)
+        self.assertFalse(result.warm_started)
+        self.assertEqual(result.status, "max_pivots")
+        self.assertTrue(np.isnan(result.row_strategy).all())
+        self.assertTrue(np.isnan(result.column_strategy).all())
+
+    def test_resume_lemke_howson_without_reaching_an_equilibrium(self):
+        """Test that the basis is not used if the path stops early or reaches
+        the artificial equilibrium, and that the pivots along the path are
+        counted"""
+        for A, B, basis, status in (
+            (
+                np.array([[1, 0, 0], [0, 0, 0], [0, 2, 1]]),
+                np.array([[2, 1, 1], [2, 2, 1], [1, 1, 2]]),
+                (frozenset({1, 3, 4}), frozenset({0, 2, 5})),
+                "ray",
+            ),
+            (
+                np.array([[0, 1, 2], [0, 0, 0], [2, 1, 1]]),
+                np.array([[2, 2, 0], [2, 0, 1], [2, 1, 1]]),
+                (frozenset({2, 3, 4}), frozenset({0, 1, 5})),
+                "cycle",
+            ),
+            (
+                np.array([[1, 1, 2], [0, 1, 0]]),
+                np.array([[0, 2, 2], [0, 0, 1]]),
+                (frozenset({0, 1, 3}), frozenset({2, 4})),
+                "equilibrium",
+            ),
+        ):
+            row_tableau, col_tableau = tableaux_at_basis(A, B, basis)
+            result = resume_lemke_howson(row_tableau, col_tableau, A.shape)
+            self.assertFalse(result.warm_started)
+            self.assertEqual(result.status, status)
+            self.assertTrue(np.isnan(result.row_strategy).all())
+            self.assertTrue(np.isnan(result.column_strategy).all())
+            warm_result = warm_started_lemke_howson(A, B, basis=basis)
+            self.assertFalse(warm_result.warm_started)
+            self.assertEqual(
+                warm_result.pivots, result.pivots + len(warm_result.dropped_labels)
+            )
+
+    def test_warm_started_lemke_howson_from_singular_basis(self):
+        A = np.array([[1, 0, 0], [0, 0, 0], [0, 2, 1]])
+        B = np.array([[2, 1, 1], [2, 2, 1], [1, 1, 2]])
+        basis = (frozenset({0, 1, 3}), frozenset({2, 4, 5}))
+        row_tableau, col_tableau = tableaux_at_basis(A, B, basis)
+        self.assertNotEqual(col_tableau.basic_variables, basis[1])
+        result = warm_started_lemke_howson(A, B, basis=basis)
+        self.assertFalse(result.warm_started)
+        self.assertEqual(result.status, "equilibrium")
+        self.assertEqual(
+            result.pivots,
+            row_tableau.pivots + col_tableau.pivots + len(result.dropped_labels),
+        )
+
+    def test_follow_lemke_path(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        tableau = create_covering_tableau(create_row_tableau(B), create_col_tableau(A))
+        self.assertEqual(follow_lemke_path(tableau, 5), ([], "equilibrium"))
+        self.assertEqual(tableau.pivots, 0)
+        self.assertTrue(
+            np.array_equal(tableau.variable_values(), [0] * 3 + [1] * 5 + [0] * 3)
+        )
+
+    def test_warm_started_lemke_howson_from_artificial_equilibrium(self):
+        """Test that the basis of the artificial equilibrium and strategies
+        with an empty support are not used"""
+        A = np.array([[1, -1], [-1, 1]])
+        B = -A
+        expected_equilibrium = lemke_howson(A, B)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for kwargs in (
+                {"basis": (frozenset({2, 3}), frozenset({0, 1}))},
+                {"strategies": (np.zeros(2), np.zeros(2))},
+                {"strategies": (np.zeros(2), np.array([0.5, 0.5]))},
+            ):
+                result = warm_started_lemke_howson(A, B, **kwargs)
+                self.assertFalse(result.warm_started)
+                self.assertEqual(result.status, "equilibrium")
+                for strategy, expected_strategy in zip(result, expected_equilibrium):
+                    self.assertTrue(np.allclose(strategy, expected_strategy))
+
+    def test_warm_started_lemke_howson_with_exact_pivoting(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        basis = (frozenset({0, 1}), frozenset({2, 3, 4}))
+        result = warm_started_lemke_howson(A, B, basis=basis, exact=True)
+        self.assertTrue(result.warm_started)
+        self.assertEqual(result.basis, basis)
+        self.assertEqual(list(result.row_strategy), [Fraction(4, 5), Fraction(1, 5), 0])
+        self.assertEqual(list(result.column_strategy), [Fraction(2, 3), Fraction(1, 3)])
+
+    def test_follow_lemke_howson_path(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        row_tableau = create_row_tableau(B)
+        col_tableau = create_col_tableau(A)
+        dropped_labels, status = follow_lemke_howson_path(row_tableau, col_tableau, 1)
+        self.assertEqual(status, "equilibrium")
+        self.assertEqual(dropped_labels, [4, 2, 3, 1])
+        self.assertEqual(row_tableau.pivots + col_tableau.pivots, 4)
+
+        row_tableau = create_row_tableau(B)
+        col_tableau = create_col_tableau(A)
+        dropped_labels, status = follow_lemke_howson_path(
+            row_tableau, col_tableau, 1, max_pivots=2
+        )
+        self.assertEqual(status, "max_pivots")
+        self.assertEqual(dropped_labels, [4, 2])
+
+    def test_lemke_howson_with_max_pivots(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        with self.assertWarns(RuntimeWarning):
+            eqs = lemke_howson(A, B, 1, max_pivots=3)
+        self.assertTrue(all(np.isnan(strategy).all() for strategy in eqs))
+        self.assertEqual(eqs[0].shape, (3,))
+        self.assertEqual(eqs[1].shape, (2,))
+        for strategy, expected_strategy in zip(
+            lemke_howson(A, B, 1, max_pivots=4),
+            (np.array([0, 1 / 3, 2 / 3]), np.array([1 / 3, 2 / 3])),
+        ):
+            self.assertTrue(np.allclose(strategy, expected_strategy))
+        with self.assertWarns(RuntimeWarning):
+            eqs = lemke_howson(A, B, 0, max_pivots=1, eliminate_dominated=True)
+        self.assertTrue(all(np.isnan(strategy).all() for strategy in eqs))
+
+    def test_lemke_howson_detects_cycles(self):
+        """Test that the path of a degenerate game without lexicographic
+        pivoting stops once it cycles"""
+        A = np.array([[1, 1, 0], [1, 1, 0], [2, 1, 2], [2, 1, 0]])
+        B = np.array([[2, 1, 2], [2, 1, 0], [1, 2, 0], [2, 0, 2]])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            eqs = lemke_howson(A, B, 6, lexicographic=False)
+        self.assertTrue(any("cycled" in str(warning.message) for warning in w))
+        self.assertTrue(all(np.isnan(strategy).all() for strategy in eqs))
+        result = warm_started_lemke_howson(
+            A, B, initial_dropped_label=6, lexicographic=False
+        )
+        self.assertEqual(result.status, "cycle")
+        self.assertEqual(result.pivots, len(result.dropped_labels))
+        eqs = lemke_howson(A, B, 6)
+        self.assertFalse(any(np.isnan(strategy).any() for strategy in eqs))
+
+    def test_warm_started_lemke_howson_diagnostics(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        result = warm_started_lemke_howson(A, B, initial_dropped_label=1)
+        self.assertEqual(result.status, "equilibrium")
+        self.assertEqual(result.dropped_labels, [4, 2, 3, 1])
+        self.assertEqual(result.pivots, 4)
+        self.assertGreaterEqual(result.elapsed_time, 0)
+
+        warm_result = warm_started_lemke_howson(A, B, basis=result.basis)
+        self.assertEqual(warm_result.status, "equilibrium")
+        self.assertEqual(warm_result.dropped_labels, [])
+        self.assertEqual(warm_result.pivots, 4)
+
+        result = warm_started_lemke_howson(A, B, initial_dropped_label=1, max_pivots=2)
+        self.assertEqual(result.status, "max_pivots")
+        self.assertEqual(result.pivots, 2)
+        self.assertTrue(np.isnan(result.row_strategy).all())
+        self.assertTrue(np.isnan(result.column_strategy).all())
+
+    def test_lemke_howson_with_diagnostics(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        result = lemke_howson_with_diagnostics(A, B, initial_dropped_label=1)
+        self.assertEqual(result.status, "equilibrium")
+        self.assertFalse(result.warm_started)
+        self.assertEqual(result.dropped_labels, [4, 2, 3, 1])
+        self.assertEqual(result.pivots, 4)
+        for strategy, expected_strategy in zip(
+            result[:2], lemke_howson(A, B, initial_dropped_label=1)
+        ):
+            self.assertTrue(np.array_equal(strategy, expected_strategy))
+        self.assertTrue(
+            warm_started_lemke_howson(A, B, basis=result.basis).warm_started
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = lemke_howson_with_diagnostics(
+                A, B, initial_dropped_label=1, max_pivots=2
+            )
+        self.assertEqual(result.status, "max_pivots")
+        self.assertEqual(result.pivots, 2)
+        self.assertTrue(np.isnan(result.row_strategy).all())
+        self.assertTrue(np.isnan(result.column_strategy).all())
+
+    def test_lemke_howson_with_diagnostics_and_eliminate_dominated(self):
+        """Test that the basis and the dropped labels are in terms of the
+        original strategies"""
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+        result = lemke_howson_with_diagnostics(
+            A, B, initial_dropped_label=4, eliminate_dominated=True
+        )
+        self.assertEqual(result.status, "equilibrium")
+        self.assertTrue(np.allclose(result.row_strategy, [0, 1, 0]))
+        self.assertTrue(np.allclose(result.column_strategy, [0, 1, 0]))
+        self.assertEqual(result.dropped_labels, [1, 4])
+        self.assertEqual(
+            result.basis, strategies_basis(result.row_strategy, result.column_strategy)
+        )
+        result = lemke_howson_with_diagnostics(
+            A, B, initial_dropped_label=4, eliminate_dominated=True, max_pivots=1
+        )
+        self.assertEqual(result.status, "max_pivots")
+        self.assertEqual(result.dropped_labels, [1])
+        self.assertTrue(np.isnan(result.row_strategy).all())
+        self.assertTrue(np.isnan(result.column_strategy).all())
+
+    def test_lemke_howson_with_sparse_backend(self):
+        """Test that the sparse backend gives the equilibria of the dense
+        backend, including on sparse payoff matrices"""
+        rng = np.random.default_rng(0)
+        A = rng.random((6, 5)) + 0.1
+        B = rng.random((6, 5)) + 0.1
+        for label in range(11):
+            for strategy, expected_strategy in zip(
+                lemke_howson(A, B, label, backend="sparse"),
+                lemke_howson(A, B, label),
+            ):
+                self.assertTrue(np.array_equal(strategy, expected_strategy))
+
+        A = np.array([[3, 0, 0], [0, 3, 0], [0, 0, 3], [1, 1, 1]])
+        B = np.array([[2, 0, 0], [0, 2, 0], [0, 0, 2], [0, 0, 0]])
+        for label in range(7):
+            s1, s2 = lemke_howson(
+                scipy.sparse.csr_matrix(A),
+                scipy.sparse.csr_matrix(B),
+                label,
+                backend="sparse",
+            )
+            self.assertAlmostEqual((A @ s2).max(), s1 @ A @ s2)
+            self.assertAlmostEqual((s1 @ B).max(), s1 @ B @ s2)
+
+        s1, s2 = lemke_howson(A, B, 0, eliminate_dominated=True, backend="sparse")
+        self.assertEqual(s1.shape, (4,))
+        result = warm_started_lemke_howson(A, B, basis=None, backend="sparse")
+        self.assertEqual(result.status, "equilibrium")
+        with self.assertRaises(ValueError):
+            lemke_howson(A, B, 0, exact=True, backend="sparse")
@@ -0,0 +1,155 @@
+"""
+Tests for the traversal of the graph of equilibria of the Lemke Howson
+algorithm
+"""
+
+import unittest
+import warnings
+from fractions import Fraction
+
+import numpy as np
+
+from nashpy.algorithms.batch import stacked_support_enumeration
+from nashpy.algorithms.lemke_howson import lemke_howson
+from nashpy.algorithms.lemke_howson_graph import (
+    basis_pair,
+    is_same_equilibrium,
+    lemke_howson_graph_enumeration,
+)
+from nashpy.linalg import create_col_tableau, create_row_tableau
+
+
+class TestLemkeHowsonGraph(unittest.TestCase):
+    """
+    Tests for the Lemke Howson graph enumeration
+    """
+
+    def test_basis_pair(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        row_tableau = create_row_tableau(B)
+        col_tableau = create_col_tableau(A)
+        self.assertEqual(
+            basis_pair(row_tableau, col_tableau),
+            (frozenset({0, 1, 2}), frozenset({3, 4})),
+        )
+        row_tableau.pivot_and_drop_label(0)
+        self.assertEqual(
+            basis_pair(row_tableau, col_tableau),
+            (frozenset({1, 2, 3}), frozenset({3, 4})),
+        )
+
+    def test_lemke_howson_graph_enumeration(self):
+        """Test that an equilibrium that no path from the artificial
+        equilibrium reaches is obtained"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        expected_equilibria = [
+            (np.array([1, 0, 0]), np.array([1, 0])),
+            (np.array([0, 1 / 3, 2 / 3]), np.array([1 / 3, 2 / 3])),
+            (np.array([4 / 5, 1 / 5, 0]), np.array([2 / 3, 1 / 3])),
+        ]
+        for label in range(sum(A.shape)):
+            self.assertFalse(
+                is_same_equilibrium(lemke_howson(A, B, label), expected_equilibria[2])
+            )
+        for lexicographic in (True, False):
+            equilibria = list(
+                lemke_howson_graph_enumeration(A, B, lexicographic=lexicographic)
+            )
+            self.assertEqual(len(equilibria), len(expected_equilibria))
+            for equilibrium, expected_equilibrium in zip(
+                equilibria, expected_equilibria
+            ):
+                self.assertTrue(is_same_equilibrium(equilibrium, expected_equilibrium))
+
+    def test_lemke_howson_graph_enumeration_with_exact_pivoting(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        expected_equilibria = [
+            ([1, 0, 0], [1, 0]),
+            ([0, Fraction(1, 3), Fraction(2, 3)], [Fraction(1, 3), Fraction(2, 3)]),
+            ([Fraction(4, 5), Fraction(1, 5), 0], [Fraction(2, 3), Fraction(1, 3)]),
+        ]
+        for kwargs in ({"exact": True}, {"fraction_free": True}):
+            equilibria = list(lemke_howson_graph_enumeration(A, B, **kwargs))
+            self.assertEqual(len(equilibria), len(expected_equilibria))
+            for equilibrium, expected_equilibrium in zip(
+                equilibria, expected_equilibria
+            ):
+                for strategy, expected_strategy in zip(
+                    equilibrium, expected_equilibrium
+                ):
+                    if kwargs.get("exact"):
+                        self.assertEqual(list(strategy), expected_strategy)
+                    else:
+                        self.assertTrue(
+                            np.allclose(strategy, np.array(expected_strategy, float))
+                        )
+
+    def test_lemke_howson_graph_enumeration_on_random_games(self):
+        """Test that the equilibria are distinct equilibria of the game and
+        include those of the Lemke Howson algorithm for every label"""
+        rng = np.random.default_rng(0)
+        for size in (4, 6, 8):
+            A = rng.random((size, size))
+            B = rng.random((size, size))
+            expected_equilibria = [
+                (s1, s2) for _, s1, s2 in stacked_support_enumeration(A[None], B[None])
+            ]
+            equilibria = list(lemke_howson_graph_enumeration(A, B))
+            for index, equilibrium in enumerate(equilibria):
+                self.assertTrue(
+                    any(
+                        is_same_equilibrium(equilibrium, expected_equilibrium)
+                        for expected_equilibrium in expected_equilibria
+                    )
+                )
+                self.assertFalse(
+                    any(
+                        is_same_equilibrium(equilibrium, other)
+                        for other in equilibria[index + 1 :]
+                    )
+                )
+            for label in range(2 * size):
+                self.assertTrue(
+                    any(
+                        is_same_equilibrium(lemke_howson(A, B, label), equilibrium)
+                        for equilibrium in equilibria
+                    )
+                )
+
+    def test_lemke_howson_graph_enumeration_on_degenerate_game(self):
+        """Test that an equilibrium reached with different bases is only
+        obtained once"""
+        A = np.array([[1, 1], [1, 1]])
+        equilibria = list(lemke_howson_graph_enumeration(A, -A))
+        self.assertGreater(len(equilibria), 0)
+        for index, equilibrium in enumerate(equilibria):
+            for other in equilibria[index + 1 :]:
+                self.assertFalse(is_same_equilibrium(equilibrium, other))
+
+    def test_lemke_howson_graph_enumeration_ignores_paths_that_cycle(self):
+        A = np.array([[1, 1, 0], [1, 1, 0], [2, 1, 2], [2, 1, 0]])
+        B = np.array([[2, 1, 2], [2, 1, 0], [1, 2, 0], [2, 0, 2]])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            equilibria = list(lemke_howson_graph_enumeration(A, B, lexicographic=False))
+        self.assertGreater(len(equilibria), 0)
+
+    def test_is_same_equilibrium(self):
+        equilibrium = (np.array([0.5, 0.5]), np.array([1.0, 0.0]))
+        self.assertTrue(
+            is_same_equilibrium(
+                equilibrium,
+                (np.array([Fraction(1, 2), Fraction(1, 2)]), np.array([1, 0])),
+            )
+        )
+        self.assertFalse(
+            is_same_equilibrium(equilibrium, (np.array([0.5, 0.5]), np.array([0, 1])))
+        )
+        self.assertFalse(
+            is_same_equilibrium(
+                equilibrium, (np.array([0.5, 0.5]), np.array([1.0, 0.0, 0.0]))
+            )
+        )
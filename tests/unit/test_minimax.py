@@ -11,6 +11,7 @@ from nashpy.linalg.minimax import (
     get_bounds,
     get_c,
     linear_program,
+    ZeroSumSolver,
 )
 
 
@@ -138,9 +139,12 @@ def test_linear_program_for_matrix_in_docs_for_row_player():
             [1, -1, 1],
         ]
     )
-    x = linear_program(row_player_payoff_matrix=M)
+    x, y, value = linear_program(row_player_payoff_matrix=M)
     expected_x = np.array([0.44444444, 0.22222222, 0.0, 0.33333333])
     assert np.allclose(x, expected_x)
+    expected_y = np.array([0.22222222, 0.44444444, 0.33333333])
+    assert np.allclose(y, expected_y)
+    assert np.isclose(value, 1 / 9)
 
 
 def test_linear_program_for_matrix_in_docs_for_column_player():
@@ -152,6 +156,193 @@ def test_linear_program_for_matrix_in_docs_for_column_player():
             [1, -1, 1],
         ]
     )
-    x = linear_program(row_player_payoff_matrix=-M.T)
+    x, y, value = linear_program(row_player_payoff_matrix=-M.T)
     expected_x = np.array([0.22222222, 0.44444444, 0.33333333])
     assert np.allclose(x, expected_x)
+    expected_y = np.array([0.44444444, 0.22222222, 0.0, 0.33333333])
+    assert np.allclose(y, expected_y)
+    assert np.isclose(value, -1 / 9)
+
+
+def test_linear_program_strategies_are_optimal():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        number_of_rows, number_of_columns = rng.integers(1, 6, 2)
+        A = rng.integers(-5, 6, (number_of_rows, number_of_columns))
+        row_strategy, column_strategy, value = linear_program(
+            row_player_payoff_matrix=A
+        )
+        for strategy in (row_strategy, column_strategy):
+            assert np.all(strategy >= 0)
+            assert np.isclose(strategy.sum(), 1)
+        assert np.all(row_strategy @ A >= value - 10**-9)
+        assert np.all(A @ column_strategy <= value + 10**-9)
+        assert np.isclose(value, row_strategy @ A @ column_strategy)
+
+
+def test_zero_sum_solver_for_matrix_in_docs():
+    M = np.array(
+        [
+            [0, 1, -1],
+            [-1, 0, 1],
+            [1, -1, 0],
+            [1, -1, 1],
+        ]
+    )
+    solver = ZeroSumSolver()
+    for warm_started in (False, True):
+        row_strategy, column_strategy, value = solver.solve(M)
+        assert solver.warm_started is warm_started
+        assert np.allclose(
+            row_strategy, np.array([0.44444444, 0.22222222, 0.0, 0.33333333])
+        )
+        assert np.allclose(
+            column_strategy, np.array([0.22222222, 0.44444444, 0.33333333])
+        )
+        assert np.isclose(value, 1 / 9)
+    assert solver.pivots == 0
+    solver.reset()
+    solver.solve(M)
+    assert solver.warm_started is False
+    assert solver.pivots == 4
+
+
+def test_zero_sum_solver_agrees_with_linear_program():
+    rng = np.random.default_rng(0)
+    solver = ZeroSumSolver()
+    for _ in range(200):
+        number_of_rows, number_of_columns = rng.integers(1, 6, 2)
+        A = rng.integers(-5, 6, (number_of_rows, number_of_columns))
+        row_strategy, column_strategy, value = solver.solve(A)
+        _, _, expected_value = linear_program(row_player_payoff_matrix=A)
+        assert np.isclose(value, expected_value)
+        for strategy in (row_strategy, column_strategy):
+            assert np.all(strategy >= 0)
+            assert np.isclose(strategy.sum(), 1)
+        assert np.all(row_strategy @ A >= value - 10**-9)
+        assert np.all(A @ column_strategy <= value + 10**-9)
+
+
+def test_zero_sum_solver_on_drifting_game():
+    """Test that a slowly changing game is solved from the previous basis in
+    fewer pivots"""
+    rng = np.random.default_rng(0)
+    A = rng.random((10, 10))
+    solver = ZeroSumSolver()
+    solver.solve(A)
+    cold_pivots = solver.pivots
+    for _ in range(20):
+        A = A + rng.normal(0, 10**-3, A.shape)
+        row_strategy, column_strategy, value = solver.solve(A)
+        assert solver.warm_started is True
+        assert solver.pivots < cold_pivots
+        assert np.isclose(value, linear_program(row_player_payoff_matrix=A)[2])
+        assert np.all(row_strategy @ A >= value - 10**-9)
+        assert np.all(A @ column_strategy <= value + 10**-9)
+
+
+def test_zero_sum_solver_with_infeasible_previous_basis():
+    """Test that the dual simplex method is used when the previous basis is
+    not feasible but its reduced costs are not positive and that the solve
+    starts from the slack variables when the previous basis is neither
+    feasible nor optimal or is singular"""
+    for previous_A, A, warm_started, expected in (
+        (
+            np.array([[1, 2], [-2, 1]]),
+            np.array([[-1, 0], [2, -1]]),
+            True,
+            (np.array([0.75, 0.25]), np.array([0.25, 0.75]), -0.25),
+        ),
+        (
+            np.array([[-1, -1], [2, 0]]),
+            np.array([[-1, 2], [-1, 0]]),
+            False,
+            (np.array([1, 0]), np.array([1, 0]), -1),
+        ),
+        (
+            np.array([[0, -2], [0, 2]]),
+            np.array([[-1, -1], [1, 1]]),
+            False,
+            (np.array([0, 1]), np.array([1, 0]), 1),
+        ),
+    ):
+        solver = ZeroSumSolver()
+        solver.solve(previous_A)
+        row_strategy, column_strategy, value = solver.solve(A)
+        assert solver.warm_started is warm_started
+        assert solver.pivots == 1
+        assert np.allclose(row_strategy, expected[0])
+        assert np.allclose(column_strategy, expected[1])
+        assert np.isclose(value, expected[2])
+
+
+def test_zero_sum_solver_with_games_of_different_shapes():
+    solver = ZeroSumSolver()
+    solver.solve(np.array([[1, 1, 1], [0, 0, 0]]))
+    assert list(solver.basis) == [0, 4]
+    row_strategy, column_strategy, value = solver.solve(np.array([[1, 2], [3, 0]]))
+    assert solver.warm_started is False
+    assert np.isclose(value, 1.5)
+    solver.solve(np.array([[1, 2], [3, 0], [1, 1]]))
+    assert solver.warm_started is False
+    solver.solve(np.array([[2, 1], [3, 0], [1, 1]]))
+    assert solver.warm_started is True
+
+
+def test_zero_sum_solver_with_nearly_singular_previous_basis():
+    """Test that a previous basis whose inverse is inaccurate is not used"""
+    A = np.array(
+        [
+            [-2, -1, 0, 0, 3, 2],
+            [-3, -1, 0, -1, 2, 2],
+            [-1, 0, 2, 0, -3, 0],
+            [3, 3, -1, 2, -1, 0],
+        ]
+    )
+    solver = ZeroSumSolver()
+    solver.basis = np.array([6, 1, 3, 9])
+    row_strategy, column_strategy, value = solver.solve(A)
+    assert solver.warm_started is False
+    _, _, expected_value = linear_program(row_player_payoff_matrix=A)
+    assert np.isclose(value, expected_value)
+    assert np.all(row_strategy @ A >= value - 10**-9)
+    assert np.all(A @ column_strategy <= value + 10**-9)
+
+
+class FailingWarmStartSolver(ZeroSumSolver):
+    """A solver whose solves from the previous basis fail"""
+
+    def _simplex(self, M, c, basis, inverse):
+        """Fail if warm started"""
+        if self.warm_started:
+            return None
+        return super()._simplex(M, c, basis, inverse)
+
+
+def test_zero_sum_solver_solves_again_when_warm_start_fails():
+    A = np.array([[1, 2], [-2, 1]])
+    solver = FailingWarmStartSolver()
+    expected = solver.solve(A)
+    row_strategy, column_strategy, value = solver.solve(A)
+    assert solver.warm_started is False
+    assert np.allclose(row_strategy, expected[0])
+    assert np.allclose(column_strategy, expected[1])
+    assert np.isclose(value, expected[2])
+
+
+def test_zero_sum_solver_simplex_on_infeasible_linear_program():
+    """Test that the dual simplex method stops when no variable can enter
+    the basis"""
+    solver = ZeroSumSolver()
+    M = np.array([[-1.0, -1.0]])
+    c = np.array([1.0, 0.0])
+    assert solver._simplex(M, c, np.array([1]), np.array([[-1.0]])) is None
+
+
+def test_zero_sum_solver_is_optimal():
+    solver = ZeroSumSolver()
+    M = np.array([[2.0, 2.0, 1.0, 0.0], [2.0, 2.0, 0.0, 1.0]])
+    c = np.array([1.0, 1.0, 0.0, 0.0])
+    assert solver._is_optimal(M, c, np.array([0, 3])) is True
+    assert solver._is_optimal(M, c, np.array([2, 3])) is False
+    assert solver._is_optimal(M, c, np.array([0, 1])) is False
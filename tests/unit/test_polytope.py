@@ -11,9 +11,14 @@ from hypothesis.extra.numpy import arrays
 from hypothesis.strategies import integers
 
 from nashpy.polytope.polytope import (
+    analytic_feasible_point,
+    best_response_matrices,
     build_halfspaces,
     find_feasible_point,
+    find_interior_point,
+    label_matrix,
     labels,
+    non_trivial_vertex_array,
     non_trivial_vertices,
 )
 
@@ -82,6 +87,46 @@ class TestPolytope(unittest.TestCase):
         M, b = halfspaces[:, :-1], halfspaces[:, -1]
         self.assertTrue(all(np.dot(M, feasible_point) <= -b))
 
+    @given(
+        A=arrays(np.int8, (4, 5), elements=integers(0, 10)).filter(
+            lambda a: np.min(a) != np.max(a)
+        )
+    )
+    def test_creation_of_analytic_feasible_point(self, A):
+        halfspaces = build_halfspaces(A)
+        feasible_point = analytic_feasible_point(halfspaces)
+        M, b = halfspaces[:, :-1], halfspaces[:, -1]
+        self.assertTrue(all(np.dot(M, feasible_point) < -b))
+        self.assertTrue(np.array_equal(find_interior_point(halfspaces), feasible_point))
+
+    def test_creation_of_particular_analytic_feasible_point(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        feasible_point = analytic_feasible_point(build_halfspaces(A))
+        self.assertTrue(np.allclose(feasible_point, np.array([1 / 14, 1 / 14])))
+        A = np.array([[1, 0], [2, 0]])
+        feasible_point = analytic_feasible_point(build_halfspaces(A))
+        self.assertTrue(np.allclose(feasible_point, np.array([1 / 4, 1 / 4])))
+        A = np.array([[-1, 0], [0, 0]])
+        feasible_point = analytic_feasible_point(build_halfspaces(A))
+        self.assertTrue(np.array_equal(feasible_point, np.array([1, 1])))
+
+    def test_creation_of_interior_point_without_analytic_feasible_point(self):
+        """Test that a linear program is solved for a polytope that does not
+        contain a multiple of the vector of ones"""
+        halfspaces = np.array(
+            [[1, -1, 1], [-1, 0, 0], [0, -1, 0], [0, 1, -3]], dtype=float
+        )
+        self.assertIsNone(analytic_feasible_point(halfspaces))
+        feasible_point = find_interior_point(halfspaces)
+        self.assertTrue(np.array_equal(feasible_point, find_feasible_point(halfspaces)))
+        self.assertTrue(
+            all(halfspaces[:, :-1] @ feasible_point + halfspaces[:, -1] < 0)
+        )
+        halfspaces = np.array([[0, 0, 1], [-1, 0, 0], [0, -1, 0]], dtype=float)
+        self.assertIsNone(analytic_feasible_point(halfspaces))
+        halfspaces = np.array([[-1, -1, 2], [1, 1, -1]], dtype=float)
+        self.assertIsNone(analytic_feasible_point(halfspaces))
+
     def test_creation_of_particular_feasible_point(self):
         A = np.array([[3, 3], [2, 5], [0, 6]])
         halfspaces = build_halfspaces(A)
@@ -213,3 +258,46 @@ class TestPolytope(unittest.TestCase):
                 np.array_equal(label, expected_label),
                 msg="{} != {}".format(label, expected_label),
             )
+
+    def test_label_matrix(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        halfspaces = build_halfspaces(A)
+        vertices = np.array([[1 / 3, 0], [0, 1 / 6], [2 / 9, 1 / 9], [1 / 12, 1 / 6]])
+        expected_labels = np.zeros((4, 5), dtype=bool)
+        for row, vertex in enumerate(vertices):
+            expected_labels[row, list(labels(vertex, halfspaces))] = True
+        self.assertTrue(
+            np.array_equal(label_matrix(vertices, halfspaces), expected_labels)
+        )
+        self.assertEqual(label_matrix(np.zeros((0, 2)), halfspaces).shape, (0, 5))
+
+    @given(
+        A=arrays(np.int8, (4, 5), elements=integers(0, 10)).filter(
+            lambda a: np.min(a) != np.max(a)
+        )
+    )
+    def test_non_trivial_vertex_array(self, A):
+        halfspaces = build_halfspaces(A)
+        vertices, vertex_labels = non_trivial_vertex_array(halfspaces)
+        self.assertEqual(vertices.shape[1], 5)
+        self.assertEqual(vertex_labels.shape, (len(vertices), 9))
+        expected = list(non_trivial_vertices(halfspaces))
+        self.assertEqual(len(vertices), len(expected))
+        for vertex, v_labels, (expected_vertex, expected_labels) in zip(
+            vertices, vertex_labels, expected
+        ):
+            self.assertTrue(np.array_equal(vertex, expected_vertex))
+            self.assertEqual(set(np.flatnonzero(v_labels)), expected_labels)
+            self.assertEqual(set(np.flatnonzero(v_labels)), labels(vertex, halfspaces))
+
+    def test_best_response_matrices(self):
+        A = np.array([[1, -1], [-1, 1]])
+        B = np.array([[-2, 3], [1, 0]])
+        row_matrix, col_matrix = best_response_matrices(A, B)
+        self.assertTrue(np.array_equal(row_matrix, np.array([[0, 3], [5, 2]])))
+        self.assertTrue(np.array_equal(col_matrix, np.array([[2, 0], [0, 2]])))
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        row_matrix, col_matrix = best_response_matrices(A, B)
+        self.assertTrue(np.array_equal(row_matrix, B.transpose()))
+        self.assertIs(col_matrix, A)
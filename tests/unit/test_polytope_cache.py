@@ -0,0 +1,174 @@
+"""
+Tests for the cache of polytopes
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from nashpy.polytope import (
+    Polytope,
+    PolytopeCache,
+    best_response_matrices,
+    build_halfspaces,
+    build_polytope,
+    fingerprint,
+    labels,
+    non_trivial_vertices,
+    polytope_cache,
+)
+
+
+class TestPolytopeCache(unittest.TestCase):
+    """
+    Tests for the least recently used cache of polytopes
+    """
+
+    def test_fingerprint(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        self.assertEqual(fingerprint(A), fingerprint(A.copy()))
+        self.assertEqual(fingerprint(A), fingerprint(np.asfortranarray(A)))
+        self.assertNotEqual(fingerprint(A), fingerprint(A.astype(float)))
+        self.assertNotEqual(fingerprint(A), fingerprint(A.reshape(2, 3)))
+        self.assertNotEqual(fingerprint(A), fingerprint(A + 1))
+        M = np.array([[1, 2], [3, 4]], dtype=object)
+        self.assertEqual(fingerprint(M), fingerprint(M.copy()))
+        self.assertNotEqual(fingerprint(M), fingerprint(M + 1))
+
+    def test_build_polytope(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        halfspaces = build_halfspaces(A)
+        expected_vertices = sorted(
+            tuple(np.round(vertex, 10))
+            for vertex, _ in non_trivial_vertices(halfspaces)
+        )
+        for vertex_method in ("qhull", "reverse_search"):
+            polytope = build_polytope(A, vertex_method)
+            self.assertIsInstance(polytope, Polytope)
+            self.assertTrue(np.array_equal(polytope.halfspaces, halfspaces))
+            self.assertEqual(polytope.vertices.shape, (4, 2))
+            self.assertEqual(polytope.labels.shape, (4, 5))
+            self.assertEqual(
+                sorted(tuple(np.round(vertex, 10)) for vertex in polytope.vertices),
+                expected_vertices,
+            )
+            for vertex, vertex_labels in zip(polytope.vertices, polytope.labels):
+                self.assertEqual(
+                    set(np.flatnonzero(vertex_labels).tolist()),
+                    labels(vertex, halfspaces),
+                )
+            for array in (polytope.halfspaces, polytope.vertices, polytope.labels):
+                self.assertFalse(array.flags.writeable)
+        feasible_point = build_polytope(A).feasible_point
+        self.assertTrue(
+            np.all(halfspaces[:, :-1] @ feasible_point + halfspaces[:, -1] < 0)
+        )
+        self.assertIsNone(build_polytope(A, "reverse_search").feasible_point)
+
+    def test_build_polytope_without_vertices(self):
+        polytope = build_polytope(np.array([[1, 0]]), "reverse_search")
+        self.assertEqual(polytope.vertices.shape, (1, 2))
+        self.assertEqual(polytope.labels.shape, (1, 3))
+        polytope = build_polytope(np.zeros((1, 2)), "reverse_search")
+        self.assertEqual(polytope.vertices.shape, (0, 2))
+        self.assertEqual(polytope.labels.shape, (0, 3))
+
+    def test_build_polytope_with_unknown_vertex_method(self):
+        with self.assertRaises(ValueError):
+            build_polytope(np.array([[1, 2]]), "cdd")
+
+    def test_get(self):
+        cache = PolytopeCache()
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        polytope = cache.get(A)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+        self.assertIs(cache.get(A.copy()), polytope)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+        self.assertIsNot(cache.get(A, "reverse_search"), polytope)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 2, 2))
+
+    def test_least_recently_used_polytope_is_discarded(self):
+        cache = PolytopeCache(maxsize=2)
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        first = cache.get(A)
+        cache.get(A + 1)
+        cache.get(A)
+        cache.get(A + 2)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(A), first)
+        self.assertEqual(cache.misses, 3)
+        cache.get(A + 1)
+        self.assertEqual(cache.misses, 4)
+        cache = PolytopeCache(maxsize=0)
+        cache.get(A)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_and_clear(self):
+        cache = PolytopeCache()
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        cache.get(A)
+        cache.get(A, "reverse_search")
+        cache.get(A + 1)
+        self.assertEqual(cache.invalidate(A), 2)
+        self.assertEqual(cache.invalidate(A), 0)
+        self.assertEqual(len(cache), 1)
+        cache.get(A)
+        self.assertEqual(cache.misses, 4)
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_invalidate_game(self):
+        """Test that the polytopes obtained by vertex enumeration are removed
+        using the payoff matrices of the game"""
+        cache = PolytopeCache()
+        A = np.array([[1, -1], [-1, 1]])
+        B = np.array([[-2, 3], [1, 0]])
+        for M in best_response_matrices(A, B):
+            cache.get(M)
+            cache.get(M, "reverse_search")
+        cache.get(A)
+        self.assertEqual(cache.invalidate(A), 1)
+        self.assertEqual(cache.invalidate(B), 0)
+        self.assertEqual(cache.invalidate_game(A, B), 4)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.invalidate_game(A, B), 0)
+
+    def test_invalidate_game_without_dominated_strategies(self):
+        """Test that the polytopes obtained by vertex enumeration after
+        eliminating dominated strategies are removed"""
+        cache = PolytopeCache()
+        A = np.array([[3, 0, 1], [5, 1, 2]])
+        B = np.array([[3, 6, 0], [0, 2, 1]])
+        reduced = np.ix_([1], [1])
+        for M in best_response_matrices(A, B) + best_response_matrices(
+            A[reduced], B[reduced]
+        ):
+            cache.get(M, "reverse_search")
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(cache.invalidate_game(A, B), 4)
+        self.assertEqual(len(cache), 0)
+
+    def test_negative_maxsize(self):
+        with self.assertRaises(ValueError):
+            PolytopeCache(maxsize=-1)
+
+    def test_get_from_several_threads(self):
+        cache = PolytopeCache(maxsize=3)
+        matrices = [np.array([[3, 3], [2, 5], [0, 6]]) + i for i in range(5)]
+
+        def get_all():
+            """Get the polytope of every matrix"""
+            for M in matrices:
+                cache.get(M)
+
+        threads = [threading.Thread(target=get_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.hits + cache.misses, 20)
+
+    def test_module_cache(self):
+        self.assertIsInstance(polytope_cache, PolytopeCache)
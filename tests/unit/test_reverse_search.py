@@ -0,0 +1,117 @@
+"""
+Tests for the reverse search of the vertices of a polytope
+"""
+
+import unittest
+from types import GeneratorType
+
+import numpy as np
+from hypothesis import given, settings
+from hypothesis.extra.numpy import arrays
+from hypothesis.strategies import integers
+
+from nashpy.polytope import (
+    build_halfspaces,
+    labels,
+    non_trivial_vertices,
+    reverse_search_vertices,
+)
+from nashpy.polytope.reverse_search import Dictionary
+
+
+def sorted_vertices(vertices):
+    """Return the vertices rounded and sorted"""
+    return sorted(tuple(np.round(vertex, 10)) for vertex, _ in vertices)
+
+
+class TestReverseSearch(unittest.TestCase):
+    """
+    Tests for the reverse search vertex enumeration
+    """
+
+    def test_particular_vertices_and_labels(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        halfspaces = build_halfspaces(A)
+        vertices = reverse_search_vertices(halfspaces)
+        self.assertIsInstance(vertices, GeneratorType)
+        vertices = list(vertices)
+        self.assertEqual(
+            sorted_vertices(vertices),
+            sorted_vertices(
+                (vertex, None)
+                for vertex in (
+                    np.array([1 / 3, 0]),
+                    np.array([0, 1 / 6]),
+                    np.array([2 / 9, 1 / 9]),
+                    np.array([1 / 12, 1 / 6]),
+                )
+            ),
+        )
+        for vertex, labels_ in vertices:
+            self.assertEqual(labels_, labels(vertex, halfspaces))
+
+    @settings(deadline=None)
+    @given(
+        A=arrays(np.int8, (4, 3), elements=integers(0, 10)).filter(
+            lambda a: np.all(a.max(axis=0) > 0)
+        )
+    )
+    def test_vertices_are_those_of_qhull(self, A):
+        halfspaces = build_halfspaces(A)
+        vertices = list(reverse_search_vertices(halfspaces))
+        expected_vertices = sorted_vertices(non_trivial_vertices(halfspaces))
+        self.assertEqual(sorted_vertices(vertices), sorted(set(expected_vertices)))
+        for vertex, labels_ in vertices:
+            self.assertEqual(labels_, labels(vertex, halfspaces))
+
+    def test_vertices_of_degenerate_polytope_are_obtained_once(self):
+        """Test that a vertex on more facets than the dimension is only
+        obtained for one of its bases"""
+        A = np.array([[3, 0], [5, 2], [5, 4], [4, 1]])
+        vertices = list(reverse_search_vertices(build_halfspaces(A)))
+        self.assertEqual(len(vertices), 2)
+        self.assertTrue(np.array_equal(vertices[0][0], np.array([0.2, 0])))
+        self.assertEqual(vertices[0][1], {1, 2, 5})
+        self.assertTrue(np.array_equal(vertices[1][0], np.array([0, 0.25])))
+        self.assertEqual(vertices[1][1], {2, 4})
+
+    def test_vertices_of_unbounded_polytope(self):
+        A = np.array([[1, 0], [2, 0]])
+        vertices = list(reverse_search_vertices(build_halfspaces(A)))
+        self.assertEqual(len(vertices), 1)
+        self.assertTrue(np.array_equal(vertices[0][0], np.array([0.5, 0])))
+        self.assertEqual(vertices[0][1], {1, 3})
+
+    def test_vertices_with_large_and_float_entries(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        expected_vertices = sorted_vertices(non_trivial_vertices(build_halfspaces(A)))
+        vertices = reverse_search_vertices(build_halfspaces(A * 10**12))
+        self.assertEqual(
+            sorted_vertices((vertex * 10**12, None) for vertex, _ in vertices),
+            expected_vertices,
+        )
+        vertices = reverse_search_vertices(build_halfspaces(A / 10))
+        self.assertEqual(
+            sorted_vertices((vertex / 10, None) for vertex, _ in vertices),
+            expected_vertices,
+        )
+
+    def test_dictionary_pivots(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        dictionary = Dictionary(build_halfspaces(A))
+        self.assertEqual(dictionary.labels(), {3, 4})
+        self.assertTrue(dictionary.is_basic(0))
+        self.assertFalse(dictionary.is_basic(3))
+        self.assertIsNone(dictionary.parent_pivot())
+        self.assertEqual(dictionary.leaving_row(3), 0)
+        self.assertEqual(dictionary.reverse_pivot_row(3), 0)
+        self.assertEqual(dictionary.pivot(0, 3), 0)
+        self.assertTrue(np.array_equal(dictionary.vertex(), np.array([1 / 3, 0])))
+        self.assertEqual(dictionary.labels(), {0, 4})
+        self.assertTrue(dictionary.is_lexicographic_minimum())
+        self.assertIsNone(dictionary.reverse_pivot_row(0))
+        self.assertEqual(dictionary.parent_pivot(), 3)
+        self.assertEqual(dictionary.labels(), {3, 4})
+        self.assertIsNone(
+            Dictionary(build_halfspaces(np.array([[1, 0]]))).leaving_row(2)
+        )
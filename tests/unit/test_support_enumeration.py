@@ -3,16 +3,37 @@ Tests for the game class
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from itertools import combinations
 
 import numpy as np
 
 from nashpy.algorithms.support_enumeration import (
+    SupportPairs,
+    combinations_from,
+    batched_equilibria,
+    bordered_indifference_matrix,
+    equilibria_on_row_supports,
+    exact_equilibria,
+    incremental_equilibria,
     indifference_strategies,
+    is_conditionally_dominated,
     is_ne,
+    is_ne_batch,
     obey_support,
+    parallel_equilibria,
     potential_support_pairs,
     powerset,
+    pruned_support_pairs,
+    revolving_door,
+    solve_bordered_indifference,
+    solve_factorised_indifference,
     solve_indifference,
+    solve_indifference_batch,
+    solve_indifference_exact,
+    support_enumeration,
+    unrank_combination,
 )
 
 
@@ -163,6 +184,134 @@ class TestSupportEnumeration(unittest.TestCase):
             ],
         )
 
+    def test_potential_supports_with_row_supports(self):
+        """Test for the enumeration of potential supports restricted to given
+        row supports"""
+        A = np.array([[1, 0, 2], [-2, 3, 9]])
+        B = np.array([[3, 2, 1], [-1, 0, 2]])
+        self.assertEqual(
+            list(
+                potential_support_pairs(
+                    A, B, non_degenerate=True, row_supports=[(1,), (0, 1)]
+                )
+            ),
+            [
+                ((1,), (0,)),
+                ((1,), (1,)),
+                ((1,), (2,)),
+                ((0, 1), (0, 1)),
+                ((0, 1), (0, 2)),
+                ((0, 1), (1, 2)),
+            ],
+        )
+
+    def test_support_pairs(self):
+        """Test that the support pairs are those of the powersets and that
+        the iteration can be resumed from any position"""
+        for non_degenerate in (False, True):
+            expected_pairs = [
+                (support1, support2)
+                for support1 in powerset(3)
+                for support2 in powerset(4)
+                if len(support1) > 0
+                and len(support2) > 0
+                and (not non_degenerate or len(support1) == len(support2))
+            ]
+            pairs = SupportPairs(3, 4, non_degenerate=non_degenerate)
+            self.assertEqual(len(pairs), len(expected_pairs))
+            for position, expected_pair in enumerate(expected_pairs):
+                self.assertEqual(pairs.position, position)
+                self.assertEqual(next(pairs), expected_pair)
+            self.assertEqual(list(pairs), [])
+            for position in range(len(expected_pairs) + 1):
+                self.assertEqual(
+                    list(
+                        SupportPairs(
+                            3, 4, non_degenerate=non_degenerate, position=position
+                        )
+                    ),
+                    expected_pairs[position:],
+                )
+
+    def test_potential_supports_with_start(self):
+        A = np.array([[1, 0], [-2, 3], [2, 1]])
+        B = np.array([[3, 2], [-1, 0], [5, 2]])
+        pairs = potential_support_pairs(A, B, non_degenerate=True)
+        expected_pairs = list(pairs)
+        self.assertEqual(pairs.position, 9)
+        self.assertEqual(
+            list(potential_support_pairs(A, B, non_degenerate=True, start=5)),
+            expected_pairs[5:],
+        )
+        strategies = list(indifference_strategies(A, B, non_degenerate=True))
+        self.assertEqual(
+            [
+                (sup1, sup2)
+                for _, _, sup1, sup2 in indifference_strategies(
+                    A, B, non_degenerate=True, start=5
+                )
+            ],
+            [
+                (sup1, sup2)
+                for _, _, sup1, sup2 in strategies
+                if (sup1, sup2) in expected_pairs[5:]
+            ],
+        )
+        with self.assertRaises(ValueError):
+            potential_support_pairs(A, B, row_supports=[(0,)], start=1)
+
+    def test_is_conditionally_dominated(self):
+        """Test for conditional dominance given a set of columns"""
+        A = np.array([[3, 0, 1], [1, 2, 0], [2, 1, 2]])
+        self.assertTrue(
+            np.array_equal(
+                is_conditionally_dominated(A, [0, 1, 2], [0]), [False, True, True]
+            )
+        )
+        self.assertTrue(
+            np.array_equal(is_conditionally_dominated(A, [1, 2], [0, 2]), [True, False])
+        )
+        self.assertTrue(
+            np.array_equal(
+                is_conditionally_dominated(A, [0, 1, 2], [0, 1, 2]),
+                [False, False, False],
+            )
+        )
+
+    def test_pruned_supports(self):
+        """Test for the enumeration of potential supports discarded with
+        conditional dominance"""
+        A = np.array([[3, 0], [5, 1]])
+        B = np.array([[3, 5], [0, 1]])
+        self.assertEqual(list(pruned_support_pairs(A, B)), [((1,), (1,))])
+
+        A = np.array([[1, -1], [-1, 1]])
+        self.assertEqual(
+            list(pruned_support_pairs(A, -A)),
+            [((0, 1), (0, 1))],
+        )
+
+        A = np.array([[1, 0], [-2, 3]])
+        B = np.array([[3, 2], [-1, 0]])
+        self.assertEqual(
+            list(pruned_support_pairs(A, B)),
+            [((0,), (0,)), ((1,), (1,)), ((0, 1), (0, 1))],
+        )
+
+        A = np.array([[1, 0, 2], [-2, 3, 9]])
+        B = np.array([[3, 2, 1], [-1, 0, 2]])
+        pairs = list(pruned_support_pairs(A, B))
+        self.assertTrue(
+            set(pairs) <= set(potential_support_pairs(A, B)),
+        )
+        sizes = [(len(s1), len(s2)) for s1, s2 in pairs]
+        self.assertEqual(
+            sizes,
+            sorted(sizes, key=lambda size: (abs(size[0] - size[1]), sum(size))),
+        )
+        pairs = list(pruned_support_pairs(A, B, non_degenerate=True))
+        self.assertTrue(all(len(s1) == len(s2) for s1, s2 in pairs))
+
     def test_indifference_strategies(self):
         """Test for the indifference strategies of potential supports"""
         A = np.array([[2, 1], [0, 2]])
@@ -339,6 +488,367 @@ class TestSupportEnumeration(unittest.TestCase):
             )
         )
 
+    def test_solve_indifference_batch(self):
+        """Test solve indifference for a stack of support pairs"""
+        A = np.array([[0, 1, -1], [1, 0, 1], [-1, 1, 0]])
+        rows = np.array([[0, 1], [1, 2], [0, 2]])
+        columns = np.array([[0, 1], [0, 1], [0, 1]])
+        probabilities, non_singular = solve_indifference_batch(A, rows, columns)
+        self.assertTrue(all(non_singular))
+        self.assertTrue(
+            np.allclose(
+                probabilities,
+                np.array([[0.5, 0.5, 0.0], [1 / 3, 2 / 3, 0.0], [0.0, 1.0, 0.0]]),
+            )
+        )
+
+        rows = np.array([[0, 1, 2]])
+        columns = np.array([[0, 1, 2]])
+        probabilities, non_singular = solve_indifference_batch(A, rows, columns)
+        self.assertTrue(all(non_singular))
+        self.assertTrue(np.allclose(probabilities, np.array([[0.2, 0.6, 0.2]])))
+
+    def test_solve_indifference_batch_with_singular_systems(self):
+        """Test solve indifference for a stack including singular systems"""
+        A = np.array([[1, 1, 0], [1, 1, 3]])
+        rows = np.array([[0, 1], [0, 1]])
+        columns = np.array([[0, 1], [0, 2]])
+        probabilities, non_singular = solve_indifference_batch(A, rows, columns)
+        self.assertTrue(np.array_equal(non_singular, [False, True]))
+        self.assertTrue(np.allclose(probabilities[1], np.array([1, 0, 0])))
+
+    def test_is_ne_batch(self):
+        """Test if is ne for a stack of strategy pairs"""
+        A = np.array([[2, 1], [0, 2]])
+        B = np.array([[2, 0], [1, 2]])
+        row_strategies = np.array([[1, 0], [1 / 3, 2 / 3], [0, 1], [1, 0]])
+        column_strategies = np.array([[1, 0], [1 / 3, 2 / 3], [1, 0], [0, 1]])
+        row_supports = np.array([[1, 0], [1, 1], [0, 1], [1, 0]], dtype=bool)
+        column_supports = np.array([[1, 0], [1, 1], [1, 0], [0, 1]], dtype=bool)
+        self.assertTrue(
+            np.array_equal(
+                is_ne_batch(
+                    (row_strategies, column_strategies),
+                    (row_supports, column_supports),
+                    (A, B),
+                ),
+                [True, True, False, False],
+            )
+        )
+
+    def test_batched_equilibria(self):
+        """Test the equilibria obtained when solving all supports at once"""
+        A = np.array([[2, 1], [0, 2]])
+        B = np.array([[2, 0], [1, 2]])
+        expected_equilibria = [
+            (np.array([1, 0]), np.array([1, 0]), (0,), (0,)),
+            (np.array([0, 1]), np.array([0, 1]), (1,), (1,)),
+            (np.array([1 / 3, 2 / 3]), np.array([1 / 3, 2 / 3]), (0, 1), (0, 1)),
+        ]
+        for batch_size in (1, 2, 2**14):
+            obtained_equilibria = list(batched_equilibria(A, B, batch_size=batch_size))
+            self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+            for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+                self.assertTrue(np.allclose(obtained[0], expected[0]))
+                self.assertTrue(np.allclose(obtained[1], expected[1]))
+                self.assertEqual(obtained[2:], expected[2:])
+
+    def test_batched_support_enumeration_matches_serial_support_enumeration(self):
+        """Test that the batched engine gives the same equilibria in the same
+        order"""
+        A = np.array([[160, 205, 44], [175, 180, 45], [201, 204, 50], [120, 207, 49]])
+        B = np.array([[2, 2, 2], [1, 0, 0], [3, 4, 1], [4, 1, 2]])
+        serial = list(support_enumeration(A, B))
+        batched = list(support_enumeration(A, B, batched=True))
+        self.assertEqual(len(serial), len(batched))
+        for obtained, expected in zip(batched, serial):
+            for s1, s2 in zip(obtained, expected):
+                self.assertTrue(np.allclose(s1, s2))
+
+    def test_batched_support_enumeration_with_non_degenerate(self):
+        """Test the batched engine with the non degenerate flag"""
+        A = np.array([[1, 0], [-2, 3]])
+        B = np.array([[3, 2], [-1, 0]])
+        expected_equilibria = [
+            (np.array([1, 0]), np.array([1, 0])),
+            (np.array([0, 1]), np.array([0, 1])),
+            (np.array([1 / 2, 1 / 2]), np.array([1 / 2, 1 / 2])),
+        ]
+        obtained_equilibria = list(
+            support_enumeration(A, B, non_degenerate=True, batched=True)
+        )
+        self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+        for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+            for s1, s2 in zip(obtained, expected):
+                self.assertTrue(np.allclose(s1, s2))
+
+    def test_equilibria_on_row_supports(self):
+        """Test the equilibria obtained for a given chunk of row supports"""
+        A = np.array([[2, 1], [0, 2]])
+        B = np.array([[2, 0], [1, 2]])
+        equilibria = equilibria_on_row_supports([(1,), (0, 1)], A, B)
+        self.assertEqual(len(equilibria), 2)
+        self.assertTrue(np.allclose(equilibria[0][0], np.array([0, 1])))
+        self.assertTrue(np.allclose(equilibria[1][1], np.array([1 / 3, 2 / 3])))
+        self.assertEqual(equilibria_on_row_supports([], A, B), [])
+
+    def test_parallel_support_enumeration_matches_serial_support_enumeration(self):
+        """Test that the parallel evaluation gives the same equilibria in the
+        same order"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        serial = list(support_enumeration(A, B))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for parallel in (
+                list(support_enumeration(A, B, processes=2)),
+                list(support_enumeration(A, B, executor=executor)),
+                list(parallel_equilibria(A, B, processes=1)),
+            ):
+                self.assertEqual(len(serial), len(parallel))
+                for obtained, expected in zip(parallel, serial):
+                    for s1, s2 in zip(obtained, expected):
+                        self.assertTrue(np.array_equal(s1, s2))
+
+    def test_parallel_support_enumeration_can_be_stopped_early(self):
+        """Test that closing the generator releases the pool"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        equilibria = support_enumeration(A, B, processes=2)
+        first = next(equilibria)
+        equilibria.close()
+        self.assertTrue(np.array_equal(first[0], np.array([1, 0, 0])))
+
+    def test_batched_and_parallel_support_enumeration_raises_error(self):
+        """Test that the batched engine can not be combined with parallel
+        evaluation"""
+        A = np.array([[2, 1], [0, 2]])
+        with self.assertRaises(ValueError):
+            list(support_enumeration(A, -A, batched=True, processes=2))
+
+    def test_support_enumeration_with_eliminate_dominated(self):
+        """Test that equilibria are mapped back to the original strategies
+        once dominated strategies are removed"""
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+        expected_equilibria = [
+            (np.array([1, 0, 0]), np.array([1, 0, 0])),
+            (np.array([0, 1, 0]), np.array([0, 1, 0])),
+            (np.array([1 / 2, 1 / 2, 0]), np.array([1 / 2, 1 / 2, 0])),
+        ]
+        for batched in (False, True):
+            obtained_equilibria = list(
+                support_enumeration(A, B, eliminate_dominated=True, batched=batched)
+            )
+            self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+            for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+                for s1, s2 in zip(obtained, expected):
+                    self.assertTrue(np.allclose(s1, s2))
+
+    def test_pruned_support_enumeration(self):
+        """Test that pruning the supports gives the same equilibria"""
+        A = np.array([[160, 205, 44], [175, 180, 45], [201, 204, 50], [120, 207, 49]])
+        B = np.array([[2, 2, 2], [1, 0, 0], [3, 4, 1], [4, 1, 2]])
+        expected_equilibria = [
+            (np.array([0, 0, 3 / 4, 1 / 4]), np.array([1 / 28, 27 / 28, 0]))
+        ]
+        obtained_equilibria = list(support_enumeration(A, B, prune=True))
+        self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+        for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+            for s1, s2 in zip(obtained, expected):
+                self.assertTrue(np.allclose(s1, s2))
+
+        A = np.array([[1, 0], [-2, 3]])
+        B = np.array([[3, 2], [-1, 0]])
+        expected_equilibria = [
+            (np.array([1, 0]), np.array([1, 0])),
+            (np.array([0, 1]), np.array([0, 1])),
+            (np.array([1 / 2, 1 / 2]), np.array([1 / 2, 1 / 2])),
+        ]
+        obtained_equilibria = list(
+            indifference_strategies(A, B, non_degenerate=True, prune=True)
+        )
+        self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+        for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+            for s1, s2 in zip(obtained, expected):
+                self.assertTrue(np.allclose(s1, s2))
+
+    def test_pruned_and_batched_support_enumeration_raises_error(self):
+        """Test that the pruned enumeration can not be combined with the
+        batched engine"""
+        A = np.array([[2, 1], [0, 2]])
+        with self.assertRaises(ValueError):
+            list(support_enumeration(A, -A, batched=True, prune=True))
+
+    def test_bordered_indifference_matrix(self):
+        """Test the matrix of the bordered indifference equations"""
+        A = np.array([[2, 1], [0, 2]])
+        self.assertTrue(
+            np.array_equal(
+                bordered_indifference_matrix(A),
+                np.array([[2, 1, -1], [0, 2, -1], [1, 1, 0]]),
+            )
+        )
+
+    def test_solve_factorised_indifference(self):
+        """Test solving the bordered indifference equations from a QR
+        factorisation"""
+        A = np.array([[2, 1], [0, 2]])
+        Q, R = np.linalg.qr(bordered_indifference_matrix(A))
+        self.assertTrue(
+            np.allclose(solve_factorised_indifference(Q, R), np.array([1 / 3, 2 / 3]))
+        )
+
+        A = np.array([[1, 1], [1, 1]])
+        Q, R = np.linalg.qr(bordered_indifference_matrix(A))
+        self.assertFalse(solve_factorised_indifference(Q, R))
+
+    def test_solve_bordered_indifference(self):
+        A = np.array([[2, 1], [0, 2]])
+        self.assertTrue(
+            np.allclose(solve_bordered_indifference(A), np.array([1 / 3, 2 / 3]))
+        )
+        self.assertFalse(solve_bordered_indifference(np.array([[1, 1], [1, 1]])))
+        self.assertFalse(solve_bordered_indifference(np.array([[2, 0], [0, -1]])))
+
+    def test_solve_bordered_indifference_with_relative_tolerance(self):
+        """Test that a probability that is not larger than the rounding error
+        relative to the largest probability is taken to be zero"""
+        A = np.array([[10**-16, 0], [0, 1]])
+        self.assertFalse(solve_bordered_indifference(A, tol=10**-17))
+        A = np.array([[10**-8, 0], [0, 1]])
+        self.assertTrue(
+            np.allclose(
+                solve_bordered_indifference(A, tol=10**-17), np.array([1, 10**-8])
+            )
+        )
+
+    def test_incremental_equilibria(self):
+        """Test the equilibria obtained when updating the factorisations of
+        the indifference equations"""
+        A = np.array([[2, 1], [0, 2]])
+        B = np.array([[2, 0], [1, 2]])
+        expected_equilibria = [
+            (np.array([1, 0]), np.array([1, 0]), (0,), (0,)),
+            (np.array([0, 1]), np.array([0, 1]), (1,), (1,)),
+            (np.array([1 / 3, 2 / 3]), np.array([1 / 3, 2 / 3]), (0, 1), (0, 1)),
+        ]
+        for refactor_every in (0, 1, 32):
+            obtained_equilibria = list(
+                incremental_equilibria(A, B, refactor_every=refactor_every)
+            )
+            self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+            for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+                self.assertTrue(np.allclose(obtained[0], expected[0]))
+                self.assertTrue(np.allclose(obtained[1], expected[1]))
+                self.assertEqual(obtained[2:], expected[2:])
+
+    def test_incremental_equilibria_are_not_spurious(self):
+        """Test that the numerical error of the updated factorisations does
+        not give a probability of the order of the machine precision that is
+        taken to be positive"""
+        A = np.random.default_rng(3).integers(-3, 3, (5, 5))
+        B = np.random.default_rng(4).integers(-3, 3, (5, 5))
+        expected_supports = {
+            (tuple(np.flatnonzero(s1)), tuple(np.flatnonzero(s2)))
+            for s1, s2 in support_enumeration(A, B, exact=True)
+        }
+        obtained_supports = {
+            (support1, support2)
+            for _, _, support1, support2 in incremental_equilibria(A, B)
+        }
+        self.assertEqual(obtained_supports, expected_supports)
+
+    def test_incremental_support_enumeration_matches_batched_support_enumeration(
+        self,
+    ):
+        """Test that updating the factorisations gives the same equilibria as
+        solving the indifference equations"""
+        A = np.array(
+            [
+                [0.64, 0.13, 0.91, 0.27, 0.58],
+                [0.33, 0.72, 0.05, 0.86, 0.41],
+                [0.97, 0.21, 0.49, 0.12, 0.76],
+                [0.08, 0.55, 0.68, 0.39, 0.94],
+                [0.46, 0.89, 0.17, 0.63, 0.02],
+            ]
+        )
+        B = np.array(
+            [
+                [0.22, 0.81, 0.36, 0.53, 0.07],
+                [0.74, 0.04, 0.62, 0.19, 0.88],
+                [0.15, 0.67, 0.93, 0.44, 0.31],
+                [0.59, 0.28, 0.11, 0.85, 0.47],
+                [0.92, 0.35, 0.51, 0.06, 0.73],
+            ]
+        )
+        expected_equilibria = sorted(
+            support_enumeration(A, B, batched=True),
+            key=lambda eq: list(np.round(eq[0], 8)),
+        )
+        obtained_equilibria = sorted(
+            support_enumeration(A, B, incremental=True),
+            key=lambda eq: list(np.round(eq[0], 8)),
+        )
+        self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+        for obtained, expected in zip(obtained_equilibria, expected_equilibria):
+            for s1, s2 in zip(obtained, expected):
+                self.assertTrue(np.allclose(s1, s2))
+
+    def test_solve_indifference_exact(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        self.assertEqual(
+            list(solve_indifference_exact(A, (1, 2), (0, 1))),
+            [Fraction(1, 3), Fraction(2, 3)],
+        )
+        self.assertEqual(
+            list(solve_indifference_exact(A, (0,), (1,))), [Fraction(0), Fraction(1)]
+        )
+        self.assertFalse(solve_indifference_exact(A, (0, 1), (0,)))
+        self.assertFalse(
+            solve_indifference_exact(np.array([[1, 0], [0, -1]]), (0, 1), (0, 1))
+        )
+        self.assertFalse(solve_indifference_exact(np.ones((2, 2)), (0, 1), (0, 1)))
+
+    def test_exact_equilibria(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        expected_equilibria = [
+            ([1, 0, 0], [1, 0]),
+            ([Fraction(4, 5), Fraction(1, 5), 0], [Fraction(2, 3), Fraction(1, 3)]),
+            ([0, Fraction(1, 3), Fraction(2, 3)], [Fraction(1, 3), Fraction(2, 3)]),
+        ]
+        for prune in (False, True):
+            obtained_equilibria = sorted(
+                exact_equilibria(A, B, prune=prune), key=lambda eq: list(eq[0])
+            )
+            self.assertEqual(len(obtained_equilibria), len(expected_equilibria))
+            for obtained, expected in zip(
+                obtained_equilibria, sorted(expected_equilibria)
+            ):
+                for s, expected_s in zip(obtained, expected):
+                    self.assertEqual(s.dtype, object)
+                    self.assertEqual(list(s), expected_s)
+
+    def test_exact_support_enumeration_with_rational_payoffs(self):
+        """Test that exact support enumeration gives the exact equilibrium of
+        a game with rational payoffs"""
+        A = np.array(
+            [[Fraction(1, 10), Fraction(2, 10)], [Fraction(3, 10), 0]], dtype=object
+        )
+        B = np.array([[Fraction(3, 10), 0], [0, Fraction(1, 10)]], dtype=object)
+        obtained_equilibria = list(support_enumeration(A, B, exact=True))
+        self.assertEqual(len(obtained_equilibria), 1)
+        self.assertEqual(
+            [list(s) for s in obtained_equilibria[0]],
+            [[Fraction(1, 4), Fraction(3, 4)], [Fraction(1, 2), Fraction(1, 2)]],
+        )
+
+    def test_exact_and_batched_support_enumeration_raises_error(self):
+        A = np.array([[1, -1], [-1, 1]])
+        for kwargs in ({"batched": True}, {"processes": 2}, {"incremental": True}):
+            with self.assertRaises(ValueError):
+                list(support_enumeration(A, -A, exact=True, **kwargs))
+
 
 class TestUtils(unittest.TestCase):
     def test_powerset(self):
@@ -351,3 +861,33 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(
             powerset_, [(), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2)]
         )
+
+    def test_revolving_door(self):
+        self.assertEqual(
+            list(revolving_door(4, 2)),
+            [(0, 1), (1, 2), (0, 2), (2, 3), (1, 3), (0, 3)],
+        )
+        self.assertEqual(list(revolving_door(3, 0)), [()])
+        self.assertEqual(list(revolving_door(3, 3)), [(0, 1, 2)])
+        for n in range(1, 7):
+            for k in range(n + 1):
+                subsets = list(revolving_door(n, k))
+                self.assertEqual(sorted(subsets), list(combinations(range(n), k)))
+                for subset, next_subset in zip(subsets, subsets[1:]):
+                    self.assertEqual(len(set(subset) ^ set(next_subset)), 2)
+
+    def test_unrank_combination(self):
+        for n in range(1, 6):
+            for k in range(1, n + 1):
+                for rank, combination in enumerate(combinations(range(n), k)):
+                    self.assertEqual(unrank_combination(n, k, rank), list(combination))
+
+    def test_combinations_from(self):
+        for n in range(1, 6):
+            for k in range(1, n + 1):
+                expected_combinations = list(combinations(range(n), k))
+                for rank in range(len(expected_combinations)):
+                    self.assertEqual(
+                        list(combinations_from(n, k, rank)),
+                        expected_combinations[rank:],
+                    )
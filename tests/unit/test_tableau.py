@@ -5,10 +5,29 @@ Tests for the integer pivoting
 import unittest
 
 import numpy as np
+import scipy.sparse
 from hypothesis import given
 from hypothesis.extra.numpy import arrays
 
-from nashpy.linalg import Tableau, TableauLex, create_row_tableau, create_col_tableau
+from nashpy.linalg import (
+    SparseTableau,
+    SparseTableauLex,
+    Tableau,
+    TableauLex,
+    create_col_tableau,
+    create_row_tableau,
+)
+
+
+def rows_are_multiples(tableau, other_tableau):
+    """Check that each row of a tableau is a multiple of the same row of
+    another tableau with the same zeros"""
+    rows = np.arange(len(tableau))
+    columns = np.argmax(tableau != 0, axis=1)
+    scale = other_tableau[rows, columns] / tableau[rows, columns]
+    return np.allclose(tableau * scale[:, np.newaxis], other_tableau) and bool(
+        np.all((tableau == 0) == (other_tableau == 0))
+    )
 
 
 class TestTableau(unittest.TestCase):
@@ -146,7 +165,7 @@ class TestTableau(unittest.TestCase):
     def test_fail_fast_on_no_dropped_label(self):
         tableau = Tableau(np.array([[3.0]]))
         with self.assertRaises(ValueError):
-            tableau._find_dropped(0, set())
+            tableau._find_dropped(0)
 
     def test_particular_tableau_to_strategy(self):
         t_arr = np.array(
@@ -229,7 +248,7 @@ class TestTableau(unittest.TestCase):
         )
         for row_index, entering_variable in [(0, 3), (1, 4), (2, 5)]:
             self.assertEqual(
-                tableau._find_dropped(row_index, tableau.slack_variables),
+                tableau._find_dropped(row_index),
                 entering_variable,
             )
 
@@ -244,7 +263,7 @@ class TestTableau(unittest.TestCase):
         )
         for row_index, entering_variable in [(0, 0), (1, 4), (2, 5)]:
             self.assertEqual(
-                tableau._find_dropped(row_index, tableau.labels - {1, 2, 3}),
+                tableau._find_dropped(row_index),
                 entering_variable,
             )
 
@@ -259,7 +278,7 @@ class TestTableau(unittest.TestCase):
             ),
             original_basic_labels=[0, 1, 2],
         )
-        tableau._non_basic_variables = set([1, 2, 3])
+        self.assertEqual(tableau.non_basic_variables, set([1, 2, 3]))
         self.assertEqual(
             tableau.pivot_and_drop_label(1),
             5,
@@ -301,14 +320,308 @@ class TestTableau(unittest.TestCase):
             msg="{} != {}".format(tableau._tableau, next_tableau),
         )
 
-    def test_lex_row_sort(self):
-        tableau = TableauLex(np.random.rand(3, 3))
-        arr = np.array(
+    def test_lexicographic_argmax(self):
+        """Test that tied rows are broken by the lexicographically largest
+        ratios of the slack columns to the pivot column"""
+        tableau = np.array(
             [
-                [-np.inf, -np.inf, -np.inf],
-                [np.inf, 3, 1],
-                [np.inf, 2, 2],
+                [1.0, 0.0, 1.0, 0.0, 1.0],
+                [1.0, 0.0, 1.0, 1.0, 1.0],
+                [2.0, 0.0, 0.0, 4.0, 2.0],
+                [1.0, -1.0, 0.0, 0.0, 1.0],
             ]
         )
-        order = tableau._row_sort_asc(arr)
-        self.assertEqual(order.tolist(), [0, 2, 1])
+        for t in (
+            TableauLex(tableau, original_basic_labels={0}),
+            SparseTableauLex(tableau, original_basic_labels={0}),
+        ):
+            self.assertEqual(t._slack_variables.tolist(), [1, 2, 3])
+            self.assertEqual(t._lexicographic_argmax(np.arange(4), tableau[:, 0]), 1)
+            self.assertEqual(
+                t._lexicographic_argmax(np.array([0, 2, 3]), tableau[:, 0]), 0
+            )
+            self.assertEqual(t._lexicographic_argmax(np.array([2]), tableau[:, 0]), 2)
+            self.assertEqual(t._find_pivot_row(0), 1)
+        t = TableauLex(np.vstack((tableau[:2], tableau[:2])), {0})
+        self.assertEqual(t._lexicographic_argmax(np.arange(4), tableau[:, 0]), 3)
+
+    def test_exact_tableau_pivots_divide_by_previous_pivot(self):
+        """Test that the entries of an exact tableau are those of the
+        integer pivoting divided by the previous pivot"""
+        M = np.array([[3, 3], [2, 5], [0, 6]])
+        t = create_col_tableau(M, False, exact=True)
+        self.assertEqual(t._tableau.dtype, np.int64)
+        self.assertEqual(t.pivot_and_drop_label(3), 0)
+        expected_tableau = np.array(
+            [[1, 0, 0, 4, 4, 1], [-3, 4, 0, 0, 12, 1], [-1, 0, 4, 0, 24, 3]]
+        )
+        self.assertTrue(np.array_equal(t._tableau, expected_tableau))
+        self.assertEqual(t.pivot_and_drop_label(4), 1)
+        expected_tableau = np.array(
+            [[6, -4, 0, 12, 0, 2], [-3, 4, 0, 0, 12, 1], [15, -24, 12, 0, 0, 3]]
+        )
+        self.assertTrue(np.array_equal(t._tableau, expected_tableau))
+
+    def test_basis_is_updated_by_pivots(self):
+        """Test that the basis of each row is updated by the pivots and
+        corresponds to the columns with a single non zero entry"""
+        A = np.random.default_rng(0).random((6, 5))
+        for t in (create_col_tableau(A, False), create_row_tableau(A.T, True)):
+            for column in (1, 8, 3):
+                row = t._find_pivot_row(column)
+                basic_variable = t._basis[row]
+                self.assertEqual(t.pivot_and_drop_label(column), basic_variable)
+                self.assertEqual(t._basis[row], column)
+                for row, variable in enumerate(t._basis):
+                    self.assertEqual(
+                        np.flatnonzero(t._tableau[:, variable]).tolist(), [row]
+                    )
+                self.assertEqual(t.basic_variables, set(t._basis.tolist()))
+                self.assertEqual(
+                    t.non_basic_variables, t.labels - set(t._basis.tolist())
+                )
+
+    def test_is_non_basic(self):
+        """Test that the membership test of the non basic variables agrees
+        with the set of non basic variables as the tableau is pivoted"""
+        A = np.random.default_rng(0).random((4, 3))
+        t = create_col_tableau(A, True)
+        for column in (None, 4, 1, 5):
+            if column is not None:
+                t.pivot_and_drop_label(column)
+            self.assertEqual(
+                {label for label in t.labels if t.is_non_basic(label)},
+                t.non_basic_variables,
+            )
+
+    def test_fraction_free_tableau_pivots_as_exact_tableau(self):
+        """Test that a fraction free tableau pivots as an exact tableau, also
+        once its entries are Python integers, and gives float strategies"""
+        M = np.random.default_rng(0).integers(-(2**20), 2**20, (5, 4))
+        t = create_col_tableau(M, True, fraction_free=True)
+        exact_t = create_col_tableau(M, True, exact=True)
+        self.assertEqual(t._tableau.dtype, np.int64)
+        for entering_label in range(5, 9):
+            self.assertEqual(
+                t.pivot_and_drop_label(entering_label),
+                exact_t.pivot_and_drop_label(entering_label),
+            )
+            self.assertTrue(np.array_equal(t._tableau, exact_t._tableau))
+        self.assertEqual(t._tableau.dtype, object)
+        strategy = t.to_strategy(t.labels)
+        self.assertEqual(strategy.dtype, float)
+        self.assertTrue(
+            np.allclose(strategy, exact_t.to_strategy(t.labels).astype(float))
+        )
+
+    def test_normalise_rows(self):
+        """Test that the entries within rounding error of zero are set to zero
+        and that very large and very small rows are rescaled by powers of
+        two"""
+        t = Tableau(
+            np.array(
+                [
+                    [2.0**300, 2.0**299, 1.0],
+                    [2.0**-300, 0.0, 2.0**-301],
+                    [1.0, 2.0**-50, 3.0],
+                ]
+            )
+        )
+        t._normalise_rows()
+        self.assertTrue(
+            np.array_equal(
+                t._tableau,
+                np.array([[0.5, 0.25, 0.0], [0.5, 0.0, 0.25], [1.0, 0.0, 3.0]]),
+            )
+        )
+
+    def test_pivot_to_basis(self):
+        """Test that pivoting to a basis gives the tableau obtained by
+        pivoting to it with ratio tests"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        for kwargs in ({}, {"exact": True}, {"fraction_free": True}):
+            expected = create_col_tableau(A, **kwargs)
+            for column in (4, 1):
+                expected.pivot_and_drop_label(column)
+            t = create_col_tableau(A, **kwargs)
+            self.assertTrue(t.pivot_to_basis(expected.basic_variables))
+            self.assertEqual(t.basic_variables, expected.basic_variables)
+            self.assertEqual(
+                t.to_strategy(t.non_basic_variables).tolist(),
+                expected.to_strategy(expected.non_basic_variables).tolist(),
+            )
+
+    def test_pivot_to_basis_that_is_not_feasible(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        t = create_col_tableau(A)
+        self.assertTrue(t.is_feasible())
+        self.assertFalse(t.pivot_to_basis({1, 3, 4}))
+        self.assertFalse(t.is_feasible())
+
+    def test_pivot_to_basis_that_is_not_a_basis(self):
+        t = Tableau(np.array([[1.0, 0.0, 1.0, 2.0, 1.0], [0.0, 1.0, 2.0, 4.0, 1.0]]))
+        for basic_variables in ({2}, {2, 5}, {2, 3}):
+            self.assertFalse(t.pivot_to_basis(basic_variables))
+
+    def test_pivots_and_basis_key(self):
+        """Test that the pivots are counted and that the basis key changes
+        with the basis"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        t = create_col_tableau(A)
+        self.assertEqual(t.pivots, 0)
+        keys = {t.basis_key}
+        for column in (4, 3):
+            t.pivot_and_drop_label(column)
+            keys.add(t.basis_key)
+        self.assertEqual(t.pivots, 2)
+        self.assertEqual(len(keys), 3)
+        self.assertTrue(t.pivot_to_basis({0, 1, 2}))
+        self.assertEqual(t.pivots, 4)
+        self.assertEqual(t.basis_key, create_col_tableau(A).basis_key)
+
+    def test_sparse_backend(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        self.assertIsInstance(create_col_tableau(A, backend="sparse"), SparseTableau)
+        self.assertIsInstance(create_row_tableau(A, backend="sparse"), SparseTableauLex)
+        self.assertNotIsInstance(
+            create_row_tableau(A, False, backend="sparse"), SparseTableauLex
+        )
+        with self.assertRaises(ValueError):
+            create_row_tableau(A, backend="gpu")
+        for kwargs in ({"exact": True}, {"fraction_free": True}):
+            with self.assertRaises(ValueError):
+                create_col_tableau(A, backend="sparse", **kwargs)
+
+    def test_sparse_tableau_preserves_zeros(self):
+        """Test that payoff columns with a single non zero entry are not
+        taken to be basic and that the zeros of the payoffs are kept"""
+        B = scipy.sparse.csr_matrix(np.array([[2.0, 0.0], [0.0, 1.0], [1.0, 0.0]]))
+        t = create_row_tableau(B, backend="sparse")
+        self.assertEqual(t.non_basic_variables, {0, 1, 2})
+        self.assertEqual(t.basic_variables, {3, 4})
+        self.assertEqual(t._tableau.nnz, 7)
+        t = create_col_tableau(np.array([[0.0, 1.0], [-1.0, 2.0]]), backend="sparse")
+        self.assertEqual(t.non_basic_variables, {2, 3})
+        self.assertEqual(t._tableau.nnz, 8)
+
+    def test_sparse_tableau_accessors(self):
+        """Test that the entries of a sparse tableau are those of the dense
+        tableau"""
+        A = np.array([[3, 3], [2, 5], [1, 6]])
+        sparse = create_col_tableau(A, backend="sparse")
+        sparse.pivot_and_drop_label(4)
+        dense = Tableau(sparse._tableau.toarray())
+        for column in (0, 3, -1):
+            self.assertTrue(
+                np.array_equal(sparse._column(column), dense._column(column))
+            )
+        rows, columns = np.array([2, 0]), np.array([1, 3, 5])
+        self.assertTrue(
+            np.array_equal(sparse._block(rows, columns), dense._block(rows, columns))
+        )
+        self.assertTrue(np.array_equal(sparse._basic_entries(), dense._basic_entries()))
+
+    def test_sparse_tableau_pivots_as_dense_tableau(self):
+        """Test that a sparse tableau drops the same labels and gives the
+        same strategies as a dense tableau"""
+        rng = np.random.default_rng(0)
+        A = rng.random((5, 4)) + 1
+        for lexicographic in (True, False):
+            dense = create_col_tableau(A, lexicographic)
+            sparse = create_col_tableau(A, lexicographic, backend="sparse")
+            for column in (6, 2, 8, 0):
+                self.assertEqual(
+                    sparse.pivot_and_drop_label(column),
+                    dense.pivot_and_drop_label(column),
+                )
+                self.assertEqual(sparse.basic_variables, dense.basic_variables)
+            self.assertTrue(
+                np.allclose(
+                    sparse.to_strategy(sparse.non_basic_variables),
+                    dense.to_strategy(dense.non_basic_variables),
+                )
+            )
+            self.assertTrue(
+                rows_are_multiples(sparse._tableau.toarray(), dense._tableau)
+            )
+
+    def test_sparse_tableau_pivot_to_basis(self):
+        A = np.array([[3, 3], [2, 5], [1, 6]])
+        expected = create_col_tableau(A)
+        for column in (4, 1):
+            expected.pivot_and_drop_label(column)
+        t = create_col_tableau(A, backend="sparse")
+        self.assertTrue(t.pivot_to_basis(expected.basic_variables))
+        self.assertEqual(t.basic_variables, expected.basic_variables)
+        dense = create_col_tableau(A)
+        dense.pivot_to_basis(expected.basic_variables)
+        self.assertTrue(rows_are_multiples(t._tableau.toarray(), dense._tableau))
+        t = create_col_tableau(A, backend="sparse")
+        self.assertFalse(t.pivot_to_basis({1, 3, 4}))
+
+    def test_sparse_pivot_updates_entries_in_place(self):
+        """Test that a pivot which does not fill the tableau in overwrites
+        the stored entries and that one which does adds the new entries"""
+        t = SparseTableau(np.array([[1.0, 2.0, 0.0, 1.0], [1.0, 3.0, 1.0, 1.0]]))
+        data = t._tableau.data
+        t._pivot(0, 0)
+        self.assertIs(t._tableau.data, data)
+        self.assertTrue(
+            np.array_equal(
+                t._tableau.toarray(),
+                np.array([[1.0, 2.0, 0.0, 1.0], [0.0, 1.0, 1.0, 0.0]]),
+            )
+        )
+        t = SparseTableau(np.array([[1.0, 2.0, 0.0, 1.0], [1.0, 0.0, 1.0, 1.0]]))
+        data = t._tableau.data
+        t._pivot(0, 0)
+        self.assertIsNot(t._tableau.data, data)
+        self.assertTrue(
+            np.array_equal(
+                t._tableau.toarray(),
+                np.array([[1.0, 2.0, 0.0, 1.0], [0.0, -2.0, 1.0, 0.0]]),
+            )
+        )
+        self.assertEqual(t._tableau.nnz, 5)
+
+    def test_rows_are_only_normalised_after_pivots_if_requested(self):
+        """Test that the rows are rescaled after a pivot only if the tableau
+        was created with normalise"""
+        M = np.array([[1.0, 2.0**300, 0.0, 1.0], [1.0, 0.0, 1.0, 1.0]])
+        for tableau_class in (Tableau, SparseTableau):
+            for normalise, expected_row in (
+                (False, [0.0, -(2.0**300), 1.0, 0.0]),
+                (True, [0.0, -0.5, 0.0, 0.0]),
+            ):
+                t = tableau_class(M.copy(), normalise=normalise)
+                t._pivot(0, 0)
+                tableau = t._tableau
+                if tableau_class is SparseTableau:
+                    tableau = tableau.toarray()
+                self.assertTrue(np.array_equal(tableau[1], np.array(expected_row)))
+
+    def test_sparse_normalise_rows(self):
+        t = SparseTableau(
+            np.array(
+                [
+                    [2.0**300, 2.0**299, 1.0],
+                    [2.0**-300, 0.0, 2.0**-301],
+                    [1.0, 2.0**-50, 3.0],
+                ]
+            )
+        )
+        t._normalise_rows()
+        self.assertTrue(
+            np.array_equal(
+                t._tableau.toarray(),
+                np.array([[0.5, 0.25, 0.0], [0.5, 0.0, 0.25], [1.0, 0.0, 3.0]]),
+            )
+        )
+        self.assertEqual(t._tableau.nnz, 6)
+        t._normalise_rows()
+        self.assertTrue(
+            np.array_equal(
+                t._tableau.toarray(),
+                np.array([[0.5, 0.25, 0.0], [0.5, 0.0, 0.25], [1.0, 0.0, 3.0]]),
+            )
+        )
@@ -0,0 +1,80 @@
+"""
+Tests for the closed form equilibria of games in which a player has two
+strategies
+"""
+
+import numpy as np
+import pytest
+
+from nashpy.algorithms.support_enumeration import support_enumeration
+from nashpy.algorithms.two_by_n import (
+    is_degenerate,
+    small_game_equilibria,
+    two_by_n_equilibria,
+    upper_envelope,
+)
+
+
+def test_upper_envelope():
+    slopes = np.array([1, -1, 0, 0, 2])
+    intercepts = np.array([0, 1, 0.6, 0.2, -5])
+    envelope, breakpoints = upper_envelope(slopes, intercepts)
+    assert envelope == [1, 2, 0]
+    assert np.allclose(breakpoints, [0.4, 0.6])
+
+
+def test_upper_envelope_with_a_single_best_line():
+    envelope, breakpoints = upper_envelope(np.array([0, 1]), np.array([2, 0]))
+    assert envelope == [0]
+    assert breakpoints == []
+
+
+def test_is_degenerate():
+    A = np.array([[3, 0], [0, 3]])
+    B = np.array([[2, 0], [0, 2]])
+    envelope, breakpoints = upper_envelope(B[0] - B[1], B[1])
+    assert not is_degenerate(A, B, envelope, breakpoints)
+    A = np.array([[3, 0], [3, 2]])
+    assert is_degenerate(A, B, envelope, breakpoints)
+    A = np.array([[3, 0, 1], [0, 3, 0]])
+    B = np.array([[2, 0, 1], [0, 2, 1]])
+    envelope, breakpoints = upper_envelope(B[0] - B[1], B[1])
+    assert is_degenerate(A, B, envelope, breakpoints)
+    B = np.array([[2, 2], [0, 1]])
+    envelope, breakpoints = upper_envelope(B[0] - B[1], B[1])
+    assert is_degenerate(A[:, :2], B, envelope, breakpoints)
+
+
+def test_two_by_n_equilibria():
+    A = np.array([[3, 0, 1], [0, 3, 0]])
+    B = np.array([[2, 0, 1], [0, 2, 0]])
+    equilibria = two_by_n_equilibria(A, B)
+    supports = [(support1, support2) for _, _, support1, support2 in equilibria]
+    assert supports == [((1,), (1,)), ((0,), (0,)), ((0, 1), (0, 1))]
+    assert np.allclose(equilibria[-1][0], [1 / 2, 1 / 2])
+    assert np.allclose(equilibria[-1][1], [1 / 2, 1 / 2, 0])
+    assert two_by_n_equilibria(A, np.zeros((2, 3))) is None
+
+
+def test_small_game_equilibria_match_support_enumeration():
+    rng = np.random.default_rng(0)
+    for shape in ((2, 2), (2, 5), (5, 2), (2, 1), (1, 2)):
+        A = rng.random(shape)
+        B = rng.random(shape)
+        equilibria = small_game_equilibria(A, B)
+        expected_equilibria = list(support_enumeration(A, B, batched=True))
+        assert len(equilibria) == len(expected_equilibria)
+        for equilibrium, expected_equilibrium in zip(equilibria, expected_equilibria):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                assert np.allclose(strategy, expected_strategy)
+
+
+def test_small_game_equilibria_with_degenerate_game():
+    A = np.zeros((3, 2))
+    assert small_game_equilibria(A, A) is None
+
+
+def test_small_game_equilibria_with_larger_game():
+    A = np.zeros((3, 3))
+    with pytest.raises(ValueError):
+        small_game_equilibria(A, A)
@@ -6,7 +6,14 @@ import unittest
 
 import numpy as np
 
-from nashpy.algorithms.vertex_enumeration import vertex_enumeration
+from nashpy.algorithms.vertex_enumeration import (
+    labels_to_bitmask,
+    labels_to_bitmasks,
+    matching_vertices,
+    polytope_vertices,
+    vertex_enumeration,
+)
+from nashpy.polytope import polytope_cache
 
 
 class TestVertexEnumeration(unittest.TestCase):
@@ -42,3 +49,189 @@ class TestVertexEnumeration(unittest.TestCase):
         equilibrium = next(vertex_enumeration(A, B))
         for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
             assert all(np.isclose(strategy, expected_strategy)), strategy
+
+    def test_vertex_enumeration_with_eliminate_dominated(self):
+        A = np.array([[3, 0, 0], [0, 3, 0], [1, 1, -1]])
+        B = np.array([[2, 0, 1], [0, 2, -1], [0, 0, 3]])
+
+        expected_equilibria = sorted(
+            vertex_enumeration(A, B), key=lambda a: list(np.round(a[0], 4))
+        )
+        equilibria = sorted(
+            vertex_enumeration(A, B, eliminate_dominated=True),
+            key=lambda a: list(np.round(a[0], 4)),
+        )
+        self.assertEqual(len(equilibria), 3)
+        self.assertEqual(len(equilibria), len(expected_equilibria))
+        for equilibrium, expected_equilibrium in zip(equilibria, expected_equilibria):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                self.assertEqual(strategy.shape, (3,))
+                self.assertTrue(all(np.isclose(strategy, expected_strategy)))
+
+    def test_vertex_enumeration_with_reverse_search(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        expected_equilibria = sorted(
+            vertex_enumeration(A, B), key=lambda a: list(np.round(a[0], 4))
+        )
+        equilibria = sorted(
+            vertex_enumeration(A, B, vertex_method="reverse_search"),
+            key=lambda a: list(np.round(a[0], 4)),
+        )
+        self.assertEqual(len(equilibria), len(expected_equilibria))
+        for equilibrium, expected_equilibrium in zip(equilibria, expected_equilibria):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                self.assertTrue(all(np.isclose(strategy, expected_strategy)))
+
+        equilibria = vertex_enumeration(
+            A, B, eliminate_dominated=True, vertex_method="reverse_search"
+        )
+        self.assertEqual(len(list(equilibria)), 3)
+
+    def test_vertex_enumeration_with_reverse_search_on_degenerate_game(self):
+        """Test that the strategies are exact"""
+        A = np.array([[0, -1, 1], [-1, 0, 1], [-1, 0, 1]])
+        equilibria = list(vertex_enumeration(A, -A, vertex_method="reverse_search"))
+        self.assertEqual(len(equilibria), 2)
+        for equilibrium, expected_equilibrium in zip(
+            equilibria,
+            (
+                (np.array([0.5, 0.5, 0]), np.array([0.5, 0.5, 0])),
+                (np.array([0.5, 0, 0.5]), np.array([0.5, 0.5, 0])),
+            ),
+        ):
+            for strategy, expected_strategy in zip(equilibrium, expected_equilibrium):
+                self.assertTrue(np.array_equal(strategy, expected_strategy))
+
+    def test_vertex_enumeration_with_unknown_vertex_method(self):
+        A = np.array([[1, -1], [-1, 1]])
+        with self.assertRaises(ValueError):
+            next(vertex_enumeration(A, -A, vertex_method="cdd"))
+
+    def test_labels_to_bitmask(self):
+        self.assertEqual(labels_to_bitmask([]), 0)
+        self.assertEqual(labels_to_bitmask({0, 3}), 0b1001)
+        self.assertEqual(labels_to_bitmask(np.array([4, 1])), 0b10010)
+
+    def test_matching_vertices(self):
+        """Test that the column vertices whose labels include the labels
+        that the row vertex does not have are found"""
+        col_bitmasks = [0b0011, 0b1100, 0b0111, 0b1100]
+        col_vertices_by_bitmask = {0b0011: [0], 0b1100: [1, 3], 0b0111: [2]}
+        degenerate_col_vertices = [2]
+        for row_bitmask, expected_matches in (
+            (0b1100, [0, 2]),
+            (0b0011, [1, 3]),
+            (0b1001, [2]),
+            (0b1101, [0, 2]),
+            (0b1011, [1, 2, 3]),
+        ):
+            self.assertEqual(
+                matching_vertices(
+                    row_bitmask,
+                    col_bitmasks,
+                    col_vertices_by_bitmask,
+                    degenerate_col_vertices,
+                    2,
+                    0b1111,
+                ),
+                expected_matches,
+            )
+
+    def test_vertex_enumeration_on_degenerate_game(self):
+        """Test that the equilibria at vertices with more labels than the
+        dimension are obtained"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 3], [2, 6], [3, 1]])
+        for vertex_method in ("qhull", "reverse_search"):
+            equilibria = sorted(
+                vertex_enumeration(A, B, vertex_method=vertex_method),
+                key=lambda a: (list(np.round(a[0], 4)), list(np.round(a[1], 4))),
+            )
+            self.assertEqual(len(equilibria), 3)
+            for (s1, s2), (expected_s1, expected_s2) in zip(
+                equilibria,
+                (
+                    (np.array([0, 1 / 3, 2 / 3]), np.array([1 / 3, 2 / 3])),
+                    (np.array([1, 0, 0]), np.array([2 / 3, 1 / 3])),
+                    (np.array([1, 0, 0]), np.array([1, 0])),
+                ),
+            ):
+                self.assertTrue(np.allclose(s1, expected_s1))
+                self.assertTrue(np.allclose(s2, expected_s2))
+
+    def test_vertex_enumeration_order(self):
+        """Test that the order of the equilibria obtained with the interior
+        point of `find_interior_point` does not change"""
+        rng = np.random.default_rng(28)
+        A = rng.random((4, 4))
+        B = rng.random((4, 4))
+        equilibria = list(vertex_enumeration(A, B))
+        self.assertEqual(
+            [
+                (np.flatnonzero(s1).tolist(), np.flatnonzero(s2).tolist())
+                for s1, s2 in equilibria
+            ],
+            [([0, 3], [1, 2]), ([1], [3]), ([1, 2], [1, 3])],
+        )
+        for strategy in (
+            strategy for equilibrium in equilibria for strategy in equilibrium
+        ):
+            self.assertFalse(np.any(np.signbit(strategy)))
+
+    def test_vertex_enumeration_with_cache(self):
+        """Test that the polytopes are only built once and give the same
+        equilibria"""
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        B = np.array([[3, 2], [2, 6], [3, 1]])
+        polytope_cache.invalidate_game(A, B)
+        for vertex_method in ("qhull", "reverse_search"):
+            expected_equilibria = list(
+                vertex_enumeration(A, B, vertex_method=vertex_method)
+            )
+            misses = polytope_cache.misses
+            for _ in range(2):
+                equilibria = list(
+                    vertex_enumeration(
+                        A, B, vertex_method=vertex_method, use_cache=True
+                    )
+                )
+                self.assertEqual(len(equilibria), len(expected_equilibria))
+                for equilibrium, expected_equilibrium in zip(
+                    equilibria, expected_equilibria
+                ):
+                    for strategy, expected_strategy in zip(
+                        equilibrium, expected_equilibrium
+                    ):
+                        self.assertTrue(np.allclose(strategy, expected_strategy))
+            self.assertEqual(polytope_cache.misses, misses + 2)
+        equilibria = list(
+            vertex_enumeration(A, B, eliminate_dominated=True, use_cache=True)
+        )
+        self.assertEqual(len(equilibria), len(expected_equilibria))
+
+    def test_polytope_vertices(self):
+        A = np.array([[3, 3], [2, 5], [0, 6]])
+        expected_bitmasks = [0b00011, 0b00110, 0b01100, 0b10001]
+        for vertex_method in ("qhull", "reverse_search"):
+            for use_cache in (False, True):
+                vertices = list(polytope_vertices(A, vertex_method, use_cache))
+                self.assertEqual(
+                    sorted(bitmask for _, bitmask in vertices), expected_bitmasks
+                )
+                for vertex, bitmask in vertices:
+                    self.assertEqual(vertex.shape, (2,))
+                    self.assertIsInstance(bitmask, int)
+                with self.assertRaises(ValueError):
+                    polytope_vertices(A, "cdd", use_cache)
+
+    def test_labels_to_bitmasks(self):
+        labels = np.array([[True, False, True], [False, False, False]])
+        self.assertEqual(labels_to_bitmasks(labels), [0b101, 0])
+        self.assertEqual(labels_to_bitmasks(np.zeros((0, 3), dtype=bool)), [])
+        labels = np.zeros((2, 70), dtype=bool)
+        labels[0, [1, 69]] = True
+        labels[1, 62] = True
+        bitmasks = labels_to_bitmasks(labels)
+        self.assertEqual(bitmasks, [labels_to_bitmask([1, 69]), 1 << 62])
+        self.assertIsInstance(bitmasks[0], int)